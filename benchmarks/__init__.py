@@ -0,0 +1 @@
+"""Offline performance benchmarks. Run with ``python -m benchmarks.<name>``."""
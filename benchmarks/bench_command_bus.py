@@ -0,0 +1,68 @@
+"""Engine command bus overhead: in-process dispatch versus the worker process pool.
+
+    python -m benchmarks.bench_command_bus --workers 2 --iterations 200
+"""
+import argparse
+import asyncio
+import os
+import pickle
+import tempfile
+import time
+from data.models.character import Character
+from data.models.combat import CombatAction, CombatState
+from services.engine.command_bus import CommandBus, InProcessCommandBus, ProcessPoolCommandBus
+from services.game.combat_service import CombatService
+
+def make_combat() -> CombatState:
+    """Build a combat with one attacking player against two generated enemies."""
+    service = CombatService(narrative_service=None)
+    player = Character(name="bench", level=5)
+    player.stats["HP"] = 10 ** 9
+    enemies = service.generate_enemies([player.level])
+    for enemy in enemies:
+        # Enough HP that the in-process run cannot end the fight mid-benchmark
+        enemy.hp = enemy.max_hp = 10 ** 9
+    return CombatState(
+        players=[player],
+        enemies=enemies,
+        actions=[CombatAction(player=player, action_type="attack", details="attack")]
+    )
+
+async def time_operation(bus: CommandBus, iterations: int, name: str, *args) -> float:
+    """Return the mean wall time in milliseconds of dispatching an operation."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await bus.dispatch(name, *args)
+    return (time.perf_counter() - started) * 1000 / iterations
+
+async def run(workers: int, iterations: int, width: int, height: int) -> None:
+    payload = list(range(256))
+    print(f"ping payload: {len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))} bytes, "
+          f"combat state: {len(pickle.dumps(make_combat(), protocol=pickle.HIGHEST_PROTOCOL))} bytes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, bus in (("in-process", InProcessCommandBus()), (f"pool x{workers}", ProcessPoolCommandBus(workers))):
+            db_path = os.path.join(tmp, f"{label.replace(' ', '_')}.db")
+            # Warm up the pool so process start-up is not counted
+            await asyncio.gather(*(bus.dispatch("engine.ping") for _ in range(workers)))
+
+            ping_ms = await time_operation(bus, iterations, "engine.ping", payload)
+            combat_ms = await time_operation(bus, iterations, "combat.resolve", make_combat())
+            world_ms = await time_operation(bus, 3, "world.generate", db_path, width, height, 1)
+            print(f"{label:>12}: ping {ping_ms:.3f} ms, combat.resolve {combat_ms:.3f} ms, "
+                  f"world.generate {width}x{height} {world_ms:.1f} ms")
+            if isinstance(bus, ProcessPoolCommandBus):
+                print(f"{'':>12}  sent {bus.bytes_sent} bytes, received {bus.bytes_received} bytes")
+            bus.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.workers, args.iterations, args.width, args.height))
+
+if __name__ == "__main__":
+    main()
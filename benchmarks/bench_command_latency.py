@@ -0,0 +1,142 @@
+"""End-to-end command latency against the fake AI backend, without an API key.
+
+    python -m benchmarks.bench_command_latency --iterations 50 --latency-ms 400
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+from core.config import Config
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.character_repository import CharacterRepository
+from data.database.repositories.world_repository import WorldRepository
+from services.ai.fake_backend import FakeBackend, LatencyModel
+from services.ai.narrative_service import NarrativeService
+from services.ai.openai_service import OpenAIService
+from services.discord.combat_commands import CombatCommands
+from services.discord.exploration_commands import ExplorationCommands
+from services.game.character_service import CharacterService
+from services.game.combat_service import CombatService
+from services.game.prefetcher import DescriptionPrefetcher
+from services.game.world_service import WorldService
+
+logger = logging.getLogger("bench_command_latency")
+
+class FakeMessage:
+    def __init__(self, ctx: "FakeContext", content: str):
+        self.ctx = ctx
+        self.content = content
+
+    async def edit(self, content: str) -> None:
+        self.ctx.mark_first_text()
+        self.content = content
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+
+    async def send(self, content: str) -> None:
+        pass
+
+class FakeContext:
+    """Minimal stand-in for commands.Context that timestamps the first visible text."""
+
+    def __init__(self, user_id: int):
+        self.author = SimpleNamespace(id=user_id, name=f"bench-{user_id}")
+        self.channel = FakeChannel(user_id)
+        self.command = None
+        self.started = time.perf_counter()
+        self.first_text = None
+
+    def mark_first_text(self) -> None:
+        if self.first_text is None:
+            self.first_text = time.perf_counter() - self.started
+
+    async def send(self, content: str) -> FakeMessage:
+        if not content.endswith("..."):
+            self.mark_first_text()
+        return FakeMessage(self, content)
+
+def summarise(name: str, samples: List[float]) -> str:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return (f"{name:<22} n={len(samples):<5} p50={statistics.median(samples) * 1000:8.1f}ms "
+            f"p95={p95 * 1000:8.1f}ms max={samples[-1] * 1000:8.1f}ms")
+
+async def run(args: argparse.Namespace) -> None:
+    workdir = tempfile.mkdtemp(prefix="bench_")
+    config = Config(discord_token="", openai_api_key="", database_path=os.path.join(workdir, "bench.db"))
+    db_manager = DatabaseManager(config.database_path)
+    db_manager.initialize_database()
+
+    backend = FakeBackend(
+        latency=LatencyModel("lognormal", args.latency_ms / 1000, 0.3, seed=1),
+        token_latency=LatencyModel("fixed", args.token_latency_ms / 1000),
+        error_rate=args.error_rate,
+        seed=1
+    )
+    narrative_service = NarrativeService(OpenAIService(config, backend=backend))
+    character_service = CharacterService(CharacterRepository(db_manager))
+    world_repository = WorldRepository(db_manager)
+    prefetcher = DescriptionPrefetcher(concurrency=args.prefetch) if args.prefetch else None
+    world_service = WorldService(world_repository, narrative_service, prefetcher=prefetcher)
+    await world_service.generate_world(seed=1)
+    combat_service = CombatService(narrative_service)
+
+    exploration = ExplorationCommands(None, world_service, character_service)
+    combat = CombatCommands(None, combat_service, character_service)
+    character_service.create_character("1", "Bencher")
+
+    totals: Dict[str, List[float]] = {}
+    first_text: Dict[str, List[float]] = {}
+
+    async def measure(name: str, command) -> None:
+        ctx = FakeContext(1)
+        try:
+            await command(ctx)
+        except Exception:
+            logger.exception(f"{name} failed")
+            name += " (error)"
+        totals.setdefault(name, []).append(time.perf_counter() - ctx.started)
+        if ctx.first_text is not None:
+            first_text.setdefault(name, []).append(ctx.first_text)
+
+    for i in range(args.iterations):
+        await measure("explore", exploration.explore)
+        await measure("move", lambda ctx: exploration.move(ctx, "south" if i % 2 == 0 else "east"))
+        if combat_service.current_combat is None or not combat_service.current_combat.is_active:
+            await combat.start_combat(FakeContext(1))
+        await measure("resolve", combat.resolve)
+        # Players pause between commands, which is when prefetches complete
+        await asyncio.sleep(args.think_ms / 1000)
+
+    print(f"Fake backend: median latency {args.latency_ms}ms, "
+          f"{args.token_latency_ms}ms/token, error rate {args.error_rate}")
+    print("Total command latency")
+    for name, samples in sorted(totals.items()):
+        print("  " + summarise(name, samples))
+    print("Time to first text")
+    for name, samples in sorted(first_text.items()):
+        print("  " + summarise(name, samples))
+    if prefetcher is not None:
+        stats = prefetcher.stats()
+        print(f"Prefetch: {stats['prefetched']} tiles warmed, {stats['prefetch_hits']}/{stats['lookups']} "
+              f"lookups served (hit rate {stats['hit_rate']:.0%}), {stats['over_budget']} skipped over budget")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=400.0)
+    parser.add_argument("--token-latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--prefetch", type=int, default=0, help="prefetch concurrency; 0 disables prefetching")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause between iterations")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Per-object memory of the world and character models, against plain dataclass equivalents.
+
+    python -m benchmarks.bench_model_memory --tiles 1000000 --characters 100000
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from data.models.character import Character
+from data.models.world import Location, Region
+
+# The models as they were before slots, for comparison
+@dataclass
+class DictLocation:
+    x: int
+    y: int
+    features: List[str] = None
+    description: Optional[str] = None
+
+@dataclass
+class DictRegion:
+    biome: str
+    locations: Dict[tuple, DictLocation]
+    has_water: bool = False
+    has_resources: bool = False
+    has_structure: bool = False
+    description: Optional[str] = None
+
+@dataclass
+class DictCharacter:
+    name: str
+    player_class: str = "Adventurer"
+    level: int = 1
+    xp: int = 0
+    location: Tuple[int, int] = (0, 0)
+    inventory: List[str] = None
+    stats: Dict[str, int] = None
+
+    def __post_init__(self):
+        if self.inventory is None:
+            self.inventory = []
+        if self.stats is None:
+            self.stats = dict(Character.BASE_STATS)
+
+def measure(count: int, build: Callable[[int], object]) -> float:
+    """Return the bytes allocated per object when building count of them."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(i) for i in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the objects is not part of their cost
+    allocated -= 8 * len(objects)
+    del objects
+    return allocated / count
+
+def report(label: str, count: int, slotted: Callable[[int], object], plain: Callable[[int], object]) -> None:
+    before = measure(count, plain)
+    after = measure(count, slotted)
+    print(f"{label:<22} {before:8.1f} -> {after:8.1f} bytes/object  "
+          f"({before * count / 2**20:8.1f} -> {after * count / 2**20:8.1f} MiB for {count})")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tiles", type=int, default=1_000_000)
+    parser.add_argument("--characters", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Shaped like load_world output: each tile's JSON features decode to a fresh list
+    report("Location", args.tiles,
+           lambda i: Location(x=i, y=i, features=[], description=None),
+           lambda i: DictLocation(x=i, y=i, features=[], description=None))
+    report("Region", args.tiles,
+           lambda i: Region(biome="Forest", locations={}, has_water=True),
+           lambda i: DictRegion(biome="Forest", locations={}, has_water=True))
+    report("Character", args.characters,
+           lambda i: Character(name="Adventurer"),
+           lambda i: DictCharacter(name="Adventurer"))
+
+if __name__ == "__main__":
+    main()
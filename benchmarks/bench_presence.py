@@ -0,0 +1,72 @@
+"""Presence index throughput with many online players, against scanning every position.
+
+    python -m benchmarks.bench_presence --players 10000 --world 1000
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, Tuple
+from services.game.presence import PresenceIndex
+
+def rate(operations: int, run: Callable[[], None]) -> float:
+    """Return operations per second."""
+    started = time.perf_counter()
+    run()
+    return operations / (time.perf_counter() - started)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--world", type=int, default=1000, help="world width and height in tiles")
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--radius", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    index = PresenceIndex()
+    positions: Dict[str, Tuple[int, int]] = {}
+    players = [str(i) for i in range(args.players)]
+
+    def place():
+        for player_id in players:
+            tile = (rng.randrange(args.world), rng.randrange(args.world))
+            positions[player_id] = tile
+            index.update(player_id, tile)
+
+    def step():
+        for _ in range(args.queries):
+            player_id = rng.choice(players)
+            x, y = positions[player_id]
+            tile = (min(args.world - 1, max(0, x + rng.choice((-1, 1)))), y)
+            positions[player_id] = tile
+            index.update(player_id, tile)
+
+    tiles = [(rng.randrange(args.world), rng.randrange(args.world)) for _ in range(args.queries)]
+    scan_tiles = tiles[:200]
+
+    def same_tile():
+        for tile in tiles:
+            index.at(tile)
+
+    def radius():
+        for tile in tiles:
+            index.within(tile, args.radius)
+
+    def region():
+        for x, y in tiles:
+            index.in_region((x // 5, y // 5), 5)
+
+    def scan_radius():
+        for x, y in scan_tiles:
+            [p for p, (px, py) in positions.items() if abs(px - x) + abs(py - y) <= args.radius]
+
+    print(f"{args.players} players on a {args.world}x{args.world} world")
+    print(f"  initial placement   {rate(args.players, place):12,.0f} updates/s")
+    print(f"  moves               {rate(args.queries, step):12,.0f} updates/s")
+    print(f"  same tile           {rate(args.queries, same_tile):12,.0f} queries/s")
+    print(f"  radius {args.radius:<3}          {rate(args.queries, radius):12,.0f} queries/s")
+    print(f"  same region         {rate(args.queries, region):12,.0f} queries/s")
+    print(f"  radius by full scan {rate(len(scan_tiles), scan_radius):12,.0f} queries/s")
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,8 @@ from .exceptions import (
     ResourceError,
     DatabaseError,
     AIServiceError,
-    ConfigurationError
+    ConfigurationError,
+    CommandBusyError
 )
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     'ResourceError',
     'DatabaseError',
     'AIServiceError',
-    'ConfigurationError'
+    'ConfigurationError',
+    'CommandBusyError'
 ]
\ No newline at end of file
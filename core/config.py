@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 import os
-from typing import Optional
+from typing import List, Optional
 import yaml
 import logging
 
@@ -17,6 +17,39 @@ class Config:
     max_players_per_combat: int = 4
     world_size: tuple = (20, 20)
     region_size: int = 5
+    response_cache_entries: int = 1024
+    response_cache_rows: int = 50000
+    ai_backend: str = "openai"
+    openai_base_url: Optional[str] = None
+    fake_ai_recordings: Optional[str] = None
+    fake_ai_latency_ms: float = 0.0
+    usage_flush_interval: float = 60.0
+    outbound_coalesce_window: float = 0.4
+    guild_command_concurrency: int = 8
+    guild_command_queue: int = 32
+    user_command_queue: int = 2
+    prefix_commands_enabled: bool = True
+    slash_commands_enabled: bool = True
+    auto_shard: bool = False
+    shard_count: Optional[int] = None
+    shard_ids: Optional[List[int]] = None
+    health_report_interval: float = 30.0
+    engine_workers: int = 0
+    # None loads the world from the database without a snapshot
+    world_snapshot_path: Optional[str] = "world.snapshot"
+    world_seed: int = 0
+    world_chunk_size: int = 0
+    world_max_chunks: int = 256
+    description_cache_tiles: int = 4096
+    prefetch_concurrency: int = 2
+    prefetch_budget_per_minute: int = 60
+    presence_cell_size: int = 8
+    presence_idle_timeout: float = 1800.0
+    map_viewport_radius: int = 7
+    quest_progress_flush_interval: float = 30.0
+    character_cache_size: int = 1024
+    character_idle_timeout: float = 1800.0
+    quest_board_refresh_interval: float = 30.0
 
     @classmethod
     def load_from_yaml(cls, path: str = "config.yaml") -> "Config":
@@ -43,5 +76,37 @@ class Config:
                 int(os.getenv("WORLD_WIDTH", "20")),
                 int(os.getenv("WORLD_HEIGHT", "20"))
             ),
-            region_size=int(os.getenv("REGION_SIZE", "5"))
+            region_size=int(os.getenv("REGION_SIZE", "5")),
+            response_cache_entries=int(os.getenv("RESPONSE_CACHE_ENTRIES", "1024")),
+            response_cache_rows=int(os.getenv("RESPONSE_CACHE_ROWS", "50000")),
+            ai_backend=os.getenv("AI_BACKEND", "openai"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL"),
+            fake_ai_recordings=os.getenv("FAKE_AI_RECORDINGS"),
+            fake_ai_latency_ms=float(os.getenv("FAKE_AI_LATENCY_MS", "0")),
+            usage_flush_interval=float(os.getenv("USAGE_FLUSH_INTERVAL", "60")),
+            outbound_coalesce_window=float(os.getenv("OUTBOUND_COALESCE_WINDOW", "0.4")),
+            guild_command_concurrency=int(os.getenv("GUILD_COMMAND_CONCURRENCY", "8")),
+            guild_command_queue=int(os.getenv("GUILD_COMMAND_QUEUE", "32")),
+            user_command_queue=int(os.getenv("USER_COMMAND_QUEUE", "2")),
+            prefix_commands_enabled=os.getenv("PREFIX_COMMANDS_ENABLED", "true").lower() == "true",
+            slash_commands_enabled=os.getenv("SLASH_COMMANDS_ENABLED", "true").lower() == "true",
+            auto_shard=os.getenv("AUTO_SHARD", "false").lower() == "true",
+            shard_count=int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None,
+            shard_ids=[int(shard_id) for shard_id in os.getenv("SHARD_IDS").split(",")] if os.getenv("SHARD_IDS") else None,
+            health_report_interval=float(os.getenv("HEALTH_REPORT_INTERVAL", "30")),
+            engine_workers=int(os.getenv("ENGINE_WORKERS", "0")),
+            world_snapshot_path=os.getenv("WORLD_SNAPSHOT_PATH", cls.world_snapshot_path),
+            world_seed=int(os.getenv("WORLD_SEED", "0")),
+            world_chunk_size=int(os.getenv("WORLD_CHUNK_SIZE", "0")),
+            world_max_chunks=int(os.getenv("WORLD_MAX_CHUNKS", "256")),
+            description_cache_tiles=int(os.getenv("DESCRIPTION_CACHE_TILES", "4096")),
+            prefetch_concurrency=int(os.getenv("PREFETCH_CONCURRENCY", "2")),
+            prefetch_budget_per_minute=int(os.getenv("PREFETCH_BUDGET_PER_MINUTE", "60")),
+            presence_cell_size=int(os.getenv("PRESENCE_CELL_SIZE", "8")),
+            presence_idle_timeout=float(os.getenv("PRESENCE_IDLE_TIMEOUT", "1800")),
+            map_viewport_radius=int(os.getenv("MAP_VIEWPORT_RADIUS", "7")),
+            quest_progress_flush_interval=float(os.getenv("QUEST_PROGRESS_FLUSH_INTERVAL", "30")),
+            character_cache_size=int(os.getenv("CHARACTER_CACHE_SIZE", "1024")),
+            character_idle_timeout=float(os.getenv("CHARACTER_IDLE_TIMEOUT", "1800")),
+            quest_board_refresh_interval=float(os.getenv("QUEST_BOARD_REFRESH_INTERVAL", "30"))
         )
\ No newline at end of file
@@ -32,4 +32,8 @@ class AIServiceError(GameError):
 
 class ConfigurationError(GameError):
     """Raised when there's a configuration error."""
-    pass
\ No newline at end of file
+    pass
+
+class CommandBusyError(GameError):
+    """Raised when a command is shed because its user or guild queue is full."""
+    pass
@@ -1,9 +1,19 @@
 from .db_manager import DatabaseManager
-from .repositories import CharacterRepository, WorldRepository, QuestRepository
+from .repositories import (
+    CharacterRepository,
+    WorldRepository,
+    QuestRepository,
+    ResponseCacheRepository,
+    UsageRepository,
+    ShardHealthRepository
+)
 
 __all__ = [
     'DatabaseManager',
     'CharacterRepository',
     'WorldRepository',
-    'QuestRepository'
+    'QuestRepository',
+    'ResponseCacheRepository',
+    'UsageRepository',
+    'ShardHealthRepository'
 ]
\ No newline at end of file
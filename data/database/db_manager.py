@@ -2,38 +2,42 @@ import sqlite3
 from contextlib import contextmanager
 from typing import Generator
 import logging
+from . import migrations
 
 logger = logging.getLogger("db_manager")
 
 class DatabaseManager:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, busy_timeout: float = 10.0):
         self.db_path = db_path
+        # Shard worker processes share the database file, so writers wait for
+        # each other's locks instead of failing immediately
+        self.busy_timeout = busy_timeout
+        self._schema_ready = False
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """Create a context-managed database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
         try:
             yield conn
         finally:
             conn.close()
 
     def initialize_database(self) -> None:
-        """Initialize all database tables."""
+        """Bring the database schema up to date."""
+        self._schema_ready = False
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        """Apply pending schema migrations, at most once per manager.
+
+        A database that is already current costs a single user_version read.
+        """
+        if self._schema_ready:
+            return
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS characters (
-                    discord_id TEXT PRIMARY KEY,
-                    name TEXT UNIQUE,
-                    class TEXT,
-                    level INTEGER,
-                    hp INTEGER,
-                    attack INTEGER,
-                    defense INTEGER,
-                    magic INTEGER,
-                    inventory TEXT,
-                    location TEXT
-                )
-            ''')
-            conn.commit()
\ No newline at end of file
+            if migrations.schema_version(conn) != migrations.SCHEMA_VERSION:
+                # WAL lets readers in other processes proceed while one process writes
+                conn.execute('PRAGMA journal_mode=WAL')
+                migrations.migrate(conn)
+        self._schema_ready = True
@@ -0,0 +1,258 @@
+import sqlite3
+from collections import Counter
+from typing import Callable, List, NamedTuple
+import logging
+
+logger = logging.getLogger("migrations")
+
+# Rows read per batch when backfilling data into new tables
+BACKFILL_BATCH_SIZE = 1000
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+def _columns(cursor: sqlite3.Cursor, table: str) -> set:
+    return {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+
+def _table_exists(cursor: sqlite3.Cursor, table: str) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+def _add_column(cursor: sqlite3.Cursor, table: str, column: str, definition: str) -> None:
+    """Add a column unless an unversioned database already has it."""
+    if column not in _columns(cursor, table):
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+def _initial_schema(cursor: sqlite3.Cursor) -> None:
+    """Tables as they were before the schema was versioned."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS characters (
+            discord_id TEXT PRIMARY KEY,
+            name TEXT UNIQUE,
+            class TEXT,
+            level INTEGER,
+            hp INTEGER,
+            attack INTEGER,
+            defense INTEGER,
+            magic INTEGER,
+            inventory TEXT,
+            location TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quests (
+            quest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            difficulty INTEGER NOT NULL,
+            theme TEXT NOT NULL,
+            location TEXT NOT NULL,
+            rewards TEXT,
+            completed_by TEXT,
+            completed_at TEXT,
+            created_at TEXT NOT NULL,
+            expires_at TEXT,
+            active BOOLEAN DEFAULT TRUE
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_quests_location ON quests(location)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS regions (
+            x INTEGER,
+            y INTEGER,
+            biome TEXT NOT NULL,
+            features TEXT,
+            description TEXT,
+            has_water BOOLEAN,
+            has_resources BOOLEAN,
+            has_structure BOOLEAN,
+            PRIMARY KEY (x, y)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS locations (
+            x INTEGER,
+            y INTEGER,
+            region_x INTEGER,
+            region_y INTEGER,
+            features TEXT,
+            description TEXT,
+            FOREIGN KEY (region_x, region_y) REFERENCES regions(x, y),
+            PRIMARY KEY (x, y)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS response_cache (
+            cache_key TEXT NOT NULL,
+            variant INTEGER NOT NULL,
+            prompt_type TEXT NOT NULL,
+            response TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (cache_key, variant)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_response_cache_created ON response_cache(created_at)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ai_usage (
+            day TEXT NOT NULL,
+            command TEXT NOT NULL,
+            guild_id TEXT NOT NULL,
+            player_id TEXT NOT NULL,
+            model TEXT NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 0,
+            cache_hits INTEGER NOT NULL DEFAULT 0,
+            prompt_tokens INTEGER NOT NULL DEFAULT 0,
+            completion_tokens INTEGER NOT NULL DEFAULT 0,
+            latency_ms REAL NOT NULL DEFAULT 0,
+            cost REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, command, guild_id, player_id, model)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS shard_health (
+            shard_id INTEGER PRIMARY KEY,
+            shard_count INTEGER NOT NULL,
+            pid INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            latency_ms REAL,
+            guilds INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        )
+    ''')
+
+def _explored_tiles(cursor: sqlite3.Cursor) -> None:
+    _add_column(cursor, 'characters', 'explored', 'BLOB')
+
+def _quest_objectives(cursor: sqlite3.Cursor) -> None:
+    _add_column(cursor, 'quests', 'objectives', 'TEXT')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quest_progress (
+            quest_id INTEGER NOT NULL,
+            discord_id TEXT NOT NULL,
+            progress TEXT NOT NULL,
+            PRIMARY KEY (quest_id, discord_id)
+        )
+    ''')
+
+def _quest_completions(cursor: sqlite3.Cursor) -> None:
+    if _table_exists(cursor, 'quest_completions'):
+        return
+    cursor.execute('''
+        CREATE TABLE quest_completions (
+            discord_id TEXT NOT NULL,
+            theme TEXT NOT NULL,
+            completions INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (discord_id, theme)
+        )
+    ''')
+    # One set-based statement rather than a pass over every completed quest
+    cursor.execute('''
+        INSERT INTO quest_completions (discord_id, theme, completions)
+        SELECT completed_by, theme, COUNT(*) FROM quests
+        WHERE completed_by IS NOT NULL
+        GROUP BY completed_by, theme
+    ''')
+
+def _inventory_tables(cursor: sqlite3.Cursor) -> None:
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS items (
+            item_id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
+        )
+    ''')
+    if _table_exists(cursor, 'character_items'):
+        return
+    cursor.execute('''
+        CREATE TABLE character_items (
+            discord_id TEXT NOT NULL,
+            item_id INTEGER NOT NULL REFERENCES items(item_id),
+            quantity INTEGER NOT NULL,
+            PRIMARY KEY (discord_id, item_id)
+        ) WITHOUT ROWID
+    ''')
+    _backfill_inventories(cursor)
+
+def _backfill_inventories(cursor: sqlite3.Cursor) -> None:
+    """Move inventories stored as comma-joined text into the inventory tables."""
+    # A separate cursor streams the characters while batches are written through this one
+    reader = cursor.connection.execute(
+        "SELECT discord_id, inventory FROM characters WHERE inventory != ''"
+    )
+    moved = 0
+    while True:
+        batch = reader.fetchmany(BACKFILL_BATCH_SIZE)
+        if not batch:
+            break
+        stacks = [
+            (discord_id, quantity, name)
+            for discord_id, inventory in batch
+            for name, quantity in Counter(inventory.split(",")).items()
+        ]
+        cursor.executemany('INSERT OR IGNORE INTO items (name) VALUES (?)', {(name,) for _, _, name in stacks})
+        cursor.executemany('''
+            INSERT INTO character_items (discord_id, item_id, quantity)
+            SELECT ?, item_id, ? FROM items WHERE name = ?
+        ''', stacks)
+        moved += len(stacks)
+    if moved:
+        logger.info(f"Moved {moved} inventory stacks into the inventory tables")
+
+def _character_xp(cursor: sqlite3.Cursor) -> None:
+    _add_column(cursor, 'characters', 'xp', 'INTEGER NOT NULL DEFAULT 0')
+
+def _character_revisions(cursor: sqlite3.Cursor) -> None:
+    _add_column(cursor, 'characters', 'revision', 'INTEGER NOT NULL DEFAULT 0')
+
+# Append new migrations here; never edit or reorder one that has shipped
+MIGRATIONS: List[Migration] = [
+    Migration(1, "initial schema", _initial_schema),
+    Migration(2, "explored tiles per character", _explored_tiles),
+    Migration(3, "quest objectives and progress", _quest_objectives),
+    Migration(4, "per-theme quest completion counters", _quest_completions),
+    Migration(5, "normalised inventories", _inventory_tables),
+    Migration(6, "character experience", _character_xp),
+    Migration(7, "character revisions", _character_revisions),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def migrate(conn: sqlite3.Connection, migrations: List[Migration] = MIGRATIONS) -> int:
+    """Apply pending migrations, each in its own transaction, and return the resulting version."""
+    version = schema_version(conn)
+    target = migrations[-1].version
+    if version == target:
+        return version
+    if version > target:
+        logger.warning(f"Database schema version {version} is newer than this build ({target})")
+        return version
+
+    # Transactions are managed explicitly so DDL and data changes commit together
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        for migration in migrations:
+            if migration.version <= version:
+                continue
+            cursor = conn.cursor()
+            # Take the write lock before re-reading the version, so processes
+            # starting together apply each migration exactly once
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                version = schema_version(conn)
+                if migration.version > version:
+                    migration.apply(cursor)
+                    cursor.execute(f'PRAGMA user_version = {migration.version:d}')
+                    version = migration.version
+                    logger.info(f"Applied schema migration {migration.version}: {migration.description}")
+                cursor.execute('COMMIT')
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+    finally:
+        conn.isolation_level = isolation_level
+    return version
@@ -1,9 +1,15 @@
 from .character_repository import CharacterRepository
 from .world_repository import WorldRepository
 from .quest_repository import QuestRepository
+from .response_cache_repository import ResponseCacheRepository
+from .usage_repository import UsageRepository
+from .shard_health_repository import ShardHealthRepository
 
 __all__ = [
     'CharacterRepository',
     'WorldRepository',
-    'QuestRepository'
+    'QuestRepository',
+    'ResponseCacheRepository',
+    'UsageRepository',
+    'ShardHealthRepository'
 ]
\ No newline at end of file
@@ -1,47 +1,250 @@
 import json
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import logging
 from ...models.character import Character
+from ...models.explored import ExploredTiles
+from ...models.inventory import Inventory
 from ..db_manager import DatabaseManager
 
 logger = logging.getLogger("character_repository")
 
+class _Cached:
+    """A loaded character with the row revision it matches and when it was last used."""
+
+    __slots__ = ("character", "revision", "used_at")
+
+    def __init__(self, character: Character, revision: int):
+        self.character = character
+        self.revision = revision
+        self.used_at = time.monotonic()
+
 class CharacterRepository:
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self,
+                 db_manager: DatabaseManager,
+                 world_size: Tuple[int, int] = (20, 20),
+                 max_cached: int = 1024,
+                 idle_timeout: float = 1800.0):
         self.db_manager = db_manager
+        self.db_manager.ensure_schema()
+        self.world_size = world_size
+        self.max_cached = max_cached
+        self.idle_timeout = idle_timeout
+        # Identity map: one live Character per player, so in-memory state and
+        # its version survive between commands. Least recently used first.
+        self._loaded: "OrderedDict[str, _Cached]" = OrderedDict()
+        # Item name -> item id; item ids never change once assigned
+        self._item_ids: Dict[str, int] = {}
+
+    # Character field -> characters column
+    COLUMNS = {
+        "name": "name",
+        "player_class": "class",
+        "level": "level",
+        "xp": "xp",
+        "location": "location",
+        "HP": "hp",
+        "Attack": "attack",
+        "Defense": "defense",
+        "Magic": "magic",
+    }
+    # Stay under SQLite's default limit of 999 bound parameters per statement
+    MAX_PARAMETERS = 999
 
     def save(self, discord_id: str, character: Character) -> None:
-        """Save a character to the database."""
+        """Save a character to the database, writing only what changed since it was last saved."""
+        self.save_many([(discord_id, character)])
+
+    def save_many(self, characters: Sequence[Tuple[str, Character]]) -> int:
+        """Save several characters in one transaction and return how many rows changed.
+
+        Changed fields are written with a single multi-row upsert covering
+        every character. Inventories write only the stacks that changed.
+        Explored tiles are left alone; they are written by save_explored.
+        A character object other than the loaded one has no change history,
+        so it is written in full.
+        """
+        rows = []
+        changed_rows = 0
+        fields: Set[str] = set()
+        for discord_id, character in characters:
+            replace = self._cached(discord_id) is not character
+            changed = character.persisted_state() if replace else character.dirty_fields()
+            if changed:
+                changed_rows += 1
+                fields.update(changed)
+            # Inventory-only changes still bump the row's revision
+            if changed or replace or character.inventory.changes():
+                rows.append((discord_id, character))
+
+        revisions: Dict[str, int] = {}
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO characters (
-                    discord_id, name, class, level, hp, attack, defense, magic, 
-                    inventory, location
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                discord_id,
-                character.name,
-                character.player_class,
-                character.level,
-                character.stats["HP"],
-                character.stats["Attack"],
-                character.stats["Defense"],
-                character.stats["Magic"],
-                ",".join(character.inventory),
-                json.dumps(character.location)
-            ))
+            if rows:
+                self._upsert(cursor, rows, [field for field in self.COLUMNS if field in fields])
+            for discord_id, character in characters:
+                self._save_inventory(
+                    cursor,
+                    discord_id,
+                    character.inventory,
+                    replace=self._cached(discord_id) is not character
+                )
+            if rows:
+                revisions = self._revisions(cursor, [discord_id for discord_id, _ in characters])
+            conn.commit()
+
+        for discord_id, character in characters:
+            character.mark_clean()
+            character.inventory.mark_saved()
+            if character.explored is None:
+                character.explored = ExploredTiles(*self.world_size)
+            character.discord_id = discord_id
+            entry = self._loaded.get(discord_id)
+            if discord_id in revisions or entry is None or entry.character is not character:
+                self._remember(discord_id, character, revisions.get(discord_id, 0))
+            else:
+                self._touch(discord_id, entry)
+        return changed_rows
+
+    def _revisions(self, cursor, discord_ids: List[str]) -> Dict[str, int]:
+        """Read the current row revision of each character."""
+        revisions = {}
+        for start in range(0, len(discord_ids), self.MAX_PARAMETERS):
+            batch = discord_ids[start:start + self.MAX_PARAMETERS]
+            cursor.execute(
+                f'SELECT discord_id, revision FROM characters WHERE discord_id IN ({", ".join("?" * len(batch))})',
+                batch
+            )
+            revisions.update(cursor.fetchall())
+        return revisions
+
+    def _cached(self, discord_id: str) -> Optional[Character]:
+        entry = self._loaded.get(discord_id)
+        return entry.character if entry is not None else None
+
+    def _touch(self, discord_id: str, entry: _Cached) -> None:
+        entry.used_at = time.monotonic()
+        self._loaded.move_to_end(discord_id)
+
+    def _remember(self, discord_id: str, character: Character, revision: int) -> None:
+        """Put a character in the identity map, evicting idle and least recently used ones."""
+        self._loaded[discord_id] = _Cached(character, revision)
+        self._loaded.move_to_end(discord_id)
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._loaded:
+            oldest_id, oldest = next(iter(self._loaded.items()))
+            if oldest_id == discord_id or (len(self._loaded) <= self.max_cached and oldest.used_at >= cutoff):
+                break
+            del self._loaded[oldest_id]
+
+    def evict(self, discord_id: str) -> None:
+        """Drop a character from the identity map; the next load reads it from the database."""
+        self._loaded.pop(discord_id, None)
+
+    def _upsert(self, cursor, rows: List[Tuple[str, Character]], fields: List[str]) -> None:
+        """Write the given fields of many characters, in as few statements as the parameter limit allows."""
+        columns = ["discord_id"] + [self.COLUMNS[field] for field in fields]
+        placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+        # Every write bumps the row revision, so other processes notice their copy is stale
+        assignments = ", ".join(
+            [f"{column} = excluded.{column}" for column in columns[1:]] + ["revision = characters.revision + 1"]
+        )
+        per_statement = self.MAX_PARAMETERS // len(columns)
+
+        for start in range(0, len(rows), per_statement):
+            batch = rows[start:start + per_statement]
+            parameters = []
+            for discord_id, character in batch:
+                state = character.persisted_state()
+                state["location"] = json.dumps(state["location"])
+                parameters.append(discord_id)
+                parameters.extend(state[field] for field in fields)
+            cursor.execute(f'''
+                INSERT INTO characters ({", ".join(columns)})
+                VALUES {", ".join([placeholders] * len(batch))}
+                ON CONFLICT(discord_id) DO UPDATE SET {assignments}
+            ''', parameters)
+
+    def _item_id(self, cursor, name: str) -> int:
+        item_id = self._item_ids.get(name)
+        if item_id is None:
+            cursor.execute('INSERT OR IGNORE INTO items (name) VALUES (?)', (name,))
+            cursor.execute('SELECT item_id FROM items WHERE name = ?', (name,))
+            item_id = self._item_ids[name] = cursor.fetchone()[0]
+        return item_id
+
+    def _save_inventory(self, cursor, discord_id: str, inventory: Inventory, replace: bool = False) -> None:
+        """Write an inventory's changed stacks, or all of it when replacing what is stored."""
+        if replace:
+            cursor.execute('DELETE FROM character_items WHERE discord_id = ?', (discord_id,))
+            changes = dict(inventory)
+        else:
+            changes = inventory.changes()
+        if not changes:
+            return
+
+        stacks = [(discord_id, self._item_id(cursor, name), quantity) for name, quantity in changes.items()]
+        cursor.executemany('''
+            INSERT INTO character_items (discord_id, item_id, quantity) VALUES (?, ?, ?)
+            ON CONFLICT (discord_id, item_id) DO UPDATE SET quantity = excluded.quantity
+        ''', [stack for stack in stacks if stack[2] > 0])
+        cursor.executemany(
+            'DELETE FROM character_items WHERE discord_id = ? AND item_id = ?',
+            [stack[:2] for stack in stacks if stack[2] <= 0]
+        )
+
+    def _load_inventory(self, cursor, discord_id: str) -> Inventory:
+        cursor.execute('''
+            SELECT items.name, character_items.quantity
+            FROM character_items JOIN items ON items.item_id = character_items.item_id
+            WHERE character_items.discord_id = ?
+        ''', (discord_id,))
+        inventory = Inventory(dict(cursor.fetchall()))
+        inventory.mark_saved()
+        return inventory
+
+    def save_explored(self, discord_id: str, explored: ExploredTiles) -> None:
+        """Write only a character's explored tiles."""
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute(
+                'UPDATE characters SET explored = ?, revision = revision + 1 WHERE discord_id = ? RETURNING revision',
+                (explored.to_bytes(), discord_id)
+            ).fetchone()
             conn.commit()
+        entry = self._loaded.get(discord_id)
+        if row is not None and entry is not None and entry.character.explored is explored:
+            entry.revision = row[0]
 
     def load(self, discord_id: str) -> Optional[Character]:
-        """Load a character from the database."""
+        """Load a character, rebuilding it from the database only if the stored row has changed.
+
+        The cached copy is checked against the row's revision, which other
+        processes sharing the database bump when they save the character.
+        """
+        entry = self._loaded.get(discord_id)
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM characters WHERE discord_id = ?', (discord_id,))
+            if entry is not None:
+                cursor.execute('SELECT revision FROM characters WHERE discord_id = ?', (discord_id,))
+                current = cursor.fetchone()
+                if current is not None and current[0] == entry.revision:
+                    self._touch(discord_id, entry)
+                    return entry.character
+                del self._loaded[discord_id]
+                if current is None:
+                    return None
+
+            cursor.execute('''
+                SELECT discord_id, name, class, level, hp, attack, defense, magic,
+                       location, explored, xp, revision
+                FROM characters WHERE discord_id = ?
+            ''', (discord_id,))
             row = cursor.fetchone()
+            inventory = self._load_inventory(cursor, discord_id) if row else None
 
         if row:
-            return Character(
+            character = Character(
                 name=row[1],
                 player_class=row[2],
                 level=row[3],
@@ -51,7 +254,23 @@ class CharacterRepository:
                     "Defense": row[6],
                     "Magic": row[7]
                 },
-                inventory=row[8].split(",") if row[8] else [],
-                location=tuple(json.loads(row[9])) if row[9] else (0, 0)
+                inventory=inventory,
+                location=tuple(json.loads(row[8])) if row[8] else (0, 0),
+                explored=(
+                    ExploredTiles.from_bytes(row[9], *self.world_size)
+                    if row[9] else ExploredTiles(*self.world_size)
+                ),
+                discord_id=discord_id,
+                xp=row[10] or 0
             )
-        return None
\ No newline at end of file
+            character.mark_clean()
+            self._remember(discord_id, character, row[11])
+            return character
+        return None
+
+    def get_rankings(self) -> List[Tuple[str, int, int]]:
+        """Get every character's level and XP, for rebuilding leaderboards."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT discord_id, level, xp FROM characters')
+            return cursor.fetchall()
@@ -1,8 +1,8 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 import json
 import logging
 from datetime import datetime
-from ...models.quest import Quest
+from ...models.quest import Quest, Objective
 from ..db_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
@@ -12,36 +12,7 @@ class QuestRepository:
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
-        self._initialize_table()
-
-    def _initialize_table(self) -> None:
-        """Create the quests table if it doesn't exist."""
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS quests (
-                    quest_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    difficulty INTEGER NOT NULL,
-                    theme TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    rewards TEXT,
-                    completed_by TEXT,
-                    completed_at TEXT,
-                    created_at TEXT NOT NULL,
-                    expires_at TEXT,
-                    active BOOLEAN DEFAULT TRUE
-                )
-            ''')
-            
-            # Create index for location lookups
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_quests_location 
-                ON quests(location)
-            ''')
-            
-            conn.commit()
+        self.db_manager.ensure_schema()
 
     def save(self, quest: Quest) -> int:
         """Save a quest to the database and return its ID."""
@@ -50,8 +21,8 @@ class QuestRepository:
             cursor.execute('''
                 INSERT INTO quests (
                     title, description, difficulty, theme, location,
-                    rewards, completed_by, completed_at, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    rewards, completed_by, completed_at, created_at, expires_at, objectives
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 quest.title,
                 quest.description,
@@ -61,7 +32,9 @@ class QuestRepository:
                 json.dumps(quest.rewards),
                 quest.completed_by,
                 quest.completed_at.isoformat() if quest.completed_at else None,
-                datetime.now().isoformat()
+                quest.created_at.isoformat(),
+                quest.expires_at.isoformat() if quest.expires_at else None,
+                json.dumps([objective.to_dict() for objective in quest.objectives])
             ))
             conn.commit()
             return cursor.lastrowid
@@ -94,6 +67,29 @@ class QuestRepository:
 
         return [self._row_to_quest(row) for row in rows]
 
+    def get_available_quests(self) -> List[Quest]:
+        """Get every quest that is active, not completed and not expired."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM quests 
+                WHERE active = TRUE AND completed_by IS NULL
+                AND (expires_at IS NULL OR expires_at > ?)
+            ''', (datetime.now().isoformat(),))
+            rows = cursor.fetchall()
+
+        return [self._row_to_quest(row) for row in rows]
+
+    def get_board_signature(self) -> Tuple[int, int]:
+        """Get (count, highest id) of open quests; it changes whenever one is added, completed or removed."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*), COALESCE(MAX(quest_id), 0) FROM quests
+                WHERE active = TRUE AND completed_by IS NULL
+            ''')
+            return cursor.fetchone()
+
     def get_active_quests_for_player(self, player_id: str) -> List[Quest]:
         """Get all active quests for a specific player."""
         with self.db_manager.get_connection() as conn:
@@ -138,6 +134,26 @@ class QuestRepository:
             ))
             conn.commit()
 
+    def complete_quest(self, quest_id: int, player_id: str, completed_at: datetime) -> bool:
+        """Record a quest's completion and count it for the player, in one transaction.
+
+        Returns False if the quest does not exist or was already completed.
+        """
+        with self.db_manager.get_connection() as conn:
+            with conn:
+                cursor = conn.execute('''
+                    UPDATE quests SET completed_by = ?, completed_at = ?
+                    WHERE quest_id = ? AND completed_by IS NULL
+                ''', (player_id, completed_at.isoformat(), quest_id))
+                if cursor.rowcount == 0:
+                    return False
+                conn.execute('''
+                    INSERT INTO quest_completions (discord_id, theme, completions)
+                    SELECT ?, theme, 1 FROM quests WHERE quest_id = ?
+                    ON CONFLICT (discord_id, theme) DO UPDATE SET completions = completions + 1
+                ''', (player_id, quest_id))
+        return True
+
     def delete_expired_quests(self) -> int:
         """Delete all expired quests and return the number of deleted quests."""
         with self.db_manager.get_connection() as conn:
@@ -167,9 +183,40 @@ class QuestRepository:
             completed_at=datetime.fromisoformat(row[8]) if row[8] else None,
             created_at=datetime.fromisoformat(row[9]),
             expires_at=datetime.fromisoformat(row[10]) if row[10] else None,
-            active=bool(row[11])
+            active=bool(row[11]),
+            objectives=[Objective.from_dict(data) for data in json.loads(row[12])] if row[12] else []
         )
 
+    def save_quest_progress(self, rows: Sequence[Tuple[int, str, List[int]]]) -> None:
+        """Save players' objective counts, as (quest_id, discord_id, counts) rows, in a single batch."""
+        with self.db_manager.get_connection() as conn:
+            conn.executemany('''
+                INSERT INTO quest_progress (quest_id, discord_id, progress) VALUES (?, ?, ?)
+                ON CONFLICT (quest_id, discord_id) DO UPDATE SET progress = excluded.progress
+            ''', [(quest_id, discord_id, json.dumps(counts)) for quest_id, discord_id, counts in rows])
+            conn.commit()
+
+    def load_quest_progress(self) -> List[Tuple[Quest, str, List[int]]]:
+        """Load saved progress on quests that are not completed yet."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT quests.*, quest_progress.discord_id, quest_progress.progress
+                FROM quest_progress
+                JOIN quests ON quests.quest_id = quest_progress.quest_id
+                WHERE quests.completed_by IS NULL AND quests.active = TRUE
+            ''')
+            rows = cursor.fetchall()
+
+        quests: Dict[int, Quest] = {}
+        progress = []
+        for row in rows:
+            quest = quests.get(row[0])
+            if quest is None:
+                quest = quests[row[0]] = self._row_to_quest(row[:13])
+            progress.append((quest, row[13], json.loads(row[14])))
+        return progress
+
     def get_quest_count_by_theme(self, theme: str) -> int:
         """Get the count of active quests for a specific theme."""
         with self.db_manager.get_connection() as conn:
@@ -185,9 +232,15 @@ class QuestRepository:
         with self.db_manager.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                SELECT theme, COUNT(*) 
-                FROM quests 
-                WHERE completed_by = ? 
-                GROUP BY theme
+                SELECT theme, completions FROM quest_completions WHERE discord_id = ?
             ''', (player_id,))
-            return dict(cursor.fetchall())
\ No newline at end of file
+            return dict(cursor.fetchall())
+
+    def get_completion_totals(self) -> List[Tuple[str, int]]:
+        """Get every player's total number of completed quests."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT discord_id, SUM(completions) FROM quest_completions GROUP BY discord_id
+            ''')
+            return cursor.fetchall()
\ No newline at end of file
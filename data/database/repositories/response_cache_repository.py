@@ -0,0 +1,65 @@
+from typing import List, Tuple
+import logging
+from ..db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+class ResponseCacheRepository:
+    """Repository for persisting cached AI responses."""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.db_manager.ensure_schema()
+
+    def get_variants(self, cache_key: str, not_before: float) -> List[Tuple[int, float, str]]:
+        """Get all unexpired (variant, created_at, response) rows stored for a key."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT variant, created_at, response FROM response_cache
+                WHERE cache_key = ? AND created_at >= ?
+                ORDER BY variant
+            ''', (cache_key, not_before))
+            return cursor.fetchall()
+
+    def save_variant(self, cache_key: str, variant: int, prompt_type: str,
+                     response: str, created_at: float) -> None:
+        """Save (or replace) one response variant for a key."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO response_cache
+                (cache_key, variant, prompt_type, response, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (cache_key, variant, prompt_type, response, created_at))
+            conn.commit()
+
+    def prune(self, max_rows: int) -> int:
+        """Delete the oldest rows beyond max_rows and return the number deleted."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                DELETE FROM response_cache WHERE rowid IN (
+                    SELECT rowid FROM response_cache
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            ''', (max_rows,))
+            deleted_count = cursor.rowcount
+            conn.commit()
+
+        if deleted_count:
+            logger.info(f"Pruned {deleted_count} cached responses")
+        return deleted_count
+
+    def delete_expired(self, prompt_type: str, before: float) -> int:
+        """Delete cached responses of a prompt type created before a timestamp."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                DELETE FROM response_cache
+                WHERE prompt_type = ? AND created_at < ?
+            ''', (prompt_type, before))
+            deleted_count = cursor.rowcount
+            conn.commit()
+        return deleted_count
@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+from ..db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+class ShardHealthRepository:
+    """Repository for per-shard health reports shared between worker processes."""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.db_manager.ensure_schema()
+
+    def save_reports(self, reports: Sequence[Tuple]) -> None:
+        """Save (shard_id, shard_count, pid, status, latency_ms, guilds, updated_at) reports."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO shard_health
+                (shard_id, shard_count, pid, status, latency_ms, guilds, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', reports)
+            conn.commit()
+
+    def get_reports(self) -> List[Dict[str, Any]]:
+        """Get the latest report for every shard."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM shard_health ORDER BY shard_id')
+            rows = cursor.fetchall()
+
+        return [
+            {
+                "shard_id": row[0],
+                "shard_count": row[1],
+                "pid": row[2],
+                "status": row[3],
+                "latency_ms": row[4],
+                "guilds": row[5],
+                "updated_at": row[6],
+            }
+            for row in rows
+        ]
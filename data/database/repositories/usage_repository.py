@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+from ..db_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+class UsageRepository:
+    """Repository for aggregated AI token usage."""
+
+    GROUP_COLUMNS = ("command", "guild_id", "player_id", "model", "day")
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self.db_manager.ensure_schema()
+
+    def add_usage(self, rows: Sequence[Tuple]) -> None:
+        """Add aggregated usage rows in a single batch.
+
+        Each row is (day, command, guild_id, player_id, model, calls, cache_hits,
+        prompt_tokens, completion_tokens, latency_ms, cost).
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT INTO ai_usage (
+                    day, command, guild_id, player_id, model, calls, cache_hits,
+                    prompt_tokens, completion_tokens, latency_ms, cost
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (day, command, guild_id, player_id, model) DO UPDATE SET
+                    calls = calls + excluded.calls,
+                    cache_hits = cache_hits + excluded.cache_hits,
+                    prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                    completion_tokens = completion_tokens + excluded.completion_tokens,
+                    latency_ms = latency_ms + excluded.latency_ms,
+                    cost = cost + excluded.cost
+            ''', rows)
+            conn.commit()
+
+    def get_usage_summary(self,
+                          group_by: str = "command",
+                          since_day: Optional[str] = None,
+                          limit: int = 10) -> List[Dict[str, Any]]:
+        """Get usage totals grouped by a column, heaviest token consumers first."""
+        if group_by not in self.GROUP_COLUMNS:
+            raise ValueError(f"Cannot group usage by {group_by}")
+
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {group_by},
+                       SUM(calls), SUM(cache_hits),
+                       SUM(prompt_tokens), SUM(completion_tokens),
+                       SUM(latency_ms), SUM(cost)
+                FROM ai_usage
+                WHERE day >= ?
+                GROUP BY {group_by}
+                ORDER BY SUM(prompt_tokens) + SUM(completion_tokens) DESC
+                LIMIT ?
+            ''', (since_day or "", limit))
+            rows = cursor.fetchall()
+
+        return [
+            {
+                group_by: row[0],
+                "calls": row[1],
+                "cache_hits": row[2],
+                "prompt_tokens": row[3],
+                "completion_tokens": row[4],
+                "avg_latency_ms": row[5] / row[1] if row[1] else 0.0,
+                "cost": row[6],
+            }
+            for row in rows
+        ]
@@ -12,67 +12,75 @@ class WorldRepository:
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
-        self._initialize_tables()
+        self.db_manager.ensure_schema()
 
-    def _initialize_tables(self) -> None:
-        """Create the necessary tables if they don't exist."""
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Regions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS regions (
-                    x INTEGER,
-                    y INTEGER,
-                    biome TEXT NOT NULL,
-                    features TEXT,
-                    description TEXT,
-                    has_water BOOLEAN,
-                    has_resources BOOLEAN,
-                    has_structure BOOLEAN,
-                    PRIMARY KEY (x, y)
-                )
-            ''')
-            
-            # Locations table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS locations (
-                    x INTEGER,
-                    y INTEGER,
-                    region_x INTEGER,
-                    region_y INTEGER,
-                    features TEXT,
-                    description TEXT,
-                    FOREIGN KEY (region_x, region_y) REFERENCES regions(x, y),
-                    PRIMARY KEY (x, y)
-                )
-            ''')
-            
-            conn.commit()
+    BIOMES = ["Forest", "Desert", "Mountains", "Plains", "Swamp", "Tundra"]
 
     async def generate_world(self, width: int, height: int, region_size: int, seed: Optional[int] = None) -> Dict[Tuple[int, int], Region]:
         """Generate a new world with regions."""
-        if seed:
-            random.seed(seed)
+        regions = self.build_regions(width, height, seed)
+        self.save_regions(regions)
+        return regions
 
-        biomes = ["Forest", "Desert", "Mountains", "Plains", "Swamp", "Tundra"]
+    def build_regions(self, width: int, height: int, seed: Optional[int] = None) -> Dict[Tuple[int, int], Region]:
+        """Randomly generate regions for a world without touching the database."""
+        rng = random.Random(seed)
         regions = {}
 
         for y in range(height):
             for x in range(width):
-                biome = random.choice(biomes)
-                region = Region(
-                    biome=biome,
-                    locations={},
-                    has_water=random.random() > 0.7,
-                    has_resources=random.random() > 0.6,
-                    has_structure=random.random() > 0.8
-                )
-                regions[(x, y)] = region
-                self.save_region(x, y, region)
+                regions[(x, y)] = self._random_region(rng)
 
         return regions
 
+    def build_region(self, x: int, y: int, seed: int) -> Region:
+        """Generate a single region from the world seed and its coordinates.
+
+        The same seed always yields the same region, whatever order regions
+        are generated in, so a world can be generated piecemeal.
+        """
+        return self._random_region(random.Random(f"{seed}:{x}:{y}"))
+
+    def _random_region(self, rng: random.Random) -> Region:
+        return Region(
+            biome=rng.choice(self.BIOMES),
+            locations={},
+            has_water=rng.random() > 0.7,
+            has_resources=rng.random() > 0.6,
+            has_structure=rng.random() > 0.8
+        )
+
+    def save_regions(self, regions: Dict[Tuple[int, int], Region]) -> None:
+        """Save many regions in a single transaction."""
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO regions 
+                (x, y, biome, features, description, has_water, has_resources, has_structure)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    x, y,
+                    region.biome,
+                    json.dumps([loc.features for loc in region.locations.values()]),
+                    region.description,
+                    region.has_water,
+                    region.has_resources,
+                    region.has_structure
+                )
+                for (x, y), region in regions.items()
+            ])
+            cursor.executemany('''
+                INSERT OR REPLACE INTO locations
+                (x, y, region_x, region_y, features, description)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (loc_x, loc_y, x, y, json.dumps(location.features), location.description)
+                for (x, y), region in regions.items()
+                for (loc_x, loc_y), location in region.locations.items()
+            ])
+            conn.commit()
+
     def save_region(self, x: int, y: int, region: Region) -> None:
         """Save a region to the database."""
         with self.db_manager.get_connection() as conn:
@@ -163,6 +171,40 @@ class WorldRepository:
             cursor.execute('DELETE FROM regions')
             conn.commit()
 
+    def load_regions(self, x0: int, y0: int, x1: int, y1: int) -> Dict[Tuple[int, int], Region]:
+        """Load the regions, with their locations, in the box [x0, x1) x [y0, y1)."""
+        regions = {}
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT * FROM regions WHERE x >= ? AND x < ? AND y >= ? AND y < ?',
+                (x0, x1, y0, y1)
+            )
+            for x, y, biome, features, description, has_water, has_resources, has_structure in cursor.fetchall():
+                regions[(x, y)] = Region(
+                    biome=biome,
+                    locations={},
+                    has_water=bool(has_water),
+                    has_resources=bool(has_resources),
+                    has_structure=bool(has_structure),
+                    description=description
+                )
+
+            cursor.execute(
+                'SELECT * FROM locations WHERE region_x >= ? AND region_x < ? AND region_y >= ? AND region_y < ?',
+                (x0, x1, y0, y1)
+            )
+            for loc_x, loc_y, region_x, region_y, loc_features, loc_description in cursor.fetchall():
+                region = regions.get((region_x, region_y))
+                if region is not None:
+                    region.locations[(loc_x, loc_y)] = Location(
+                        x=loc_x,
+                        y=loc_y,
+                        features=json.loads(loc_features) if loc_features else [],
+                        description=loc_description
+                    )
+        return regions
+
     def load_world(self) -> Dict[Tuple[int, int], Region]:
         """Load the world data from the database."""
         regions = {}
@@ -175,7 +217,7 @@ class WorldRepository:
                 x, y, biome, features, description, has_water, has_resources, has_structure = row
                 region = Region(
                     biome=biome,
-                    locations={},  # Assuming you will load locations separately
+                    locations={},
                     has_water=bool(has_water),
                     has_resources=bool(has_resources),
                     has_structure=bool(has_structure),
@@ -183,17 +225,19 @@ class WorldRepository:
                 )
                 regions[(x, y)] = region
 
-                # Load associated locations for this region
-                cursor.execute('SELECT * FROM locations WHERE region_x = ? AND region_y = ?', (x, y))
-                location_rows = cursor.fetchall()
-                for loc in location_rows:
-                    loc_x, loc_y, _, _, loc_features, loc_description = loc
-                    region.locations[(loc_x, loc_y)] = Location(
-                        x=loc_x,
-                        y=loc_y,
-                        features=json.loads(loc_features) if loc_features else [],
-                        description=loc_description
-                    )
+            # Load all locations in one pass rather than one query per region
+            cursor.execute('SELECT * FROM locations')
+            for loc in cursor.fetchall():
+                loc_x, loc_y, region_x, region_y, loc_features, loc_description = loc
+                region = regions.get((region_x, region_y))
+                if region is None:
+                    continue
+                region.locations[(loc_x, loc_y)] = Location(
+                    x=loc_x,
+                    y=loc_y,
+                    features=json.loads(loc_features) if loc_features else [],
+                    description=loc_description
+                )
 
         logger.info("World loaded successfully.")
         return regions
\ No newline at end of file
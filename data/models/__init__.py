@@ -1,14 +1,22 @@
-from .character import Character
+from .character import Character, Stats
 from .combat import CombatState, CombatAction, Enemy
 from .world import Region, Location
-from .quest import Quest
+from .quest import Quest, Objective
+from .versioned import Versioned
+from .explored import ExploredTiles
+from .inventory import Inventory
 
 __all__ = [
     'Character',
+    'Stats',
     'CombatState',
     'CombatAction',
     'Enemy',
     'Region',
     'Location',
-    'Quest'
+    'Quest',
+    'Objective',
+    'Versioned',
+    'ExploredTiles',
+    'Inventory'
 ]
\ No newline at end of file
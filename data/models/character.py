@@ -1,15 +1,64 @@
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+from .versioned import Versioned
+from .explored import ExploredTiles
+from .inventory import Inventory
 
-@dataclass
-class Character:
+class Stats(MutableMapping):
+    """Fixed-layout character stats that behave like a {name: value} dict.
+
+    Stats can be read and updated by name but not added or removed, so four
+    slots replace a per-character dict.
+    """
+
+    __slots__ = ("HP", "Attack", "Defense", "Magic")
+
+    def __init__(self, HP: int = 100, Attack: int = 10, Defense: int = 5, Magic: int = 10):
+        self.HP = HP
+        self.Attack = Attack
+        self.Defense = Defense
+        self.Magic = Magic
+
+    def __getitem__(self, stat: str) -> int:
+        if stat not in self.__slots__:
+            raise KeyError(stat)
+        return getattr(self, stat)
+
+    def __setitem__(self, stat: str, value: int) -> None:
+        if stat not in self.__slots__:
+            raise KeyError(stat)
+        setattr(self, stat, value)
+
+    def __delitem__(self, stat: str) -> None:
+        raise TypeError("Stats cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Stats({', '.join(f'{stat}={self[stat]}' for stat in self.__slots__)})"
+
+    def copy(self) -> "Stats":
+        return Stats(self.HP, self.Attack, self.Defense, self.Magic)
+
+@dataclass(slots=True)
+class Character(Versioned):
     name: str
     player_class: str = "Adventurer"
     level: int = 1
     xp: int = 0
     location: Tuple[int, int] = (0, 0)
-    inventory: List[str] = None
-    stats: Dict[str, int] = None
+    inventory: Optional[Inventory] = None
+    stats: Optional[Mapping[str, int]] = None
+    explored: Optional[ExploredTiles] = field(default=None, compare=False, repr=False)
+    # Owning player, set by the repository so game events can name who acted
+    discord_id: Optional[str] = field(default=None, compare=False, repr=False)
+    # Persisted state as of the last save or load; None until the character is stored
+    _saved: Optional[Dict[str, Any]] = field(default=None, init=False, compare=False, repr=False)
 
     BASE_STATS = {
         "HP": 100,
@@ -20,9 +69,36 @@ class Character:
 
     def __post_init__(self):
         if self.inventory is None:
-            self.inventory = []
+            self.inventory = Inventory()
+        elif not isinstance(self.inventory, Inventory):
+            self.inventory = Inventory(self.inventory)
         if self.stats is None:
-            self.stats = self.BASE_STATS.copy()
+            self.stats = Stats(**self.BASE_STATS)
+        elif not isinstance(self.stats, Stats):
+            self.stats = Stats(**self.stats)
+
+    def persisted_state(self) -> Dict[str, Any]:
+        """Return the fields stored in the character's database row."""
+        return {
+            "name": self.name,
+            "player_class": self.player_class,
+            "level": self.level,
+            "xp": self.xp,
+            "location": tuple(self.location),
+            **self.stats
+        }
+
+    def dirty_fields(self) -> Dict[str, Any]:
+        """Return the persisted fields changed since the last save, or all of them if never saved."""
+        state = self.persisted_state()
+        if self._saved is None:
+            return state
+        return {name: value for name, value in state.items() if self._saved.get(name) != value}
+
+    def mark_clean(self) -> None:
+        """Record the current state as persisted."""
+        # Bypass Versioned: being saved is not a modification
+        object.__setattr__(self, "_saved", self.persisted_state())
 
     def allocate_stat_points(self, hp: int = 0, attack: int = 0, defense: int = 0, magic: int = 0) -> None:
         """Allocate stat points to customize the character."""
@@ -30,9 +106,10 @@ class Character:
         self.stats["Attack"] += attack
         self.stats["Defense"] += defense
         self.stats["Magic"] += magic
+        self.touch()
 
     def level_up(self) -> int:
         """Increase level and grant stat points."""
         self.level += 1
         self.xp = 0
-        return 5  # Number of points to allocate
\ No newline at end of file
+        return 5  # Number of points to allocate
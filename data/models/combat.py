@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
 from .character import Character
+from .versioned import Versioned
 
 @dataclass
 class CombatAction:
@@ -11,8 +12,8 @@ class CombatAction:
     details: Optional[str] = None
     timestamp: datetime = datetime.now()
 
-@dataclass
-class Enemy:
+@dataclass(slots=True)
+class Enemy(Versioned):
     name: str
     level: int
     hp: int
@@ -20,6 +21,7 @@ class Enemy:
     attack: int
     defense: int
     is_alive: bool = True
+    kind: str = ""
     
     def take_damage(self, amount: int) -> bool:
         """Apply damage and return whether enemy is still alive."""
@@ -28,7 +30,7 @@ class Enemy:
         return self.is_alive
 
 @dataclass
-class CombatState:
+class CombatState(Versioned):
     players: List[Character]
     enemies: List[Enemy]
     round: int = 1
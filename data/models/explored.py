@@ -0,0 +1,108 @@
+from array import array
+from typing import Iterable, Iterator, Tuple
+import struct
+import zlib
+
+class ExploredTiles:
+    """Bitset of the tiles a character has explored, one bit per tile of the world.
+
+    Serialised form is a small header followed by whichever encoding is
+    smallest: the raw bitmap, a sparse list of tile indices (few tiles
+    explored), or the deflated bitmap, which collapses long runs of
+    explored or unexplored tiles.
+    """
+
+    __slots__ = ("width", "height", "_bits", "_count")
+
+    RAW = 0
+    SPARSE = 1
+    DEFLATED = 2
+    # encoding, width, height
+    HEADER = struct.Struct("<BII")
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._bits = bytearray((width * height + 7) // 8)
+        self._count = 0
+
+    def _index(self, x: int, y: int) -> int:
+        """Return the bit index of a tile, or -1 if it lies outside the tracked area."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def mark(self, x: int, y: int) -> bool:
+        """Mark a tile explored; return True if this is its first discovery."""
+        index = self._index(x, y)
+        if index < 0:
+            return False
+        byte, bit = divmod(index, 8)
+        if self._bits[byte] >> bit & 1:
+            return False
+        self._bits[byte] |= 1 << bit
+        self._count += 1
+        return True
+
+    def mark_all(self, tiles: Iterable[Tuple[int, int]]) -> int:
+        """Mark several tiles explored; return how many were newly discovered."""
+        return sum(self.mark(x, y) for x, y in tiles)
+
+    def is_explored(self, x: int, y: int) -> bool:
+        index = self._index(x, y)
+        return index >= 0 and bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __contains__(self, tile: Tuple[int, int]) -> bool:
+        return self.is_explored(*tile)
+
+    def __len__(self) -> int:
+        """Number of explored tiles."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over explored tiles in row-major order."""
+        for index in self._indices():
+            yield divmod(index, self.width)[::-1]
+
+    def _indices(self) -> Iterator[int]:
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield byte_index * 8 + low.bit_length() - 1
+                byte ^= low
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of the world explored."""
+        total = self.width * self.height
+        return self._count / total if total else 0.0
+
+    def to_bytes(self) -> bytes:
+        """Serialise using the most compact encoding."""
+        candidates = [
+            (self.RAW, bytes(self._bits)),
+            (self.SPARSE, array("I", self._indices()).tobytes()),
+            (self.DEFLATED, zlib.compress(bytes(self._bits), 9)),
+        ]
+        encoding, payload = min(candidates, key=lambda candidate: len(candidate[1]))
+        return self.HEADER.pack(encoding, self.width, self.height) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes, width: int, height: int) -> "ExploredTiles":
+        """Deserialise into a bitset of the given size, remapping tiles if the world was resized."""
+        encoding, stored_width, stored_height = cls.HEADER.unpack_from(data)
+        payload = data[cls.HEADER.size:]
+        stored = cls(stored_width, stored_height)
+        if encoding == cls.SPARSE:
+            for index in array("I", payload):
+                stored.mark(index % stored_width, index // stored_width)
+        else:
+            bits = zlib.decompress(payload) if encoding == cls.DEFLATED else payload
+            stored._bits[:] = bits
+            stored._count = int.from_bytes(bits, "little").bit_count()
+
+        if (stored_width, stored_height) == (width, height):
+            return stored
+        explored = cls(width, height)
+        explored.mark_all(stored)
+        return explored
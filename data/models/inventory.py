@@ -0,0 +1,66 @@
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Mapping, Set, Union
+
+class Inventory(Counter):
+    """Item name -> quantity held, stacking repeated items.
+
+    Quantities never drop below one: an item set to zero or less is
+    removed. The inventory remembers which items changed since it was last
+    saved, so persisting costs O(changes) rather than O(items).
+    """
+
+    def __init__(self, items: Union[Iterable[str], Mapping[str, int], None] = None):
+        self._changed: Set[str] = set()
+        super().__init__(items)
+
+    def update(self, items: Union[Iterable[str], Mapping[str, int], None] = None, **quantities: int) -> None:
+        """Add quantities from a mapping, or one of each item in an iterable."""
+        # Counter.update writes straight into an empty dict, bypassing __setitem__
+        items = items or ()
+        pairs = items.items() if isinstance(items, Mapping) else ((item, 1) for item in items)
+        for item, quantity in chain(pairs, quantities.items()):
+            self[item] += quantity
+
+    def __setitem__(self, item: str, quantity: int) -> None:
+        self._changed.add(item)
+        if quantity > 0:
+            super().__setitem__(item, quantity)
+        else:
+            super().pop(item, None)
+
+    def __delitem__(self, item: str) -> None:
+        self._changed.add(item)
+        super().__delitem__(item)
+
+    def pop(self, item: str, *default):
+        self._changed.add(item)
+        return super().pop(item, *default)
+
+    def clear(self) -> None:
+        self._changed.update(self)
+        super().clear()
+
+    def add(self, item: str, quantity: int = 1) -> int:
+        """Add items to a stack and return its new quantity."""
+        self[item] += quantity
+        return self[item]
+
+    def remove(self, item: str, quantity: int = 1) -> bool:
+        """Take items from a stack; return False, changing nothing, if there are too few."""
+        if self[item] < quantity:
+            return False
+        self[item] -= quantity
+        return True
+
+    def __reduce__(self):
+        # Counter pickles only the quantities; keep the pending changes too
+        return (self.__class__, (dict(self),), {"_changed": set(self._changed)})
+
+    def changes(self) -> Dict[str, int]:
+        """Return the new quantity of every item changed since the last save; 0 means removed."""
+        return {item: self[item] for item in self._changed}
+
+    def mark_saved(self) -> None:
+        """Forget pending changes once they have been persisted."""
+        self._changed.clear()
@@ -1,7 +1,28 @@
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 
+@dataclass(slots=True)
+class Objective:
+    """Something a quest needs done: `required` game events of a kind, optionally for one target.
+
+    A target of None matches events for any target.
+    """
+    kind: str
+    target: Any = None
+    required: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "target": self.target, "required": self.required}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Objective":
+        target = data.get("target")
+        # Tiles come back from JSON as lists
+        if isinstance(target, list):
+            target = tuple(target)
+        return cls(data["kind"], target, data.get("required", 1))
+
 @dataclass
 class Quest:
     title: str
@@ -16,10 +37,13 @@ class Quest:
     created_at: Optional[datetime] = None
     expires_at: Optional[datetime] = None
     active: bool = True
+    objectives: List[Objective] = None
 
     def __post_init__(self):
         if self.rewards is None:
             self.rewards = []
+        if self.objectives is None:
+            self.objectives = []
         if self.created_at is None:
             self.created_at = datetime.now()
 
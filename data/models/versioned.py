@@ -0,0 +1,19 @@
+from typing import Any
+
+class Versioned:
+    """Mixin giving a model a version number that changes whenever it is modified.
+
+    Assigning any attribute bumps the version automatically. Code that mutates a
+    container field in place (stats, inventory) must call touch() itself.
+    """
+
+    __slots__ = ("version", "__weakref__")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", getattr(self, "version", 0) + 1)
+
+    def touch(self) -> None:
+        """Mark the model as modified."""
+        self.version += 1
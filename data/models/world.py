@@ -1,14 +1,14 @@
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     x: int
     y: int
     features: List[str] = None
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     biome: str
     locations: Dict[tuple, Location]
@@ -0,0 +1,148 @@
+"""Run the bot as several worker processes, each owning a contiguous range of shards.
+
+    python launcher.py --shards 8 --processes 4
+    python launcher.py --status
+
+Workers share the SQLite database but not memory. Guild-scoped state is safe
+to split across processes; these player-scoped caches are not shared:
+
+- leaderboards are rebuilt from the database only at start-up, so each
+  worker ranks the activity it has seen since then;
+- quest objective progress is tracked by the worker where the quest was
+  accepted, so events handled by another worker do not count towards it;
+- cached characters are revalidated against their row revision on every
+  load, but two workers saving the same character at once can still
+  overwrite each other's changes;
+- each worker's quest board is reloaded when the open quests in the
+  database change, checked at most every QUEST_BOARD_REFRESH_INTERVAL
+  seconds, so quests posted or completed elsewhere show up after a delay.
+
+Run a single process if those features must be exact.
+"""
+import argparse
+import logging
+import multiprocessing
+import signal
+import time
+from typing import Dict, List
+from core.config import Config
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.shard_health_repository import ShardHealthRepository
+
+logger = logging.getLogger("launcher")
+
+# Discord allows one IDENTIFY per five seconds for bots without large-bot sharding
+IDENTIFY_INTERVAL = 5.0
+# Crashing workers are restarted after exponentially growing delays
+RESTART_BACKOFF = 5.0
+MAX_RESTART_BACKOFF = 300.0
+# A worker that ran this long before exiting is considered healthy again
+STABLE_RUN = 120.0
+
+def shard_ranges(shard_count: int, processes: int) -> List[List[int]]:
+    """Split shard ids into contiguous, near-equal ranges, one per process."""
+    processes = max(1, min(processes, shard_count))
+    base, extra = divmod(shard_count, processes)
+    ranges, start = [], 0
+    for i in range(processes):
+        size = base + (1 if i < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+def restart_delay(failures: int) -> float:
+    """Delay before restarting a worker that has failed this many times in a row."""
+    return min(MAX_RESTART_BACKOFF, RESTART_BACKOFF * 2 ** max(0, failures - 1))
+
+def run_worker(config_path: str, shard_ids: List[int], shard_count: int, delay: float) -> None:
+    """Entry point of a worker process."""
+    # Imported here so the launcher itself never loads discord or the game services
+    from main import run_bot
+
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [shards {shard_ids[0]}-{shard_ids[-1]}] %(name)s: %(message)s")
+    time.sleep(delay)
+    config = Config.load_from_yaml(config_path)
+    config.shard_count = shard_count
+    config.shard_ids = shard_ids
+    run_bot(config)
+
+def print_status(config_path: str) -> None:
+    """Print the latest health report of every shard."""
+    config = Config.load_from_yaml(config_path)
+    repository = ShardHealthRepository(DatabaseManager(config.database_path))
+    now = time.time()
+    for report in repository.get_reports():
+        latency = f"{report['latency_ms']:.0f}ms" if report["latency_ms"] is not None else "n/a"
+        print(f"shard {report['shard_id']}/{report['shard_count']} pid={report['pid']} "
+              f"{report['status']:<10} latency={latency:<7} guilds={report['guilds']:<6} "
+              f"updated {now - report['updated_at']:.0f}s ago")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--shards", type=int, help="total shard count")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--status", action="store_true", help="print shard health and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [launcher] %(message)s")
+    if args.status:
+        print_status(args.config)
+        return
+    if not args.shards:
+        parser.error("--shards is required when launching workers")
+
+    # Make sure the shared database (and its WAL mode) exists before workers race to create it
+    DatabaseManager(Config.load_from_yaml(args.config).database_path).initialize_database()
+
+    context = multiprocessing.get_context("spawn")
+    ranges = shard_ranges(args.shards, args.processes)
+    workers: Dict[int, multiprocessing.Process] = {}
+    started_at: Dict[int, float] = {}
+    failures: Dict[int, int] = {}
+    stopping = False
+
+    def start(index: int, delay: float) -> None:
+        process = context.Process(
+            target=run_worker,
+            args=(args.config, ranges[index], args.shards, delay),
+            name=f"shards-{ranges[index][0]}-{ranges[index][-1]}"
+        )
+        process.start()
+        workers[index] = process
+        started_at[index] = time.monotonic() + delay
+        logger.info(f"Started {process.name} (pid {process.pid})")
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    # Stagger start-up so each shard gets its own IDENTIFY window
+    delay = 0.0
+    for index, shard_ids in enumerate(ranges):
+        start(index, delay)
+        delay += IDENTIFY_INTERVAL * len(shard_ids)
+
+    while not stopping:
+        time.sleep(1.0)
+        for index, process in list(workers.items()):
+            if not process.is_alive() and not stopping:
+                if time.monotonic() - started_at[index] >= STABLE_RUN:
+                    failures[index] = 0
+                failures[index] = failures.get(index, 0) + 1
+                delay = max(IDENTIFY_INTERVAL, restart_delay(failures[index]))
+                logger.warning(f"{process.name} exited with code {process.exitcode}, restarting in {delay:.0f}s")
+                start(index, delay)
+
+    # Workers close their bot on SIGTERM and flush buffered state before exiting
+    for process in workers.values():
+        process.terminate()
+    for process in workers.values():
+        process.join(timeout=30)
+    logger.info("All workers stopped")
+
+if __name__ == "__main__":
+    main()
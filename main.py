@@ -1,57 +1,202 @@
 import os
+import asyncio
+import signal
 import discord
 from discord.ext import commands
 from core.config import Config
 from services.discord.command_handler import GameCommandHandler
+from services.discord.outbound_queue import OutboundQueue
+from services.discord.admission import CommandAdmission
+from services.discord.slash_commands import SlashCommandHandler
+from services.discord.shard_monitor import ShardMonitor
 from services.game.character_service import CharacterService
 from services.game.combat_service import CombatService
 from services.game.world_service import WorldService
+from services.game.chunk_manager import ChunkManager
+from services.game.prefetcher import DescriptionPrefetcher
+from services.game.presence import PresenceIndex
 from services.game.quest_service import QuestService
+from services.game.quest_tracker import QuestTracker
+from services.game.quest_board import QuestBoard
+from services.game.events import EventBus
+from services.game.leaderboard import Leaderboards
 from services.ai.openai_service import OpenAIService
 from services.ai.narrative_service import NarrativeService
+from services.ai.response_cache import ResponseCache
+from services.ai.backends import CompletionBackend, OpenAIBackend
+from services.ai.fake_backend import FakeBackend, LatencyModel
+from services.ai.usage_tracker import UsageTracker
+from services.engine.command_bus import create_command_bus
 from data.database.db_manager import DatabaseManager
 from data.database.repositories.character_repository import CharacterRepository
 from data.database.repositories.quest_repository import QuestRepository
+from data.database.repositories.world_repository import WorldRepository
+from data.database.repositories.response_cache_repository import ResponseCacheRepository
+from data.database.repositories.usage_repository import UsageRepository
+from data.database.repositories.shard_health_repository import ShardHealthRepository
+
+def create_ai_backend(config: Config) -> CompletionBackend:
+    """Create the chat-completion backend selected by the configuration."""
+    if config.ai_backend == "fake":
+        latency = LatencyModel("lognormal", config.fake_ai_latency_ms / 1000, 0.3)
+        if config.fake_ai_recordings:
+            return FakeBackend.from_recording_file(config.fake_ai_recordings, latency=latency)
+        return FakeBackend(latency=latency)
+    return OpenAIBackend(config.openai_api_key, base_url=config.openai_base_url)
 
 def setup_bot(config: Config):
     
     # Initialize bot
     intents = discord.Intents.default()
-    intents.message_content = True
-    bot = commands.Bot(command_prefix=config.command_prefix, intents=intents)
+    # Prefix commands need to read every message; slash commands do not
+    intents.message_content = config.prefix_commands_enabled
+    if config.auto_shard or config.shard_ids:
+        # One gateway connection per shard; shard_ids restricts this process to a range
+        bot = commands.AutoShardedBot(
+            command_prefix=config.command_prefix,
+            intents=intents,
+            shard_count=config.shard_count,
+            shard_ids=config.shard_ids
+        )
+    else:
+        bot = commands.Bot(command_prefix=config.command_prefix, intents=intents)
 
     # Initialize database and repositories
     db_manager = DatabaseManager(config.database_path)
     db_manager.initialize_database()
-    character_repository = CharacterRepository(db_manager)
+    character_repository = CharacterRepository(
+        db_manager,
+        world_size=config.world_size,
+        max_cached=config.character_cache_size,
+        idle_timeout=config.character_idle_timeout
+    )
     quest_repository = QuestRepository(db_manager)
+    world_repository = WorldRepository(db_manager)
     
     # Initialize AI services
-    openai_service = OpenAIService(config)
+    response_cache = ResponseCache(
+        ResponseCacheRepository(db_manager),
+        max_entries=config.response_cache_entries,
+        max_rows=config.response_cache_rows
+    )
+    usage_tracker = UsageTracker(UsageRepository(db_manager), config.usage_flush_interval)
+    openai_service = OpenAIService(
+        config,
+        cache=response_cache,
+        backend=create_ai_backend(config),
+        usage_tracker=usage_tracker
+    )
     narrative_service = NarrativeService(openai_service)
     
-    # Initialize game services
-    character_service = CharacterService(character_repository)
-    combat_service = CombatService(narrative_service)
-    world_service = WorldService(quest_repository, narrative_service)
-    quest_service = QuestService(quest_repository, narrative_service)
+    # Initialize game services; heavy engine work can run in a process pool
+    command_bus = create_command_bus(config.engine_workers)
+    # Game events (moves, kills, items) drive quest objectives
+    events = EventBus()
+    leaderboards = Leaderboards()
+    leaderboards.subscribe(events)
+    character_service = CharacterService(character_repository, events, leaderboards)
+    combat_service = CombatService(narrative_service, command_bus, events)
+    # A chunk size enables the unbounded, lazily generated world
+    chunk_manager = None
+    if config.world_chunk_size > 0:
+        chunk_manager = ChunkManager(
+            world_repository,
+            seed=config.world_seed,
+            chunk_size=config.world_chunk_size,
+            max_chunks=config.world_max_chunks
+        )
+    world_service = WorldService(
+        world_repository,
+        narrative_service,
+        world_width=config.world_size[0],
+        world_height=config.world_size[1],
+        region_size=config.region_size,
+        command_bus=command_bus,
+        snapshot_path=config.world_snapshot_path,
+        chunk_manager=chunk_manager,
+        prefetcher=DescriptionPrefetcher(
+            max_tiles=config.description_cache_tiles,
+            concurrency=config.prefetch_concurrency,
+            budget=config.prefetch_budget_per_minute
+        ) if config.prefetch_concurrency > 0 else None,
+        presence=PresenceIndex(
+            cell_size=config.presence_cell_size,
+            idle_timeout=config.presence_idle_timeout
+        ),
+        map_radius=config.map_viewport_radius,
+        events=events
+    )
+    quest_tracker = QuestTracker(quest_repository, config.quest_progress_flush_interval)
+    quest_service = QuestService(
+        quest_repository,
+        narrative_service,
+        events,
+        quest_tracker,
+        board=QuestBoard(region_size=config.region_size),
+        board_refresh_interval=config.quest_board_refresh_interval
+    )
 
     # Initialize command handler
     command_handler = GameCommandHandler(
         bot,
         character_service,
         combat_service,
-        world_service
+        world_service,
+        outbound=OutboundQueue(coalesce_window=config.outbound_coalesce_window),
+        admission=CommandAdmission(
+            guild_concurrency=config.guild_command_concurrency,
+            guild_queue_limit=config.guild_command_queue,
+            user_queue_limit=config.user_command_queue
+        ),
+        quest_service=quest_service
     )
-    command_handler.register_commands()
+    if config.prefix_commands_enabled:
+        command_handler.register_commands()
+    if config.slash_commands_enabled:
+        SlashCommandHandler(bot, command_handler).register_commands()
+
+    shard_monitor = ShardMonitor(bot, ShardHealthRepository(db_manager), config.health_report_interval)
+
+    # Start background tasks once the event loop is running
+    async def setup_hook():
+        # The launcher stops workers with SIGTERM; close the bot so run_bot gets
+        # to flush buffered usage and quest progress
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(bot.close()))
+        except NotImplementedError:
+            pass  # Event loops on Windows have no signal handlers
+        world_service.load_world()
+        quest_service.load_board()
+        quest_tracker.load()
+        leaderboards.load(quest_repository.get_completion_totals(), character_repository.get_rankings())
+        quest_tracker.start()
+        usage_tracker.start()
+        shard_monitor.start()
+        # Command registration is global, so only the process owning shard 0 syncs it
+        if config.slash_commands_enabled and (not config.shard_ids or 0 in config.shard_ids):
+            await bot.tree.sync()
+
+    bot.setup_hook = setup_hook
+    bot.usage_tracker = usage_tracker
+    bot.quest_tracker = quest_tracker
+    bot.command_bus = command_bus
 
     return bot
 
+def run_bot(config: Config):
+    """Run the bot until it is closed."""
+    bot = setup_bot(config)
+    try:
+        bot.run(config.discord_token)
+    finally:
+        bot.usage_tracker.flush()
+        bot.quest_tracker.flush()
+        bot.command_bus.close()
+
 def main():
     config = Config.load_from_yaml()
     
-    bot = setup_bot(config)
-    bot.run(config.discord_token)
+    run_bot(config)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,24 @@
 from .openai_service import OpenAIService
 from .narrative_service import NarrativeService
+from .response_cache import ResponseCache, CachePolicy
+from .conversation_memory import ConversationMemory
+from .backends import Completion, CompletionBackend, OpenAIBackend
+from .fake_backend import FakeBackend, LatencyModel, RecordingBackend
+from .usage_tracker import UsageTracker, UsageContext, attribute_usage
 
 __all__ = [
     'OpenAIService',
-    'NarrativeService'
+    'NarrativeService',
+    'ResponseCache',
+    'CachePolicy',
+    'ConversationMemory',
+    'Completion',
+    'CompletionBackend',
+    'OpenAIBackend',
+    'FakeBackend',
+    'LatencyModel',
+    'RecordingBackend',
+    'UsageTracker',
+    'UsageContext',
+    'attribute_usage'
 ]
\ No newline at end of file
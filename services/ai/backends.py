@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+import openai
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Completion:
+    """A finished chat completion and its token usage."""
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+class CompletionBackend(ABC):
+    """Interface for chat-completion providers used by OpenAIService."""
+
+    @abstractmethod
+    async def complete(self,
+                       messages: List[Dict[str, str]],
+                       model: str,
+                       temperature: float,
+                       max_tokens: int) -> Completion:
+        """Generate a full completion."""
+
+    @abstractmethod
+    def stream(self,
+               messages: List[Dict[str, str]],
+               model: str,
+               temperature: float,
+               max_tokens: int,
+               usage: Optional[Completion] = None) -> AsyncIterator[str]:
+        """Stream a completion as text deltas.
+
+        If usage is given, its token counts are filled in once the stream ends.
+        """
+
+class OpenAIBackend(CompletionBackend):
+    """Chat completions served by the OpenAI API (or any compatible endpoint)."""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        openai.api_key = api_key
+        self.client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+    async def complete(self,
+                       messages: List[Dict[str, str]],
+                       model: str,
+                       temperature: float,
+                       max_tokens: int) -> Completion:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        logger.debug(f"OpenAI response: {response}")
+        usage = response.usage
+        return Completion(
+            text=response.choices[0].message.content,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0
+        )
+
+    async def stream(self,
+                     messages: List[Dict[str, str]],
+                     model: str,
+                     temperature: float,
+                     max_tokens: int,
+                     usage: Optional[Completion] = None) -> AsyncIterator[str]:
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.usage and usage is not None:
+                usage.prompt_tokens = chunk.usage.prompt_tokens
+                usage.completion_tokens = chunk.usage.completion_tokens
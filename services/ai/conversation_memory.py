@@ -0,0 +1,123 @@
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, List, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+Turn = Tuple[str, str]  # (player message, NPC reply)
+Summariser = Callable[[str, List[Turn]], Awaitable[str]]
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimate the token count of a piece of text."""
+    return len(text) // 4 + 1
+
+class Conversation:
+    """Recent turns and a rolling summary for one (player, NPC) pair."""
+    __slots__ = ("turns", "summary", "pending", "tokens", "compaction")
+
+    def __init__(self):
+        self.turns: Deque[Turn] = deque()
+        self.summary: str = ""
+        self.pending: List[Turn] = []
+        self.tokens: int = 0
+        self.compaction: Optional[asyncio.Task] = None
+
+class ConversationMemory:
+    """Bounded per (player, NPC) conversation memory with background summarisation."""
+
+    def __init__(self,
+                 token_budget: int = 400,
+                 summary_tokens: int = 120,
+                 max_turns: int = 8,
+                 max_conversations: int = 5000,
+                 summariser: Optional[Summariser] = None):
+        self.token_budget = token_budget
+        self.summary_tokens = summary_tokens
+        self.max_turns = max_turns
+        self.max_conversations = max_conversations
+        self.summariser = summariser
+        self._conversations: "OrderedDict[Tuple[str, str], Conversation]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def get(self, player_id: str, npc_name: str) -> Optional[Conversation]:
+        """Get a conversation, marking it as recently used."""
+        key = (player_id, npc_name)
+        conversation = self._conversations.get(key)
+        if conversation is not None:
+            self._conversations.move_to_end(key)
+        return conversation
+
+    def build_context(self, player_id: str, npc_name: str) -> Optional[str]:
+        """Build the prompt context for a conversation, or None if there is no history."""
+        conversation = self.get(player_id, npc_name)
+        if conversation is None:
+            return None
+
+        lines = []
+        if conversation.summary:
+            lines.append(f"Earlier conversation: {conversation.summary}")
+        if conversation.turns:
+            lines.append("Recent exchanges:")
+            for player_message, npc_reply in conversation.turns:
+                lines.append(f"Player: {player_message}")
+                lines.append(f"{npc_name}: {npc_reply}")
+        return "\n".join(lines) or None
+
+    def record(self, player_id: str, npc_name: str, player_message: str, npc_reply: str) -> None:
+        """Record a turn, moving overflow into the summary queue."""
+        # Recent turns stay within the token budget; older turns are folded into
+        # the rolling summary in the background so prompt size stays flat.
+        conversation = self.get(player_id, npc_name)
+        if conversation is None:
+            conversation = self._conversations[(player_id, npc_name)] = Conversation()
+            while len(self._conversations) > self.max_conversations:
+                _, evicted = self._conversations.popitem(last=False)
+                if evicted.compaction:
+                    evicted.compaction.cancel()
+
+        turn = (player_message, npc_reply)
+        conversation.turns.append(turn)
+        conversation.tokens += self._turn_tokens(turn)
+
+        budget = self.token_budget - estimate_tokens(conversation.summary)
+        while len(conversation.turns) > 1 and (
+            conversation.tokens > budget or len(conversation.turns) > self.max_turns
+        ):
+            oldest = conversation.turns.popleft()
+            conversation.tokens -= self._turn_tokens(oldest)
+            conversation.pending.append(oldest)
+
+        if conversation.pending and conversation.compaction is None:
+            conversation.compaction = asyncio.get_running_loop().create_task(
+                self._compact(npc_name, conversation)
+            )
+
+    async def _compact(self, npc_name: str, conversation: Conversation) -> None:
+        """Fold pending turns into the rolling summary."""
+        try:
+            while conversation.pending:
+                turns, conversation.pending = conversation.pending, []
+                if self.summariser is None:
+                    continue
+                try:
+                    summary = await self.summariser(conversation.summary, turns)
+                except Exception as e:
+                    logger.warning(f"Failed to summarise conversation with {npc_name}: {e}")
+                    continue
+                # Never let the summary itself outgrow its share of the budget
+                conversation.summary = summary[:self.summary_tokens * 4]
+        finally:
+            conversation.compaction = None
+
+    @staticmethod
+    def _turn_tokens(turn: Turn) -> int:
+        return estimate_tokens(turn[0]) + estimate_tokens(turn[1])
+
+    async def drain(self) -> None:
+        """Wait for all in-flight compactions to finish."""
+        tasks = [c.compaction for c in self._conversations.values() if c.compaction]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
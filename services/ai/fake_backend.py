@@ -0,0 +1,152 @@
+from typing import AsyncIterator, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import math
+import random
+import logging
+from core.exceptions import AIServiceError
+from .backends import Completion, CompletionBackend
+
+logger = logging.getLogger(__name__)
+
+_VOCABULARY = (
+    "ancient shadowed winding mossy crumbling silent distant ember storm "
+    "wind river stone path tower ruin grove mist light blade roar echo "
+    "the a of and beneath beyond across where through as with"
+).split()
+
+def request_key(messages: List[Dict[str, str]], model: str) -> str:
+    """Key a request by its messages and model, as used by recordings."""
+    encoded = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+class LatencyModel:
+    """Samples simulated latencies, in seconds, from a simple distribution."""
+
+    DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+    def __init__(self, distribution: str = "fixed", mean: float = 0.0,
+                 spread: float = 0.0, seed: Optional[int] = None):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.mean = mean
+        self.spread = spread
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one latency."""
+        if self.distribution == "fixed" or self.mean <= 0:
+            return self.mean
+        if self.distribution == "uniform":
+            return max(0.0, self._random.uniform(self.mean - self.spread, self.mean + self.spread))
+        # Lognormal with the given median; spread is the sigma of the underlying normal
+        return self._random.lognormvariate(math.log(self.mean), self.spread)
+
+class FakeBackend(CompletionBackend):
+    """Offline stand-in for the OpenAI API that replays recordings or generates deterministic text."""
+
+    def __init__(self,
+                 recordings: Optional[Dict[str, str]] = None,
+                 latency: Optional[LatencyModel] = None,
+                 token_latency: Optional[LatencyModel] = None,
+                 error_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self.recordings = recordings or {}
+        self.latency = latency or LatencyModel()
+        self.token_latency = token_latency or LatencyModel()
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    @classmethod
+    def from_recording_file(cls, path: str, **kwargs) -> "FakeBackend":
+        """Create a backend that replays responses saved by RecordingBackend."""
+        with open(path, "r") as f:
+            return cls(recordings=json.load(f), **kwargs)
+
+    def _respond(self, messages: List[Dict[str, str]], model: str, max_tokens: int) -> str:
+        """Return the recorded response for a request, or deterministic filler text."""
+        key = request_key(messages, model)
+        if key in self.recordings:
+            return self.recordings[key]
+        generator = random.Random(key)
+        length = min(max_tokens, generator.randint(20, 60))
+        return " ".join(generator.choice(_VOCABULARY) for _ in range(length)).capitalize() + "."
+
+    async def _before_request(self) -> None:
+        """Apply simulated latency and error injection."""
+        self.calls += 1
+        await asyncio.sleep(self.latency.sample())
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise AIServiceError("Injected fake backend failure")
+
+    async def complete(self,
+                       messages: List[Dict[str, str]],
+                       model: str,
+                       temperature: float,
+                       max_tokens: int) -> Completion:
+        await self._before_request()
+        text = self._respond(messages, model, max_tokens)
+        return self._usage(messages, text)
+
+    @staticmethod
+    def _usage(messages: List[Dict[str, str]], text: str) -> Completion:
+        """Approximate token usage for a fake completion."""
+        return Completion(
+            text=text,
+            prompt_tokens=sum(len(m["content"]) // 4 + 1 for m in messages),
+            completion_tokens=len(text.split())
+        )
+
+    async def stream(self,
+                     messages: List[Dict[str, str]],
+                     model: str,
+                     temperature: float,
+                     max_tokens: int,
+                     usage: Optional[Completion] = None) -> AsyncIterator[str]:
+        await self._before_request()
+        text = self._respond(messages, model, max_tokens)
+        for i, word in enumerate(text.split(" ")):
+            if i:
+                await asyncio.sleep(self.token_latency.sample())
+            yield word if i == 0 else " " + word
+        if usage is not None:
+            counted = self._usage(messages, text)
+            usage.prompt_tokens = counted.prompt_tokens
+            usage.completion_tokens = counted.completion_tokens
+
+class RecordingBackend(CompletionBackend):
+    """Wraps another backend and records its responses for later replay."""
+
+    def __init__(self, backend: CompletionBackend):
+        self.backend = backend
+        self.recordings: Dict[str, str] = {}
+
+    async def complete(self,
+                       messages: List[Dict[str, str]],
+                       model: str,
+                       temperature: float,
+                       max_tokens: int) -> Completion:
+        completion = await self.backend.complete(messages, model, temperature, max_tokens)
+        self.recordings[request_key(messages, model)] = completion.text
+        return completion
+
+    async def stream(self,
+                     messages: List[Dict[str, str]],
+                     model: str,
+                     temperature: float,
+                     max_tokens: int,
+                     usage: Optional[Completion] = None) -> AsyncIterator[str]:
+        parts = []
+        async for chunk in self.backend.stream(messages, model, temperature, max_tokens, usage):
+            parts.append(chunk)
+            yield chunk
+        self.recordings[request_key(messages, model)] = "".join(parts)
+
+    def save(self, path: str) -> None:
+        """Write the recorded responses to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.recordings, f, indent=2)
+        logger.info(f"Saved {len(self.recordings)} recorded responses to {path}")
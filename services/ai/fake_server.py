@@ -0,0 +1,120 @@
+"""Local OpenAI-compatible chat-completions server backed by FakeBackend.
+
+Point OpenAIBackend at it with ``openai_base_url: http://127.0.0.1:8089/v1`` to
+exercise the real HTTP client path without an API key:
+
+    python -m services.ai.fake_server --port 8089 --latency-ms 400 --error-rate 0.01
+"""
+import argparse
+import json
+import time
+import logging
+from aiohttp import web
+from core.exceptions import AIServiceError
+from .backends import Completion
+from .fake_backend import FakeBackend, LatencyModel
+
+logger = logging.getLogger(__name__)
+
+def create_app(backend: FakeBackend) -> web.Application:
+    """Create an aiohttp application serving /v1/chat/completions."""
+
+    async def chat_completions(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        messages = body["messages"]
+        model = body.get("model", "fake")
+        temperature = body.get("temperature", 0.7)
+        max_tokens = body.get("max_tokens", 150)
+        created = int(time.time())
+
+        try:
+            if not body.get("stream"):
+                completion = await backend.complete(messages, model, temperature, max_tokens)
+                return web.json_response({
+                    "id": f"chatcmpl-fake-{backend.calls}",
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": completion.text},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": completion.prompt_tokens,
+                        "completion_tokens": completion.completion_tokens,
+                        "total_tokens": completion.prompt_tokens + completion.completion_tokens
+                    }
+                })
+
+            usage = Completion(text="")
+            chunks = backend.stream(messages, model, temperature, max_tokens, usage)
+            first = await chunks.__anext__()
+        except AIServiceError as e:
+            return web.json_response({"error": {"message": str(e), "type": "server_error"}}, status=500)
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+
+        async def send(delta: dict, finish_reason=None) -> None:
+            event = {
+                "id": f"chatcmpl-fake-{backend.calls}",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            await response.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+
+        await send({"role": "assistant", "content": first})
+        async for chunk in chunks:
+            await send({"content": chunk})
+        await send({}, finish_reason="stop")
+        if body.get("stream_options", {}).get("include_usage"):
+            event = {
+                "id": f"chatcmpl-fake-{backend.calls}",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": {
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.prompt_tokens + usage.completion_tokens
+                }
+            }
+            await response.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    return app
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake OpenAI chat completions.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--recordings", help="JSON file saved by RecordingBackend")
+    parser.add_argument("--latency", choices=LatencyModel.DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median time to first token")
+    parser.add_argument("--token-latency-ms", type=float, default=0.0)
+    parser.add_argument("--spread", type=float, default=0.3)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    options = dict(
+        latency=LatencyModel(args.latency, args.latency_ms / 1000, args.spread, args.seed),
+        token_latency=LatencyModel("fixed", args.token_latency_ms / 1000),
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    if args.recordings:
+        backend = FakeBackend.from_recording_file(args.recordings, **options)
+    else:
+        backend = FakeBackend(**options)
+    web.run_app(create_app(backend), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Tuple
+from data.models.combat import CombatAction
 from .openai_service import OpenAIService
 import logging
 
@@ -10,28 +11,109 @@ class NarrativeService:
     def __init__(self, openai_service: OpenAIService):
         self.ai = openai_service
 
-    async def generate_combat_narrative(self, 
-                                      actions: List[Dict], 
-                                      outcomes: List[str]) -> str:
-        """Generate a narrative description of combat events."""
-        prompt = (
+    @staticmethod
+    def _describe_action(action: CombatAction) -> str:
+        """Summarise a combat action without volatile fields such as timestamps."""
+        summary = f"{action.player.name} ({action.action_type}"
+        if action.target:
+            summary += f" -> {action.target}"
+        summary += ")"
+        if action.details:
+            summary += f": {action.details}"
+        return summary
+
+    def _combat_prompt(self, actions: List[CombatAction], outcomes: List[str]) -> str:
+        """Build the prompt for a combat narrative."""
+        return (
             "Create an engaging narrative description of the following combat:\n"
-            f"Actions taken: {actions}\n"
+            f"Actions taken: {[self._describe_action(action) for action in actions]}\n"
             f"Outcomes: {outcomes}\n"
             "Make it concise but dramatic."
         )
-        return await self.ai.generate_response(prompt)
+
+    def _location_prompt(self, biome: str, features: List[str]) -> str:
+        """Build the prompt for a location description."""
+        # Sort features so the same feature set always produces the same prompt
+        return (
+            f"Describe a location in a {biome} with the following features:\n"
+            f"{', '.join(sorted(features))}\n"
+            "Keep it concise but atmospheric."
+        )
+
+    async def generate_combat_narrative(self, 
+                                      actions: List[CombatAction], 
+                                      outcomes: List[str]) -> str:
+        """Generate a narrative description of combat events."""
+        return await self.ai.generate_response(
+            self._combat_prompt(actions, outcomes),
+            prompt_type="combat"
+        )
+
+    def stream_combat_narrative(self,
+                                actions: List[CombatAction],
+                                outcomes: List[str]) -> AsyncIterator[str]:
+        """Stream a narrative description of combat events."""
+        return self.ai.stream_response(
+            self._combat_prompt(actions, outcomes),
+            prompt_type="combat"
+        )
 
     async def generate_location_description(self, 
                                           biome: str, 
                                           features: List[str]) -> str:
         """Generate a description of a location."""
-        prompt = (
-            f"Describe a location in a {biome} with the following features:\n"
-            f"{', '.join(features)}\n"
+        return await self.ai.generate_response(
+            self._location_prompt(biome, features),
+            prompt_type="location"
+        )
+
+    def stream_location_description(self,
+                                    biome: str,
+                                    features: List[str]) -> AsyncIterator[str]:
+        """Stream a description of a location."""
+        return self.ai.stream_response(
+            self._location_prompt(biome, features),
+            prompt_type="location"
+        )
+
+    def _journey_prompt(self,
+                        waypoints: List[Tuple[str, List[str]]],
+                        biome: str,
+                        features: List[str]) -> str:
+        """Build the prompt narrating a multi-tile journey and its destination."""
+        stops = "; ".join(
+            f"{stop_biome} ({', '.join(sorted(stop_features))})" if stop_features else stop_biome
+            for stop_biome, stop_features in waypoints
+        )
+        return (
+            f"Narrate a journey that passes through: {stops or 'open country'}.\n"
+            f"It ends at a location in a {biome} with the following features:\n"
+            f"{', '.join(sorted(features))}\n"
+            "Summarise the journey in a sentence or two, then describe the destination. "
             "Keep it concise but atmospheric."
         )
-        return await self.ai.generate_response(prompt)
+
+    async def generate_journey_narrative(self,
+                                         waypoints: List[Tuple[str, List[str]]],
+                                         biome: str,
+                                         features: List[str]) -> str:
+        """Generate one narrative for a journey, given its notable waypoints and destination."""
+        return await self.ai.generate_response(
+            self._journey_prompt(waypoints, biome, features),
+            max_tokens=250,
+            prompt_type="journey"
+        )
+
+    def stream_journey_narrative(self,
+                                 waypoints: List[Tuple[str, List[str]]],
+                                 biome: str,
+                                 features: List[str]) -> AsyncIterator[str]:
+        """Stream one narrative for a journey."""
+        return self.ai.stream_response(
+            self._journey_prompt(waypoints, biome, features),
+            max_tokens=250,
+            prompt_type="journey"
+        )
 
     async def generate_quest_description(self, 
                                        location: tuple, 
@@ -42,4 +124,4 @@ class NarrativeService:
             f"Create a quest for a location at {location} with "
             f"difficulty level {difficulty} and theme: {theme}"
         )
-        return await self.ai.generate_response(prompt)
\ No newline at end of file
+        return await self.ai.generate_response(prompt, prompt_type="quest")
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from .openai_service import OpenAIService
+from .conversation_memory import ConversationMemory, Turn
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,15 +8,18 @@ logger = logging.getLogger(__name__)
 class NPCService:
     """Handles NPC interactions and dialogue."""
     
-    def __init__(self, openai_service: OpenAIService):
+    def __init__(self, openai_service: OpenAIService, memory: Optional[ConversationMemory] = None):
         self.ai = openai_service
+        self.memory = memory
+        if self.memory is not None and self.memory.summariser is None:
+            self.memory.summariser = self.summarise_conversation
 
-    async def generate_dialogue(self, 
-                              npc_name: str, 
-                              personality: str,
-                              player_message: str,
-                              context: Optional[str] = None) -> str:
-        """Generate NPC dialogue response."""
+    def _dialogue_prompts(self,
+                          npc_name: str,
+                          personality: str,
+                          player_message: str,
+                          context: Optional[str]) -> Tuple[str, str]:
+        """Build the (prompt, system_prompt) pair for NPC dialogue."""
         system_prompt = (
             f"You are {npc_name}, a character with a {personality} personality. "
             "Respond in character, keeping responses concise and natural."
@@ -24,19 +28,87 @@ class NPCService:
         prompt = player_message
         if context:
             prompt = f"Context: {context}\nPlayer says: {player_message}"
+        return prompt, system_prompt
 
-        return await self.ai.generate_response(
+    def _with_history(self,
+                      player_id: Optional[str],
+                      npc_name: str,
+                      context: Optional[str]) -> Optional[str]:
+        """Prepend remembered conversation history to the caller's context."""
+        if self.memory is None or player_id is None:
+            return context
+        history = self.memory.build_context(player_id, npc_name)
+        if not history:
+            return context
+        return f"{context}\n{history}" if context else history
+
+    async def generate_dialogue(self, 
+                              npc_name: str, 
+                              personality: str,
+                              player_message: str,
+                              context: Optional[str] = None,
+                              player_id: Optional[str] = None) -> str:
+        """Generate NPC dialogue response, remembering the exchange if a player_id is given."""
+        context = self._with_history(player_id, npc_name, context)
+        prompt, system_prompt = self._dialogue_prompts(npc_name, personality, player_message, context)
+        reply = await self.ai.generate_response(
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=0.8
         )
+        if self.memory is not None and player_id is not None:
+            self.memory.record(player_id, npc_name, player_message, reply)
+        return reply
+
+    def stream_dialogue(self,
+                        npc_name: str,
+                        personality: str,
+                        player_message: str,
+                        context: Optional[str] = None,
+                        player_id: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream an NPC dialogue response, remembering the exchange if a player_id is given."""
+        context = self._with_history(player_id, npc_name, context)
+        prompt, system_prompt = self._dialogue_prompts(npc_name, personality, player_message, context)
+        chunks = self.ai.stream_response(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=0.8
+        )
+        if self.memory is None or player_id is None:
+            return chunks
+        return self._remember_stream(chunks, player_id, npc_name, player_message)
+
+    async def _remember_stream(self,
+                               chunks: AsyncIterator[str],
+                               player_id: str,
+                               npc_name: str,
+                               player_message: str) -> AsyncIterator[str]:
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self.memory.record(player_id, npc_name, player_message, "".join(parts))
+
+    async def summarise_conversation(self, summary: str, turns: List[Turn]) -> str:
+        """Fold older conversation turns into a short rolling summary."""
+        transcript = "\n".join(f"Player: {player}\nNPC: {npc}" for player, npc in turns)
+        prompt = (
+            f"Previous summary: {summary or 'None'}\n"
+            f"New exchanges:\n{transcript}\n"
+            "Update the summary in two or three sentences, keeping names, promises and facts."
+        )
+        return await self.ai.generate_response(
+            prompt,
+            temperature=0.2,
+            max_tokens=self.memory.summary_tokens
+        )
 
     async def generate_merchant_interaction(self, 
                                           inventory: list,
                                           player_request: str) -> str:
         """Generate merchant-specific dialogue and offers."""
         prompt = (
-            f"As a merchant with the following inventory: {inventory}\n"
+            f"As a merchant with the following inventory: {sorted(inventory)}\n"
             f"Respond to the player's request: {player_request}"
         )
-        return await self.ai.generate_response(prompt)
\ No newline at end of file
+        return await self.ai.generate_response(prompt, prompt_type="merchant")
@@ -1,37 +1,126 @@
-from typing import Dict, Optional
-import openai
+from typing import AsyncIterator, Dict, List, Optional
+import time
 import logging
 from core.config import Config
+from .backends import Completion, CompletionBackend, OpenAIBackend
+from .response_cache import ResponseCache
+from .usage_tracker import UsageTracker
 
 logger = logging.getLogger("openai_service")
 
 class OpenAIService:
     """Base service for OpenAI API interactions."""
     
-    def __init__(self, config: Config):
+    def __init__(self, 
+                 config: Config, 
+                 model: str = "gpt-3.5-turbo",
+                 cache: Optional[ResponseCache] = None,
+                 backend: Optional[CompletionBackend] = None,
+                 usage_tracker: Optional[UsageTracker] = None):
         self.api_key = config.openai_api_key
-        openai.api_key = self.api_key
+        self.model = model
+        self.cache = cache
+        self.backend = backend or OpenAIBackend(self.api_key)
+        self.usage_tracker = usage_tracker
+
+    def _record_usage(self, started: float, usage: Optional[Completion] = None) -> None:
+        """Record a call with the usage tracker; no usage means it was served from cache."""
+        if self.usage_tracker is None:
+            return
+        self.usage_tracker.record(
+            self.model,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            cache_hit=usage is None
+        )
+
+    def _build_messages(self, prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """Build the chat message list for a prompt."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _cache_key(self,
+                   prompt_type: Optional[str],
+                   prompt: str,
+                   system_prompt: Optional[str],
+                   temperature: float,
+                   max_tokens: int) -> Optional[str]:
+        """Return the response cache key for a call, or None if it should not be cached."""
+        if self.cache is None or prompt_type is None:
+            return None
+        return self.cache.make_key(prompt, system_prompt, self.model, temperature, max_tokens)
 
     async def generate_response(self, 
                               prompt: str, 
                               system_prompt: Optional[str] = None,
                               temperature: float = 0.7,
-                              max_tokens: int = 150) -> str:
-        """Generate a response using OpenAI's API."""
+                              max_tokens: int = 150,
+                              prompt_type: Optional[str] = None) -> str:
+        """Generate a response using OpenAI's API.
+
+        Passing a prompt_type opts the call into the response cache.
+        """
+        started = time.perf_counter()
+        key = self._cache_key(prompt_type, prompt, system_prompt, temperature, max_tokens)
+        if key:
+            cached = self.cache.get(prompt_type, key)
+            if cached is not None:
+                self._record_usage(started)
+                return cached
+
         try:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            response = openai.beta.chat.completions.parse(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
+            completion = await self.backend.complete(
+                self._build_messages(prompt, system_prompt),
+                self.model,
+                temperature,
+                max_tokens
             )
-            logger.debug(f"OpenAI response: {response}")
-            return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {e}")
-            raise
\ No newline at end of file
+            raise
+
+        self._record_usage(started, completion)
+        if key:
+            self.cache.put(prompt_type, key, completion.text)
+        return completion.text
+
+    async def stream_response(self,
+                              prompt: str,
+                              system_prompt: Optional[str] = None,
+                              temperature: float = 0.7,
+                              max_tokens: int = 150,
+                              prompt_type: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream a response from OpenAI's API, yielding text as it arrives."""
+        started = time.perf_counter()
+        key = self._cache_key(prompt_type, prompt, system_prompt, temperature, max_tokens)
+        if key:
+            cached = self.cache.get(prompt_type, key)
+            if cached is not None:
+                self._record_usage(started)
+                yield cached
+                return
+
+        parts = []
+        usage = Completion(text="")
+        try:
+            async for chunk in self.backend.stream(
+                self._build_messages(prompt, system_prompt),
+                self.model,
+                temperature,
+                max_tokens,
+                usage
+            ):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming OpenAI response: {e}")
+            raise
+
+        usage.text = "".join(parts)
+        self._record_usage(started, usage)
+        if key:
+            self.cache.put(prompt_type, key, usage.text)
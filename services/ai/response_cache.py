@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import random
+import re
+import time
+import logging
+from data.database.repositories.response_cache_repository import ResponseCacheRepository
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CachePolicy:
+    """Caching rules for one type of prompt."""
+    ttl: float
+    variants: int = 1
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one type of prompt."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+@dataclass
+class _CacheEntry:
+    prompt_type: str
+    # (slot, created_at, response); the slot is the variant's row number on disk
+    variants: List[Tuple[int, float, str]] = field(default_factory=list)
+
+class ResponseCache:
+    """Two-tier (in-memory LRU plus SQLite) cache of AI responses keyed on prompt content."""
+
+    DEFAULT_POLICIES = {
+        "location": CachePolicy(ttl=7 * 24 * 3600, variants=3),
+        "combat": CachePolicy(ttl=24 * 3600, variants=3),
+        "merchant": CachePolicy(ttl=3600, variants=2),
+        "quest": CachePolicy(ttl=24 * 3600, variants=3),
+    }
+    DEFAULT_POLICY = CachePolicy(ttl=3600, variants=1)
+
+    def __init__(self,
+                 repository: Optional[ResponseCacheRepository] = None,
+                 max_entries: int = 1024,
+                 max_rows: int = 50000,
+                 policies: Optional[Dict[str, CachePolicy]] = None,
+                 prune_interval: int = 100):
+        self.repository = repository
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.policies = {**self.DEFAULT_POLICIES, **(policies or {})}
+        self.prune_interval = prune_interval
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._stats: Dict[str, CacheStats] = {}
+        self._writes_since_prune = 0
+
+    @staticmethod
+    def make_key(prompt: str,
+                 system_prompt: Optional[str],
+                 model: str,
+                 temperature: float,
+                 max_tokens: int) -> str:
+        """Build a content-addressed key from a canonicalised prompt and model parameters."""
+        canonical = {
+            "prompt": re.sub(r"\s+", " ", prompt).strip(),
+            "system": re.sub(r"\s+", " ", system_prompt).strip() if system_prompt else None,
+            "model": model,
+            "temperature": round(temperature, 3),
+            "max_tokens": max_tokens,
+        }
+        encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def policy_for(self, prompt_type: str) -> CachePolicy:
+        """Get the caching policy for a prompt type."""
+        return self.policies.get(prompt_type, self.DEFAULT_POLICY)
+
+    def get(self, prompt_type: str, key: str) -> Optional[str]:
+        """Return a cached response, or None if a (new) variant should be generated."""
+        policy = self.policy_for(prompt_type)
+        stats = self._stats.setdefault(prompt_type, CacheStats())
+        not_before = time.time() - policy.ttl
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            entry.variants = [v for v in entry.variants if v[1] >= not_before]
+            if len(entry.variants) >= policy.variants:
+                stats.memory_hits += 1
+                return random.choice(entry.variants)[2]
+        elif self.repository is not None:
+            variants = self.repository.get_variants(key, not_before)
+            if variants:
+                entry = self._store_entry(key, _CacheEntry(prompt_type, list(variants)))
+                if len(entry.variants) >= policy.variants:
+                    stats.disk_hits += 1
+                    return random.choice(entry.variants)[2]
+
+        stats.misses += 1
+        return None
+
+    def put(self, prompt_type: str, key: str, response: str) -> None:
+        """Store a freshly generated response as a variant for a key."""
+        policy = self.policy_for(prompt_type)
+        created_at = time.time()
+        not_before = created_at - policy.ttl
+
+        entry = self._entries.get(key)
+        if entry is None:
+            # Unexpired rows already on disk keep their slots
+            variants = self.repository.get_variants(key, not_before) if self.repository is not None else []
+            entry = self._store_entry(key, _CacheEntry(prompt_type, list(variants)))
+        self._entries.move_to_end(key)
+        entry.variants = [v for v in entry.variants if v[1] >= not_before]
+
+        # Reuse a slot that is empty or holds an expired row, else replace the oldest variant
+        free = set(range(policy.variants)).difference(v[0] for v in entry.variants)
+        if free:
+            slot = min(free)
+        else:
+            oldest = min(entry.variants, key=lambda v: v[1])
+            slot = oldest[0]
+            entry.variants.remove(oldest)
+        entry.variants.append((slot, created_at, response))
+
+        if self.repository is not None:
+            self.repository.save_variant(key, slot, prompt_type, response, created_at)
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.prune_interval:
+                self._writes_since_prune = 0
+                self.prune(created_at)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired rows of every known prompt type and cap the table size."""
+        if self.repository is None:
+            return 0
+        now = time.time() if now is None else now
+        deleted = 0
+        for prompt_type in set(self.policies) | set(self._stats):
+            deleted += self.repository.delete_expired(prompt_type, now - self.policy_for(prompt_type).ttl)
+        return deleted + self.repository.prune(self.max_rows)
+
+    def _store_entry(self, key: str, entry: _CacheEntry) -> _CacheEntry:
+        """Insert an entry into the memory tier, evicting the least recently used."""
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get hit/miss counters and hit ratios per prompt type, plus a total."""
+        total = CacheStats()
+        report = {}
+        for prompt_type, stats in self._stats.items():
+            total.memory_hits += stats.memory_hits
+            total.disk_hits += stats.disk_hits
+            total.misses += stats.misses
+            report[prompt_type] = self._format_stats(stats)
+        report["total"] = self._format_stats(total)
+        return report
+
+    @staticmethod
+    def _format_stats(stats: CacheStats) -> Dict[str, float]:
+        return {
+            "memory_hits": stats.memory_hits,
+            "disk_hits": stats.disk_hits,
+            "misses": stats.misses,
+            "hit_ratio": stats.hit_ratio,
+        }
@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import logging
+from data.database.repositories.usage_repository import UsageRepository
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class UsageContext:
+    """Who and what an AI call is made on behalf of."""
+    command: str = "background"
+    guild_id: Optional[str] = None
+    player_id: Optional[str] = None
+
+# Set once per command invocation; tasks spawned by the command inherit it
+usage_context: ContextVar[UsageContext] = ContextVar("usage_context", default=UsageContext())
+
+@contextmanager
+def attribute_usage(command: str,
+                    guild_id: Optional[str] = None,
+                    player_id: Optional[str] = None) -> Iterator[UsageContext]:
+    """Attribute AI usage inside the block to a command, guild and player."""
+    context = UsageContext(command, guild_id, player_id)
+    token = usage_context.set(context)
+    try:
+        yield context
+    finally:
+        usage_context.reset(token)
+
+@dataclass
+class UsageTotals:
+    """Aggregated usage for one (day, command, guild, player, model) bucket."""
+    calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+    cost: float = 0.0
+
+class UsageTracker:
+    """Records per-call AI token usage, aggregates it in memory and flushes it to SQLite in batches."""
+
+    # USD per 1K (prompt, completion) tokens
+    MODEL_PRICES = {
+        "gpt-3.5-turbo": (0.0005, 0.0015),
+        "gpt-4o-mini": (0.00015, 0.0006),
+        "gpt-4o": (0.0025, 0.01),
+    }
+
+    def __init__(self, repository: Optional[UsageRepository] = None, flush_interval: float = 60.0):
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self._pending: Dict[Tuple[str, str, str, str, str], UsageTotals] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """Estimate the USD cost of a call."""
+        prompt_price, completion_price = self.MODEL_PRICES.get(model, (0.0, 0.0))
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+    def record(self,
+               model: str,
+               prompt_tokens: int = 0,
+               completion_tokens: int = 0,
+               latency_ms: float = 0.0,
+               cache_hit: bool = False) -> None:
+        """Record one AI call against the current usage context."""
+        context = usage_context.get()
+        key = (
+            date.today().isoformat(),
+            context.command,
+            context.guild_id or "",
+            context.player_id or "",
+            model
+        )
+        totals = self._pending.get(key)
+        if totals is None:
+            totals = self._pending[key] = UsageTotals()
+        totals.calls += 1
+        totals.cache_hits += int(cache_hit)
+        totals.prompt_tokens += prompt_tokens
+        totals.completion_tokens += completion_tokens
+        totals.latency_ms += latency_ms
+        totals.cost += self.estimate_cost(model, prompt_tokens, completion_tokens)
+
+    def flush(self) -> int:
+        """Write pending usage to the database and return the number of buckets written."""
+        if not self._pending or self.repository is None:
+            return 0
+        pending, self._pending = self._pending, {}
+        rows = [
+            key + (t.calls, t.cache_hits, t.prompt_tokens, t.completion_tokens, t.latency_ms, t.cost)
+            for key, t in pending.items()
+        ]
+        try:
+            self.repository.add_usage(rows)
+        except Exception as e:
+            logger.error(f"Failed to flush AI usage, will retry: {e}")
+            for key, totals in pending.items():
+                self._merge(key, totals)
+            return 0
+        logger.debug(f"Flushed {len(rows)} AI usage buckets")
+        return len(rows)
+
+    def _merge(self, key: Tuple[str, str, str, str, str], totals: UsageTotals) -> None:
+        current = self._pending.setdefault(key, UsageTotals())
+        current.calls += totals.calls
+        current.cache_hits += totals.cache_hits
+        current.prompt_tokens += totals.prompt_tokens
+        current.completion_tokens += totals.completion_tokens
+        current.latency_ms += totals.latency_ms
+        current.cost += totals.cost
+
+    def start(self) -> None:
+        """Start the periodic flush loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write any remaining usage."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def summary(self,
+                group_by: str = "command",
+                since_day: Optional[str] = None,
+                limit: int = 10) -> List[Dict[str, Any]]:
+        """Flush, then report the heaviest consumers grouped by command, guild_id, player_id, model or day."""
+        self.flush()
+        if self.repository is None:
+            return []
+        return self.repository.get_usage_summary(group_by, since_day, limit)
@@ -2,12 +2,27 @@ from .command_handler import GameCommandHandler
 from .character_commands import CharacterCommands
 from .combat_commands import CombatCommands
 from .exploration_commands import ExplorationCommands
+from .quest_commands import QuestCommands
 from .base_handler import BaseCommandHandler
+from .streaming import StreamingMessage
+from .outbound_queue import OutboundQueue
+from .admission import CommandAdmission
+from .slash_commands import SlashCommandHandler, InteractionContext
+from .shard_monitor import ShardMonitor
+from .message_formatter import MessageFormatter
 
 __all__ = [
     'GameCommandHandler',
     'CharacterCommands',
     'CombatCommands',
     'ExplorationCommands',
-    'BaseCommandHandler'
+    'QuestCommands',
+    'BaseCommandHandler',
+    'StreamingMessage',
+    'OutboundQueue',
+    'CommandAdmission',
+    'SlashCommandHandler',
+    'InteractionContext',
+    'ShardMonitor',
+    'MessageFormatter'
 ]
\ No newline at end of file
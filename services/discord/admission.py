@@ -0,0 +1,85 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+import asyncio
+import time
+import logging
+from core.exceptions import CommandBusyError
+from utils.metrics import LatencyStats
+
+logger = logging.getLogger("admission")
+
+class CommandAdmission:
+    """Admission control for commands: one in-flight command per user and bounded per-guild concurrency."""
+
+    def __init__(self,
+                 guild_concurrency: int = 8,
+                 guild_queue_limit: int = 32,
+                 user_queue_limit: int = 2):
+        self.guild_concurrency = guild_concurrency
+        self.guild_queue_limit = guild_queue_limit
+        self.user_queue_limit = user_queue_limit
+        self.wait_time = LatencyStats()
+        self.admitted = 0
+        self.shed = 0
+        self._user_locks: Dict[str, asyncio.Lock] = {}
+        self._user_pending: Dict[str, int] = {}
+        self._guild_slots: Dict[str, asyncio.Semaphore] = {}
+        self._guild_pending: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def admit(self, user_id: str, guild_id: Optional[str]) -> AsyncIterator[None]:
+        """Wait for the user's and guild's turn, or raise CommandBusyError if their queues are full."""
+        # Pending counts include the running command as well as queued ones
+        if self._user_pending.get(user_id, 0) >= 1 + self.user_queue_limit:
+            self.shed += 1
+            raise CommandBusyError("You already have commands in progress. Please wait a moment and try again.")
+        if guild_id is not None and (
+            self._guild_pending.get(guild_id, 0) >= self.guild_concurrency + self.guild_queue_limit
+        ):
+            self.shed += 1
+            logger.warning(f"Shedding command in busy guild {guild_id}")
+            raise CommandBusyError("The game is busy right now. Please try again in a few seconds.")
+
+        user_lock = self._user_locks.setdefault(user_id, asyncio.Lock())
+        self._user_pending[user_id] = self._user_pending.get(user_id, 0) + 1
+        guild_slots = None
+        if guild_id is not None:
+            guild_slots = self._guild_slots.setdefault(guild_id, asyncio.Semaphore(self.guild_concurrency))
+            self._guild_pending[guild_id] = self._guild_pending.get(guild_id, 0) + 1
+
+        started = time.perf_counter()
+        try:
+            async with user_lock:
+                if guild_slots is None:
+                    self._admitted(started)
+                    yield
+                else:
+                    async with guild_slots:
+                        self._admitted(started)
+                        yield
+        finally:
+            self._release(self._user_pending, self._user_locks, user_id)
+            if guild_id is not None:
+                self._release(self._guild_pending, self._guild_slots, guild_id)
+
+    def _admitted(self, started: float) -> None:
+        self.admitted += 1
+        self.wait_time.record(time.perf_counter() - started)
+
+    @staticmethod
+    def _release(pending: Dict[str, int], primitives: Dict[str, Any], key: str) -> None:
+        """Decrement a pending count, dropping idle keys so the maps stay small."""
+        pending[key] -= 1
+        if not pending[key]:
+            del pending[key]
+            del primitives[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Report admissions, shed commands and admission wait time."""
+        return {
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "active_users": len(self._user_pending),
+            "active_guilds": len(self._guild_pending),
+            "wait_ms": self.wait_time.summary(),
+        }
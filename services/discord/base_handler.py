@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 from discord.ext import commands
 from core.exceptions import GameError
 from data.models.character import Character
+from .streaming import StreamingMessage
+from .outbound_queue import OutboundQueue
 import logging
 
 logger = logging.getLogger("base_handler")
@@ -9,8 +11,13 @@ logger = logging.getLogger("base_handler")
 class BaseCommandHandler:
     """Base class for command handlers with common utilities."""
     
-    def __init__(self, bot: commands.Bot):
+    def __init__(self, 
+                 bot: commands.Bot, 
+                 stream_edit_interval: float = 1.0,
+                 outbound: Optional[OutboundQueue] = None):
         self.bot = bot
+        self.stream_edit_interval = stream_edit_interval
+        self.outbound = outbound
 
     async def handle_error(self, ctx: commands.Context, error: Exception) -> None:
         """Handle command errors uniformly."""
@@ -26,4 +33,27 @@ class BaseCommandHandler:
         if not character:
             await ctx.send("You don't have a character yet! Use `!create` to start.")
             return None
-        return character
\ No newline at end of file
+        return character
+
+    async def send(self, ctx: commands.Context, content: str) -> None:
+        """Send a low-priority message that may be coalesced with others in the channel."""
+        # Interactions must answer through their own follow-ups, so never queue them
+        if self.outbound is None or getattr(ctx, "interaction", None) is not None:
+            await ctx.send(content)
+        else:
+            self.outbound.enqueue(ctx.channel, content)
+
+    async def notify(self, channel, content: str) -> None:
+        """Send a low-priority message to a channel other than the invoking one."""
+        if self.outbound is None:
+            await channel.send(content)
+        else:
+            self.outbound.enqueue(channel, content)
+
+    async def send_streamed(self, ctx: commands.Context, chunks: AsyncIterator[str], header: str = "") -> str:
+        """Send streamed text as a single progressively edited message."""
+        if self.outbound is not None:
+            # Keep queued messages ahead of the streamed one
+            await self.outbound.flush(ctx.channel)
+        streamer = StreamingMessage(ctx, header=header, edit_interval=self.stream_edit_interval)
+        return await streamer.stream(chunks)
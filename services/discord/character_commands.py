@@ -1,14 +1,21 @@
+from typing import Optional
 from discord.ext import commands
 from .base_handler import BaseCommandHandler
+from .outbound_queue import OutboundQueue
+from .message_formatter import MessageFormatter
 from services.game.character_service import CharacterService
+from services.game.leaderboard import Leaderboards
 import logging
 
 logger = logging.getLogger("character_commands")
 
 class CharacterCommands(BaseCommandHandler):
-    def __init__(self, bot: commands.Bot, character_service: CharacterService):
-        super().__init__(bot)
+    def __init__(self, bot: commands.Bot, character_service: CharacterService,
+                 outbound: Optional[OutboundQueue] = None,
+                 formatter: Optional[MessageFormatter] = None):
+        super().__init__(bot, outbound=outbound)
         self.character_service = character_service
+        self.formatter = formatter or MessageFormatter()
 
     async def create(self, ctx: commands.Context, *, character_name: str):
         """Create a new character."""
@@ -28,14 +35,7 @@ class CharacterCommands(BaseCommandHandler):
         if not character:
             return
 
-        stats = "\n".join([f"{stat}: {value}" for stat, value in character.stats.items()])
-        await ctx.send(
-            f"**{character.name}'s Stats:**\n"
-            f"Class: {character.player_class}\n"
-            f"Level: {character.level}\n"
-            f"{stats}\n"
-            f"Location: {character.location}"
-        )
+        await ctx.send(embed=self.formatter.character_info(character))
 
     async def allocate(self, ctx: commands.Context, hp: int = 0, attack: int = 0, 
                       defense: int = 0, magic: int = 0):
@@ -50,4 +50,21 @@ class CharacterCommands(BaseCommandHandler):
             else:
                 await ctx.send("You don't have a character yet! Use `!create` to start.")
         except ValueError as e:
-            await ctx.send(str(e))
\ No newline at end of file
+            await ctx.send(str(e))
+
+    async def leaderboard(self, ctx: commands.Context, board: str = "quests"):
+        """Show the top players by quests completed, level or XP, and the invoker's rank."""
+        leaderboards = self.character_service.leaderboards
+        if leaderboards is None or board not in leaderboards.BOARDS:
+            await ctx.send(f"Leaderboards: {', '.join(Leaderboards.BOARDS)}.")
+            return
+
+        ranking = leaderboards[board]
+        lines = []
+        for position, (discord_id, score) in enumerate(ranking.top(10), start=1):
+            character = self.character_service.get_character(discord_id)
+            lines.append(f"{position}. {character.name if character else discord_id}: {score}")
+        rank = ranking.rank(str(ctx.author.id))
+        if rank is not None:
+            lines.append(f"\nYou are #{rank} of {len(ranking)}.")
+        await ctx.send(f"**Leaderboard: {board}**\n" + ("\n".join(lines) if lines else "No entries yet."))
@@ -1,5 +1,8 @@
+from typing import Optional
 from discord.ext import commands
 from .base_handler import BaseCommandHandler
+from .outbound_queue import OutboundQueue
+from .message_formatter import MessageFormatter
 from services.game.combat_service import CombatService
 from services.game.character_service import CharacterService
 import logging
@@ -7,10 +10,13 @@ import logging
 logger = logging.getLogger("combat_commands")
 
 class CombatCommands(BaseCommandHandler):
-    def __init__(self, bot: commands.Bot, combat_service: CombatService, character_service: CharacterService):
-        super().__init__(bot)
+    def __init__(self, bot: commands.Bot, combat_service: CombatService, character_service: CharacterService,
+                 outbound: Optional[OutboundQueue] = None,
+                 formatter: Optional[MessageFormatter] = None):
+        super().__init__(bot, outbound=outbound)
         self.combat_service = combat_service
         self.character_service = character_service
+        self.formatter = formatter or MessageFormatter()
 
     async def start_combat(self, ctx: commands.Context):
         """Start a combat session."""
@@ -18,8 +24,12 @@ class CombatCommands(BaseCommandHandler):
         if not character:
             return
 
-        result = self.combat_service.start_combat([character])
-        await ctx.send(result)
+        try:
+            message, _ = self.combat_service.start_combat([character])
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+        await ctx.send(message)
         logger.info(f"{character.name} started a combat session.")
 
     async def action(self, ctx: commands.Context, *, action: str):
@@ -29,8 +39,8 @@ class CombatCommands(BaseCommandHandler):
             return
 
         try:
-            result = self.combat_service.add_action(character, action)
-            await ctx.send(f"{character.name}, your action '{action}' has been recorded.")
+            self.combat_service.add_action(character, action)
+            await self.send(ctx, f"{character.name}, your action '{action}' has been recorded.")
             logger.info(f"{character.name} performed action: {action}")
         except ValueError as e:
             await ctx.send(str(e))
@@ -39,9 +49,24 @@ class CombatCommands(BaseCommandHandler):
     async def resolve(self, ctx: commands.Context):
         """Resolve the current combat round."""
         try:
-            narrative = await self.combat_service.resolve_round()
-            await ctx.send(f"**Combat Round Results:**\n{narrative}")
+            await self.send_streamed(
+                ctx,
+                self.combat_service.stream_round(),
+                header="**Combat Round Results:**\n"
+            )
             logger.info("Combat round resolved successfully.")
+            combat = self.combat_service.current_combat
+            if not combat.is_active:
+                # Persist everyone's end-of-fight state in one batch
+                self.character_service.update_characters(combat.players)
         except ValueError as e:
             await ctx.send(str(e))
-            logger.error(f"Error resolving combat round: {e}")
\ No newline at end of file
+            logger.error(f"Error resolving combat round: {e}")
+
+    async def status(self, ctx: commands.Context, page: int = 1):
+        """Show a page of the current combat board."""
+        combat = self.combat_service.current_combat
+        if not combat or not combat.is_active:
+            await ctx.send("No active combat session")
+            return
+        await ctx.send(embed=self.formatter.combat_status(combat, page - 1))
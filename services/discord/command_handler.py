@@ -1,7 +1,16 @@
+from typing import Optional
+import time
 from discord.ext import commands
 from .character_commands import CharacterCommands
 from .combat_commands import CombatCommands
 from .exploration_commands import ExplorationCommands
+from .quest_commands import QuestCommands
+from .outbound_queue import OutboundQueue
+from .message_formatter import MessageFormatter
+from .admission import CommandAdmission
+from core.exceptions import CommandBusyError
+from services.ai.usage_tracker import attribute_usage
+from utils.metrics import LatencyRegistry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,11 +21,44 @@ class GameCommandHandler:
     def __init__(self, bot: commands.Bot, 
                  character_service, 
                  combat_service,
-                 world_service,):
+                 world_service,
+                 outbound: Optional[OutboundQueue] = None,
+                 admission: Optional[CommandAdmission] = None,
+                 quest_service=None):
         self.bot = bot
-        self.character_commands = CharacterCommands(bot, character_service)
-        self.combat_commands = CombatCommands(bot, combat_service, character_service)
-        self.exploration_commands = ExplorationCommands(bot, world_service, character_service)
+        self.outbound = outbound
+        self.admission = admission
+        self.latency = LatencyRegistry()
+        self.formatter = MessageFormatter()
+        self.character_commands = CharacterCommands(bot, character_service, outbound, self.formatter)
+        self.combat_commands = CombatCommands(bot, combat_service, character_service, outbound, self.formatter)
+        self.exploration_commands = ExplorationCommands(bot, world_service, character_service, outbound)
+        self.quest_commands = (
+            QuestCommands(bot, quest_service, character_service, outbound) if quest_service is not None else None
+        )
+
+    async def _dispatch(self, ctx: commands.Context, handler, *args, **kwargs) -> None:
+        """Run a command handler from either the prefix or slash path.
+
+        Attributes AI usage to the invoker, applies admission control and records
+        latency per (path, command).
+        """
+        started = time.perf_counter()
+        path = "slash" if getattr(ctx, "interaction", None) is not None else "prefix"
+        command = ctx.command.qualified_name
+        guild_id = str(ctx.guild.id) if ctx.guild else None
+
+        try:
+            with attribute_usage(command, guild_id, str(ctx.author.id)):
+                if self.admission is None:
+                    await handler(ctx, *args, **kwargs)
+                else:
+                    async with self.admission.admit(str(ctx.author.id), guild_id):
+                        await handler(ctx, *args, **kwargs)
+        except CommandBusyError as e:
+            await ctx.send(str(e))
+        finally:
+            self.latency.get(path, command).record(time.perf_counter() - started)
 
     def register_commands(self):
         """Register all commands with the bot."""
@@ -24,37 +66,63 @@ class GameCommandHandler:
         # Character Commands
         @self.bot.command(name="create")
         async def create(ctx, *, character_name: str):
-            await self.character_commands.create(ctx, character_name=character_name)
+            await self._dispatch(ctx, self.character_commands.create, character_name=character_name)
 
         @self.bot.command(name="view")
         async def view(ctx):
-            await self.character_commands.view(ctx)
+            await self._dispatch(ctx, self.character_commands.view)
 
         @self.bot.command(name="allocate")
         async def allocate(ctx, hp: int = 0, attack: int = 0, defense: int = 0, magic: int = 0):
-            await self.character_commands.allocate(ctx, hp, attack, defense, magic)
+            await self._dispatch(ctx, self.character_commands.allocate, hp, attack, defense, magic)
+
+        @self.bot.command(name="leaderboard")
+        async def leaderboard(ctx, board: str = "quests"):
+            await self._dispatch(ctx, self.character_commands.leaderboard, board.lower())
 
         # Combat Commands
         @self.bot.command(name="combat")
         async def combat(ctx):
-            await self.combat_commands.start_combat(ctx)
+            await self._dispatch(ctx, self.combat_commands.start_combat)
 
         @self.bot.command(name="action")
         async def action(ctx, *, action: str):
-            await self.combat_commands.action(ctx, action=action)
+            await self._dispatch(ctx, self.combat_commands.action, action=action)
 
         @self.bot.command(name="resolve")
         async def resolve(ctx):
-            await self.combat_commands.resolve(ctx)
+            await self._dispatch(ctx, self.combat_commands.resolve)
+
+        @self.bot.command(name="status")
+        async def status(ctx, page: int = 1):
+            await self._dispatch(ctx, self.combat_commands.status, page)
 
         # Exploration Commands
         @self.bot.command(name="explore")
         async def explore(ctx):
-            await self.exploration_commands.explore(ctx)
+            await self._dispatch(ctx, self.exploration_commands.explore)
 
         @self.bot.command(name="move")
         async def move(ctx, direction: str):
-            await self.exploration_commands.move(ctx, direction)
+            await self._dispatch(ctx, self.exploration_commands.move, direction)
+
+        @self.bot.command(name="travel")
+        async def travel(ctx, x: int, y: int):
+            await self._dispatch(ctx, self.exploration_commands.travel, x, y)
+
+        @self.bot.command(name="map")
+        async def map_(ctx, style: str = "text"):
+            await self._dispatch(ctx, self.exploration_commands.map, style.lower() in ("png", "image"))
+
+        # Quest Commands
+        if self.quest_commands is not None:
+            @self.bot.command(name="quests")
+            async def quests(ctx):
+                await self._dispatch(ctx, self.quest_commands.quests)
+
+            @self.bot.command(name="accept")
+            async def accept(ctx, quest_id: int):
+                await self._dispatch(ctx, self.quest_commands.accept, quest_id)
 
         # Error Handler
         @self.bot.event
@@ -1,16 +1,47 @@
+from typing import Dict, Optional, Set, Tuple
+import io
+import discord
 from discord.ext import commands
 from .base_handler import BaseCommandHandler
+from .outbound_queue import OutboundQueue
 from services.game.world_service import WorldService
 from services.game.character_service import CharacterService
+from data.models.character import Character
 import logging
 
 logger = logging.getLogger(__name__)
 
 class ExplorationCommands(BaseCommandHandler):
-    def __init__(self, bot: commands.Bot, world_service: WorldService, character_service: CharacterService):
-        super().__init__(bot)
+    def __init__(self, bot: commands.Bot, world_service: WorldService, character_service: CharacterService,
+                 outbound: Optional[OutboundQueue] = None):
+        super().__init__(bot, outbound=outbound)
         self.world_service = world_service
         self.character_service = character_service
+        # Where each player last used an exploration command, for arrival notices;
+        # forgotten when the player drops out of the presence index
+        self._channels: Dict[str, object] = {}
+        world_service.presence.on_leave(lambda player_id: self._channels.pop(player_id, None))
+
+    def _arrive(self, ctx: commands.Context, location: Tuple[int, int]) -> Set[str]:
+        """Record where the invoking player is and return who else is on that tile."""
+        player_id = str(ctx.author.id)
+        self._channels[player_id] = ctx.channel
+        return self.world_service.track_player(player_id, location)
+
+    async def _announce(self, ctx: commands.Context, character: Character,
+                        others: Set[str], arrived: bool = True) -> None:
+        """Tell the player who is here and, on arrival, tell them the player has arrived."""
+        names = []
+        for player_id in sorted(others):
+            other = self.character_service.get_character(player_id)
+            if other is None:
+                continue
+            names.append(other.name)
+            channel = self._channels.get(player_id)
+            if arrived and channel is not None:
+                await self.notify(channel, f"<@{player_id}> {character.name} has arrived at {character.location}.")
+        if names:
+            await self.send(ctx, f"Also here: {', '.join(names)}.")
 
     async def explore(self, ctx: commands.Context):
         """Explore the current location."""
@@ -18,8 +49,17 @@ class ExplorationCommands(BaseCommandHandler):
         if not character:
             return
 
-        description = self.world_service.get_location_description(character.location)
-        await ctx.send(description)
+        others = self._arrive(ctx, character.location)
+        self.character_service.record_discovery(str(ctx.author.id), character, [character.location])
+        try:
+            description = await self.send_streamed(
+                ctx,
+                self.world_service.stream_location_description(character.location)
+            )
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+        await self._announce(ctx, character, others, arrived=False)
         logger.info(f"{character.name} explored the location: {description}")
 
     async def move(self, ctx: commands.Context, direction: str):
@@ -30,13 +70,70 @@ class ExplorationCommands(BaseCommandHandler):
 
         try:
             current_location = character.location
-            new_location, description = await self.world_service.move_character(current_location, direction.lower())
+            new_location = self.world_service.resolve_move(current_location, direction.lower())
+            chunks = self.world_service.stream_location_description(new_location)
             
             # Update the character's location if necessary
             character.location = new_location
+            self.character_service.update_character(str(ctx.author.id), character)
+            self.character_service.record_discovery(str(ctx.author.id), character, [new_location])
+            others = self._arrive(ctx, new_location)
             
-            await ctx.send(description)  # Send the description of the new location
+            # Stream the description of the new location
+            description = await self.send_streamed(ctx, chunks)
+            await self._announce(ctx, character, others)
+            # Warm the likely next tiles only once this move's text is out
+            self.world_service.prefetch_neighbours(new_location, direction.lower())
             logger.info(f"{character.name} moved {direction} to {new_location}: {description}")
         except ValueError as e:
             await ctx.send(str(e))
-            logger.error(f"Error moving character {character.name}: {e}")
\ No newline at end of file
+            logger.error(f"Error moving character {character.name}: {e}")
+
+    async def travel(self, ctx: commands.Context, x: int, y: int):
+        """Travel to a distant location along the cheapest route."""
+        character = await self.check_character_exists(ctx)
+        if not character:
+            return
+
+        destination = (x, y)
+        try:
+            path = self.world_service.plan_travel(character.location, destination)
+            if not path:
+                await ctx.send("You are already there.")
+                return
+            chunks = self.world_service.stream_travel_narrative(path)
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+
+        character.location = destination
+        self.character_service.update_character(str(ctx.author.id), character)
+        self.character_service.record_discovery(str(ctx.author.id), character, path)
+        others = self._arrive(ctx, destination)
+
+        cost = self.world_service.pathfinder.path_cost(path)
+        narrative = await self.send_streamed(
+            ctx,
+            chunks,
+            header=f"**Journey to {destination}** ({len(path)} tiles, {cost:g} turns)\n"
+        )
+        await self._announce(ctx, character, others)
+        self.world_service.prefetch_neighbours(destination)
+        logger.info(f"{character.name} travelled to {destination} over {len(path)} tiles: {narrative}")
+
+    async def map(self, ctx: commands.Context, image: bool = False):
+        """Show the map around the player, as text or as an image."""
+        character = await self.check_character_exists(ctx)
+        if not character:
+            return
+
+        player_id = str(ctx.author.id)
+        if image:
+            png = self.world_service.render_map_png(character.location, character.explored, player_id)
+            await ctx.send(
+                f"**Map around {character.location}**",
+                file=discord.File(io.BytesIO(png), filename="map.png")
+            )
+        else:
+            text = self.world_service.render_map(character.location, character.explored, player_id)
+            await ctx.send(f"**Map around {character.location}**\n```\n{text}\n```")
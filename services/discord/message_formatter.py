@@ -1,63 +1,152 @@
 import discord
-from typing import List, Dict, Any, Optional
-from ...data.models.character import Character
-from ...data.models.combat import CombatState
+import math
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+from data.models.character import Character
+from data.models.combat import CombatState
+from data.models.versioned import Versioned
 
 class MessageFormatter:
-    """Handles formatting of Discord messages and embeds."""
+    """Handles formatting of Discord messages and embeds.
 
-    @staticmethod
-    def character_info(character: Character) -> discord.Embed:
+    Character sheets and combat boards are cached per (entity, version, page),
+    so re-rendering an unchanged entity returns the previous embed. A combat
+    board's version also covers the combatants on its page, so their HP
+    changes show without touching the combat state. Cached embeds are shared
+    and must be treated as read-only.
+    """
+
+    COMBATANTS_PER_PAGE = 10
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._embeds: "OrderedDict[Hashable, Tuple[weakref.ref, Hashable, discord.Embed]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, key: Hashable, entity: Versioned, render: Callable[[], discord.Embed],
+                version: Hashable = None) -> discord.Embed:
+        """Return the cached embed for an entity's current version, rendering it on a miss."""
+        if version is None:
+            version = entity.version
+        entry = self._embeds.get(key)
+        # id() can be reused once an entity is collected, so confirm it is the same object
+        if entry is not None and entry[0]() is entity and entry[1] == version:
+            self._embeds.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        embed = render()
+        self._embeds[key] = (weakref.ref(entity), version, embed)
+        self._embeds.move_to_end(key)
+        while len(self._embeds) > self.max_entries:
+            self._embeds.popitem(last=False)
+        return embed
+
+    def character_info(self, character: Character) -> discord.Embed:
         """Format character information as an embed."""
+        return self._cached(("character", id(character)), character, lambda: self._render_character(character))
+
+    @staticmethod
+    def _render_character(character: Character) -> discord.Embed:
         embed = discord.Embed(
             title=f"{character.name}'s Character Sheet",
             color=discord.Color.blue()
         )
-        
+
         # Basic Info
         embed.add_field(
             name="Basic Info",
             value=f"Class: {character.player_class}\nLevel: {character.level}\nXP: {character.xp}",
             inline=False
         )
-        
+
         # Stats
         stats_text = "\n".join(f"{stat}: {value}" for stat, value in character.stats.items())
         embed.add_field(name="Stats", value=stats_text, inline=True)
-        
+
         # Inventory
-        inventory_text = ", ".join(character.inventory) if character.inventory else "Empty"
+        inventory_text = ", ".join(
+            f"{item} x{quantity}" if quantity > 1 else item
+            for item, quantity in sorted(character.inventory.items())
+        ) or "Empty"
         embed.add_field(name="Inventory", value=inventory_text, inline=True)
-        
+
         # Location
         embed.add_field(name="Location", value=f"({character.location[0]}, {character.location[1]})", inline=True)
-        
+
+        if character.explored is not None:
+            embed.add_field(
+                name="Explored",
+                value=f"{len(character.explored)} tiles ({character.explored.coverage:.0%})",
+                inline=True
+            )
+
         return embed
 
-    @staticmethod
-    def combat_status(combat_state: CombatState) -> discord.Embed:
-        """Format combat status as an embed."""
+    def combat_pages(self, combat_state: CombatState) -> int:
+        """Return how many pages the combat board spans."""
+        longest = max(len(combat_state.players), len(combat_state.enemies))
+        return max(1, math.ceil(longest / self.COMBATANTS_PER_PAGE))
+
+    def combat_status(self, combat_state: CombatState, page: int = 0) -> discord.Embed:
+        """Format one page of the combat status as an embed."""
+        page = min(max(page, 0), self.combat_pages(combat_state) - 1)
+        start = page * self.COMBATANTS_PER_PAGE
+        end = start + self.COMBATANTS_PER_PAGE
+        version = (
+            combat_state.version,
+            tuple(player.version for player in combat_state.players[start:end]),
+            tuple(enemy.version for enemy in combat_state.enemies[start:end]),
+        )
+        return self._cached(
+            ("combat", id(combat_state), page),
+            combat_state,
+            lambda: self._render_combat(combat_state, page),
+            version
+        )
+
+    def _render_combat(self, combat_state: CombatState, page: int) -> discord.Embed:
         embed = discord.Embed(
             title=f"Combat Round {combat_state.round}",
             color=discord.Color.red()
         )
-        
+        start = page * self.COMBATANTS_PER_PAGE
+        end = start + self.COMBATANTS_PER_PAGE
+
         # Players
-        players_text = ""
-        for player in combat_state.players:
-            hp_percent = (player.stats["HP"] / player.BASE_STATS["HP"]) * 100
-            players_text += f"{player.name}: {player.stats['HP']} HP ({hp_percent:.0f}%)\n"
+        players_text = "\n".join(
+            f"{player.name}: {player.stats['HP']} HP "
+            f"({player.stats['HP'] / player.BASE_STATS['HP'] * 100:.0f}%)"
+            for player in combat_state.players[start:end]
+        )
         embed.add_field(name="Players", value=players_text or "No players", inline=False)
-        
+
         # Enemies
-        enemies_text = ""
-        for enemy in combat_state.enemies:
-            hp_percent = (enemy.hp / enemy.max_hp) * 100
-            enemies_text += f"{enemy.name}: {enemy.hp} HP ({hp_percent:.0f}%)\n"
+        enemies_text = "\n".join(
+            f"{enemy.name}: {enemy.hp} HP ({enemy.hp / enemy.max_hp * 100:.0f}%)"
+            for enemy in combat_state.enemies[start:end]
+        )
         embed.add_field(name="Enemies", value=enemies_text or "No enemies", inline=False)
-        
+
+        pages = self.combat_pages(combat_state)
+        if pages > 1:
+            embed.set_footer(text=f"Page {page + 1}/{pages}")
+
         return embed
 
+    def stats(self) -> Dict[str, Any]:
+        """Return embed cache hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._embeds),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
     @staticmethod
     def quest_info(quest: Dict[str, Any]) -> discord.Embed:
         """Format quest information as an embed."""
@@ -66,19 +155,19 @@ class MessageFormatter:
             description=quest.get("description", "No description available."),
             color=discord.Color.gold()
         )
-        
+
         # Difficulty
         embed.add_field(name="Difficulty", value=f"Level {quest.get('difficulty', '???')}", inline=True)
-        
+
         # Rewards
         rewards = quest.get("rewards", [])
         rewards_text = "\n".join(rewards) if rewards else "No rewards listed"
         embed.add_field(name="Rewards", value=rewards_text, inline=True)
-        
+
         # Location
         if "location" in quest:
             embed.add_field(name="Location", value=f"({quest['location'][0]}, {quest['location'][1]})", inline=True)
-        
+
         return embed
 
     @staticmethod
@@ -99,12 +188,12 @@ class MessageFormatter:
             description="Here are all available commands:",
             color=discord.Color.blue()
         )
-        
+
         for cmd in commands:
             embed.add_field(
                 name=f"{cmd['name']} {cmd.get('usage', '')}",
                 value=cmd.get('description', 'No description available.'),
                 inline=False
             )
-            
+
         return embed
\ No newline at end of file
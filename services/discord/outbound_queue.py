@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+from collections import deque
+import asyncio
+import time
+import discord
+import logging
+from utils.metrics import LatencyStats
+
+logger = logging.getLogger("outbound_queue")
+
+@dataclass
+class _Outgoing:
+    content: str
+    enqueued_at: float
+    future: asyncio.Future
+
+@dataclass
+class _ChannelQueue:
+    channel: discord.abc.Messageable
+    pending: Deque[_Outgoing] = field(default_factory=deque)
+    sent_at: Deque[float] = field(default_factory=deque)
+    worker: Optional[asyncio.Task] = None
+
+class OutboundQueue:
+    """Per-channel send queue that coalesces bursts of messages into single sends."""
+
+    MAX_LENGTH = 2000
+
+    def __init__(self,
+                 coalesce_window: float = 0.4,
+                 rate_limit: int = 5,
+                 rate_period: float = 5.0):
+        # Discord's per-channel bucket allows about five messages per five seconds
+        self.coalesce_window = coalesce_window
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.latency = LatencyStats()
+        self.messages_queued = 0
+        self.sends = 0
+        self.rate_limited = 0
+        self._channels: Dict[int, _ChannelQueue] = {}
+
+    def enqueue(self, channel: discord.abc.Messageable, content: str) -> asyncio.Future:
+        """Queue a message for a channel; the returned future resolves once it is sent."""
+        loop = asyncio.get_running_loop()
+        queue = self._channels.get(channel.id)
+        if queue is None:
+            queue = self._channels[channel.id] = _ChannelQueue(channel)
+
+        future = loop.create_future()
+        pieces = [content[i:i + self.MAX_LENGTH] for i in range(0, len(content), self.MAX_LENGTH)]
+        for i, piece in enumerate(pieces):
+            # Only the last piece of an oversized message carries the caller's future
+            piece_future = future if i == len(pieces) - 1 else loop.create_future()
+            queue.pending.append(_Outgoing(piece, time.monotonic(), piece_future))
+        self.messages_queued += 1
+
+        if queue.worker is None:
+            queue.worker = loop.create_task(self._drain(queue))
+        return future
+
+    async def flush(self, channel: discord.abc.Messageable) -> None:
+        """Wait until everything queued for a channel has been sent."""
+        queue = self._channels.get(channel.id)
+        if queue and queue.pending:
+            await asyncio.gather(*(item.future for item in list(queue.pending)), return_exceptions=True)
+
+    async def _drain(self, queue: _ChannelQueue) -> None:
+        """Send queued messages for one channel until its queue is empty."""
+        batch: List[_Outgoing] = []
+        try:
+            while queue.pending:
+                # Let a burst of messages accumulate before sending
+                await asyncio.sleep(self.coalesce_window)
+                await self._wait_for_bucket(queue)
+
+                batch = self._take_batch(queue)
+                try:
+                    message = await queue.channel.send("\n".join(item.content for item in batch))
+                except discord.HTTPException as e:
+                    if e.status == 429:
+                        self.rate_limited += 1
+                        retry_after = getattr(e, "retry_after", None) or self.rate_period
+                        logger.warning(f"Rate limited on channel {queue.channel.id}, retrying in {retry_after}s")
+                        queue.pending.extendleft(reversed(batch))
+                        batch = []
+                        await asyncio.sleep(retry_after)
+                        continue
+                    self._fail(batch, e)
+                    continue
+                except Exception as e:
+                    logger.error(f"Failed to send to channel {queue.channel.id}: {e}", exc_info=True)
+                    self._fail(batch, e)
+                    continue
+
+                self.sends += 1
+                queue.sent_at.append(time.monotonic())
+                now = time.monotonic()
+                for item in batch:
+                    self.latency.record(now - item.enqueued_at)
+                    if not item.future.done():
+                        item.future.set_result(message)
+                batch = []
+        finally:
+            queue.worker = None
+            # A worker stopped early (cancelled or failed) must not leave senders
+            # or flush() waiting on messages it will never send
+            for item in [*batch, *queue.pending]:
+                if not item.future.done():
+                    item.future.cancel()
+            queue.pending.clear()
+            self._discard_when_idle(queue)
+
+    @staticmethod
+    def _fail(batch: List[_Outgoing], error: Exception) -> None:
+        for item in batch:
+            if not item.future.done():
+                item.future.set_exception(error)
+
+    def _discard_when_idle(self, queue: _ChannelQueue) -> None:
+        """Drop a channel's queue once it is idle and its rate-limit window has closed."""
+        if queue.pending or queue.worker is not None or self._channels.get(queue.channel.id) is not queue:
+            return
+        window_left = self.rate_period - (time.monotonic() - queue.sent_at[-1]) if queue.sent_at else 0
+        if window_left > 0:
+            asyncio.get_running_loop().call_later(window_left, self._discard_when_idle, queue)
+        else:
+            del self._channels[queue.channel.id]
+
+    async def _wait_for_bucket(self, queue: _ChannelQueue) -> None:
+        """Sleep until the channel's rate-limit bucket has room for another send."""
+        now = time.monotonic()
+        while queue.sent_at and now - queue.sent_at[0] >= self.rate_period:
+            queue.sent_at.popleft()
+        if len(queue.sent_at) >= self.rate_limit:
+            await asyncio.sleep(self.rate_period - (now - queue.sent_at[0]))
+            queue.sent_at.popleft()
+
+    def _take_batch(self, queue: _ChannelQueue) -> List[_Outgoing]:
+        """Pop as many queued messages as fit in a single Discord message."""
+        batch = [queue.pending.popleft()]
+        length = len(batch[0].content)
+        while queue.pending and length + 1 + len(queue.pending[0].content) <= self.MAX_LENGTH:
+            item = queue.pending.popleft()
+            length += 1 + len(item.content)
+            batch.append(item)
+        return batch
+
+    def stats(self) -> Dict[str, Any]:
+        """Report coalescing, rate limiting and queue latency."""
+        return {
+            "messages": self.messages_queued,
+            "sends": self.sends,
+            "rate_limited": self.rate_limited,
+            "pending": sum(len(q.pending) for q in self._channels.values()),
+            "latency_ms": self.latency.summary(),
+        }
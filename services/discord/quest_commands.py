@@ -0,0 +1,59 @@
+from typing import Optional
+from discord.ext import commands
+from .base_handler import BaseCommandHandler
+from .outbound_queue import OutboundQueue
+from services.game.character_service import CharacterService
+from services.game.quest_service import QuestService
+from data.models.quest import Objective
+import logging
+
+logger = logging.getLogger("quest_commands")
+
+class QuestCommands(BaseCommandHandler):
+    def __init__(self, bot: commands.Bot, quest_service: QuestService, character_service: CharacterService,
+                 outbound: Optional[OutboundQueue] = None):
+        super().__init__(bot, outbound=outbound)
+        self.quest_service = quest_service
+        self.character_service = character_service
+
+    @staticmethod
+    def _objective(objective: Objective, count: Optional[int] = None) -> str:
+        target = f" {objective.target}" if objective.target is not None else ""
+        done = f"{count}/" if count is not None else ""
+        return f"{objective.kind}{target} ({done}{objective.required})"
+
+    async def quests(self, ctx: commands.Context):
+        """List the quests available in the invoker's region."""
+        character = await self.check_character_exists(ctx)
+        if not character:
+            return
+
+        quests = self.quest_service.get_quests_in_region(character.location)
+        if not quests:
+            await ctx.send("There are no quests in this region.")
+            return
+        player_id = str(ctx.author.id)
+        lines = []
+        for quest in quests:
+            progress = self.quest_service.tracker.progress(player_id, quest.quest_id)
+            objectives = ", ".join(
+                self._objective(objective, progress[i] if progress else None)
+                for i, objective in enumerate(quest.objectives)
+            )
+            accepted = " [accepted]" if progress is not None else ""
+            lines.append(f"#{quest.quest_id} {quest.title} at {quest.location}{accepted}: {objectives}")
+        await ctx.send("\n".join(lines))
+
+    async def accept(self, ctx: commands.Context, quest_id: int):
+        """Accept a quest so game events count towards its objectives."""
+        character = await self.check_character_exists(ctx)
+        if not character:
+            return
+
+        quest = self.quest_service.accept_quest(quest_id, str(ctx.author.id))
+        if quest is None:
+            await ctx.send("That quest is not available.")
+            return
+        objectives = ", ".join(self._objective(objective) for objective in quest.objectives)
+        await ctx.send(f"Quest accepted: {quest.title}. Objectives: {objectives or 'none'}.")
+        logger.info(f"Player {ctx.author.id} accepted quest {quest_id}")
@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import math
+import os
+import time
+from discord.ext import commands
+import logging
+from data.database.repositories.shard_health_repository import ShardHealthRepository
+
+logger = logging.getLogger("shard_monitor")
+
+class ShardMonitor:
+    """Periodically reports gateway latency, status and guild count for each shard this process owns."""
+
+    def __init__(self,
+                 bot: commands.Bot,
+                 repository: Optional[ShardHealthRepository] = None,
+                 interval: float = 30.0):
+        self.bot = bot
+        self.repository = repository
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def collect(self) -> List[Tuple]:
+        """Collect a health report for every shard owned by this process."""
+        shard_count = self.bot.shard_count or 1
+        guilds: Dict[int, int] = {}
+        for guild in self.bot.guilds:
+            guilds[guild.shard_id] = guilds.get(guild.shard_id, 0) + 1
+
+        # AutoShardedBot exposes per-shard latencies; a plain Bot has a single shard
+        latencies = getattr(self.bot, "latencies", None) or [(self.bot.shard_id or 0, self.bot.latency)]
+        now = time.time()
+        reports = []
+        for shard_id, latency in latencies:
+            shard = self.bot.get_shard(shard_id) if hasattr(self.bot, "get_shard") else None
+            closed = shard.is_closed() if shard is not None else self.bot.is_closed()
+            status = "closed" if closed else ("ready" if self.bot.is_ready() else "connecting")
+            latency_ms = latency * 1000 if latency is not None and math.isfinite(latency) else None
+            reports.append((shard_id, shard_count, os.getpid(), status, latency_ms, guilds.get(shard_id, 0), now))
+        return reports
+
+    def report(self) -> None:
+        """Log and persist one round of shard health reports."""
+        reports = self.collect()
+        for shard_id, shard_count, _, status, latency_ms, guild_count, _ in reports:
+            latency = f"{latency_ms:.0f}ms" if latency_ms is not None else "n/a"
+            logger.info(f"Shard {shard_id}/{shard_count}: {status}, latency {latency}, {guild_count} guilds")
+        if self.repository is not None and reports:
+            self.repository.save_reports(reports)
+
+    def start(self) -> None:
+        """Start reporting on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._report_loop())
+
+    async def _report_loop(self) -> None:
+        await self.bot.wait_until_ready()
+        while not self.bot.is_closed():
+            try:
+                self.report()
+            except Exception as e:
+                logger.error(f"Failed to report shard health: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,124 @@
+from typing import Literal, Optional
+import time
+import discord
+from discord import app_commands
+from discord.ext import commands
+from .command_handler import GameCommandHandler
+import logging
+
+logger = logging.getLogger("slash_commands")
+
+class InteractionContext:
+    """Adapts a deferred interaction to the parts of commands.Context the command handlers use."""
+
+    def __init__(self, interaction: discord.Interaction):
+        self.interaction = interaction
+        self.author = interaction.user
+        self.guild = interaction.guild
+        self.channel = interaction.channel
+        self.command = interaction.command
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> discord.WebhookMessage:
+        """Send a follow-up message; the first one replaces the "thinking" indicator."""
+        return await self.interaction.followup.send(content, wait=True, **kwargs)
+
+class SlashCommandHandler:
+    """Registers slash-command equivalents of the prefix commands.
+
+    Every interaction is deferred immediately so Discord shows a "thinking"
+    indicator, then handled by the same command handlers as the prefix path.
+    """
+
+    def __init__(self, bot: commands.Bot, game_handler: GameCommandHandler):
+        self.bot = bot
+        self.game_handler = game_handler
+
+    async def _run(self, interaction: discord.Interaction, handler, *args, **kwargs) -> None:
+        """Defer the interaction, then dispatch it like a prefix command."""
+        started = time.perf_counter()
+        await interaction.response.defer(thinking=True)
+        self.game_handler.latency.get("slash-ack", interaction.command.qualified_name).record(
+            time.perf_counter() - started
+        )
+        await self.game_handler._dispatch(InteractionContext(interaction), handler, *args, **kwargs)
+
+    def register_commands(self):
+        """Register all slash commands with the bot's command tree."""
+        tree = self.bot.tree
+        character_commands = self.game_handler.character_commands
+        combat_commands = self.game_handler.combat_commands
+        exploration_commands = self.game_handler.exploration_commands
+        quest_commands = self.game_handler.quest_commands
+
+        # Character Commands
+        @tree.command(name="create", description="Create a new character")
+        async def create(interaction: discord.Interaction, character_name: str):
+            await self._run(interaction, character_commands.create, character_name=character_name)
+
+        @tree.command(name="view", description="View your character's stats")
+        async def view(interaction: discord.Interaction):
+            await self._run(interaction, character_commands.view)
+
+        @tree.command(name="allocate", description="Allocate stat points")
+        async def allocate(interaction: discord.Interaction,
+                           hp: int = 0, attack: int = 0, defense: int = 0, magic: int = 0):
+            await self._run(interaction, character_commands.allocate, hp, attack, defense, magic)
+
+        @tree.command(name="leaderboard", description="Show the top players")
+        async def leaderboard(interaction: discord.Interaction,
+                              board: Literal["quests", "level", "xp"] = "quests"):
+            await self._run(interaction, character_commands.leaderboard, board)
+
+        # Combat Commands
+        @tree.command(name="combat", description="Start a combat encounter")
+        async def combat(interaction: discord.Interaction):
+            await self._run(interaction, combat_commands.start_combat)
+
+        @tree.command(name="action", description="Submit an action for the current combat round")
+        async def action(interaction: discord.Interaction, action: str):
+            await self._run(interaction, combat_commands.action, action=action)
+
+        @tree.command(name="resolve", description="Resolve the current combat round")
+        async def resolve(interaction: discord.Interaction):
+            await self._run(interaction, combat_commands.resolve)
+
+        @tree.command(name="status", description="Show the current combat board")
+        async def status(interaction: discord.Interaction, page: int = 1):
+            await self._run(interaction, combat_commands.status, page)
+
+        # Exploration Commands
+        @tree.command(name="explore", description="Explore your current location")
+        async def explore(interaction: discord.Interaction):
+            await self._run(interaction, exploration_commands.explore)
+
+        @tree.command(name="move", description="Move one tile in a direction")
+        async def move(interaction: discord.Interaction,
+                       direction: Literal["north", "south", "east", "west"]):
+            await self._run(interaction, exploration_commands.move, direction)
+
+        @tree.command(name="travel", description="Travel to a distant location along the cheapest route")
+        async def travel(interaction: discord.Interaction, x: int, y: int):
+            await self._run(interaction, exploration_commands.travel, x, y)
+
+        @tree.command(name="map", description="Show the map around you")
+        async def map_(interaction: discord.Interaction, image: bool = False):
+            await self._run(interaction, exploration_commands.map, image)
+
+        # Quest Commands
+        if quest_commands is not None:
+            @tree.command(name="quests", description="List the quests in your region")
+            async def quests(interaction: discord.Interaction):
+                await self._run(interaction, quest_commands.quests)
+
+            @tree.command(name="accept", description="Accept a quest")
+            async def accept(interaction: discord.Interaction, quest_id: int):
+                await self._run(interaction, quest_commands.accept, quest_id)
+
+        # Error Handler
+        @tree.error
+        async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+            logger.error(f"Unhandled slash command error: {error}")
+            if interaction.response.is_done():
+                await interaction.followup.send("An error occurred while processing your command.")
+            else:
+                await interaction.response.send_message("An error occurred while processing your command.")
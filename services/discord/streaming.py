@@ -0,0 +1,58 @@
+from typing import AsyncIterator, List, Optional
+from discord.ext import commands
+import asyncio
+import discord
+import logging
+
+logger = logging.getLogger("streaming")
+
+class StreamingMessage:
+    """Posts a message and progressively edits it as streamed text arrives."""
+
+    MAX_LENGTH = 2000
+    PLACEHOLDER = "..."
+
+    def __init__(self, ctx: commands.Context, header: str = "", edit_interval: float = 1.0):
+        # Discord allows roughly five edits per five seconds on a channel, so the
+        # default cadence of one edit per second stays clear of the rate limit.
+        self.ctx = ctx
+        self.header = header
+        self.edit_interval = edit_interval
+        self.message: Optional[discord.Message] = None
+
+    def _render(self, text: str) -> str:
+        """Render in-progress text, keeping the tail visible if it is too long."""
+        content = self.header + text + "▌"
+        if len(content) > self.MAX_LENGTH:
+            content = self.header + "…" + content[-(self.MAX_LENGTH - len(self.header) - 1):]
+        return content
+
+    def _split(self, content: str) -> List[str]:
+        """Split final content into Discord-sized messages."""
+        return [content[i:i + self.MAX_LENGTH] for i in range(0, len(content), self.MAX_LENGTH)] or [""]
+
+    async def stream(self, chunks: AsyncIterator[str]) -> str:
+        """Consume the stream, editing the message at a throttled cadence, and return the full text."""
+        loop = asyncio.get_running_loop()
+        self.message = await self.ctx.send(self.header + self.PLACEHOLDER)
+
+        parts: List[str] = []
+        last_edit = float("-inf")
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                now = loop.time()
+                if now - last_edit >= self.edit_interval:
+                    await self.message.edit(content=self._render("".join(parts)))
+                    last_edit = now
+        except Exception:
+            await self.message.edit(content=self._split(self.header + "".join(parts))[0] or self.PLACEHOLDER)
+            raise
+
+        # The final edit always goes out so the cursor is removed
+        text = "".join(parts)
+        pages = self._split(self.header + text)
+        await self.message.edit(content=pages[0] or self.PLACEHOLDER)
+        for page in pages[1:]:
+            await self.ctx.send(page)
+        return text
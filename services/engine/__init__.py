@@ -0,0 +1,15 @@
+from .command_bus import CommandBus, InProcessCommandBus, ProcessPoolCommandBus, create_command_bus
+from .operations import OPERATIONS, operation
+from .snapshot import WorldSnapshot, open_snapshot, write_snapshot
+
+__all__ = [
+    'CommandBus',
+    'InProcessCommandBus',
+    'ProcessPoolCommandBus',
+    'create_command_bus',
+    'OPERATIONS',
+    'operation',
+    'WorldSnapshot',
+    'open_snapshot',
+    'write_snapshot'
+]
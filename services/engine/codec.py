@@ -0,0 +1,51 @@
+from array import array
+from typing import Dict, List, Tuple
+from data.models.world import Region
+
+WATER = 1
+RESOURCES = 2
+STRUCTURE = 4
+
+def region_flags(region: Region) -> int:
+    """Pack a region's boolean features into a bitmask."""
+    return (
+        (WATER if region.has_water else 0)
+        | (RESOURCES if region.has_resources else 0)
+        | (STRUCTURE if region.has_structure else 0)
+    )
+
+def encode_regions(regions: Dict[Tuple[int, int], Region], biomes: List[str]) -> bytes:
+    """Encode a dense grid of regions as two bytes per region (biome code, feature flags).
+
+    Descriptions and locations are not included; this is for shipping freshly
+    generated worlds between processes, where neither exists yet.
+    """
+    width = max(x for x, _ in regions) + 1 if regions else 0
+    height = max(y for _, y in regions) + 1 if regions else 0
+    codes = {biome: i for i, biome in enumerate(biomes)}
+    grid = array("B", bytes(2 * width * height))
+    for (x, y), region in regions.items():
+        offset = 2 * (y * width + x)
+        grid[offset] = codes[region.biome]
+        grid[offset + 1] = region_flags(region)
+    header = array("I", [width, height]).tobytes()
+    return header + grid.tobytes()
+
+def decode_regions(data: bytes, biomes: List[str]) -> Dict[Tuple[int, int], Region]:
+    """Decode regions produced by encode_regions."""
+    header_size = array("I").itemsize * 2
+    width, height = array("I", data[:header_size])
+    grid = data[header_size:]
+    regions = {}
+    for y in range(height):
+        for x in range(width):
+            offset = 2 * (y * width + x)
+            flags = grid[offset + 1]
+            regions[(x, y)] = Region(
+                biome=biomes[grid[offset]],
+                locations={},
+                has_water=bool(flags & WATER),
+                has_resources=bool(flags & RESOURCES),
+                has_structure=bool(flags & STRUCTURE)
+            )
+    return regions
@@ -0,0 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+import asyncio
+import multiprocessing
+import pickle
+import logging
+from utils.metrics import LatencyRegistry
+from .operations import OPERATIONS
+
+logger = logging.getLogger(__name__)
+
+class CommandBus:
+    """Dispatches named engine operations, keeping heavy work off the gateway's event loop."""
+
+    def __init__(self):
+        self.latency = LatencyRegistry()
+
+    async def dispatch(self, name: str, *args: Any) -> Any:
+        """Run an operation and return its result."""
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown engine operation: {name}")
+        with self.latency.get(name).time():
+            return await self._execute(name, args)
+
+    async def _execute(self, name: str, args: tuple) -> Any:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the bus."""
+
+class InProcessCommandBus(CommandBus):
+    """Runs operations directly on the calling event loop."""
+
+    async def _execute(self, name: str, args: tuple) -> Any:
+        return OPERATIONS[name](*args)
+
+def _run_encoded(payload: bytes) -> bytes:
+    """Worker-side entry point: decode a request, run it and encode the result."""
+    name, args = pickle.loads(payload)
+    return pickle.dumps(OPERATIONS[name](*args), protocol=pickle.HIGHEST_PROTOCOL)
+
+class ProcessPoolCommandBus(CommandBus):
+    """Runs operations in a pool of worker processes."""
+
+    def __init__(self, workers: Optional[int] = None):
+        super().__init__()
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    async def _execute(self, name: str, args: tuple) -> Any:
+        # Encode once with the newest pickle protocol; the pool then only ships bytes
+        payload = pickle.dumps((name, args), protocol=pickle.HIGHEST_PROTOCOL)
+        result = await asyncio.get_running_loop().run_in_executor(self.executor, _run_encoded, payload)
+        self.bytes_sent += len(payload)
+        self.bytes_received += len(result)
+        return pickle.loads(result)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+def create_command_bus(workers: int) -> CommandBus:
+    """Create an in-process bus when workers is 0, otherwise a process pool of that size."""
+    if workers <= 0:
+        return InProcessCommandBus()
+    logger.info(f"Starting engine process pool with {workers} workers")
+    return ProcessPoolCommandBus(workers)
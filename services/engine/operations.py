@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.world_repository import WorldRepository
+from data.models.combat import CombatState
+from .codec import encode_regions
+
+logger = logging.getLogger(__name__)
+
+# Operations the command bus can run, by name. They must be module-level functions
+# taking and returning plain picklable data so they can run in worker processes.
+OPERATIONS: Dict[str, Callable[..., Any]] = {}
+
+def operation(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register a function as a command bus operation."""
+    def register(func: Callable[..., Any]) -> Callable[..., Any]:
+        OPERATIONS[name] = func
+        return func
+    return register
+
+@operation("engine.ping")
+def ping(payload: Any = None) -> Any:
+    """Echo the payload; used to measure dispatch overhead."""
+    return payload
+
+@operation("world.generate")
+def generate_world(db_path: str, width: int, height: int, seed: Optional[int] = None) -> bytes:
+    """Generate and save a world, returning its regions in compact encoded form."""
+    repository = WorldRepository(DatabaseManager(db_path))
+    regions = repository.build_regions(width, height, seed)
+    repository.save_regions(regions)
+    logger.info(f"Generated {len(regions)} regions")
+    return encode_regions(regions, WorldRepository.BIOMES)
+
+@operation("combat.resolve")
+def resolve_combat(state: CombatState) -> Tuple[List[str], Dict[str, list]]:
+    """Apply one round of combat mechanics, returning the outcomes and the combatants' new state.
+
+    The state comes back as a compact delta for the caller to apply to its live
+    objects; the copies unpickled here are discarded.
+    """
+    # Imported here to keep the AI client out of processes that never resolve combat
+    from services.game.combat_service import CombatService
+
+    service = CombatService(narrative_service=None)
+    service.current_combat = state
+    results = service.apply_round_mechanics()
+    return results, service.round_state()
@@ -0,0 +1,142 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+import mmap
+import os
+import struct
+import logging
+from data.models.world import Region
+from .codec import RESOURCES, STRUCTURE, WATER, region_flags
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DMWS"
+FORMAT_VERSION = 1
+# magic, format version, biome count, width, height, biome name bytes
+HEADER = struct.Struct("<4sHHIII")
+# Biome code marking a tile with no region
+NO_REGION = 0xFF
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+def write_snapshot(regions: Dict[Tuple[int, int], Region], path: str) -> None:
+    """Write regions to a binary snapshot file, replacing any existing one atomically.
+
+    Layout: header, NUL-separated biome names, two bytes per tile (biome code,
+    feature flags), then width * height + 1 uint32 offsets into a UTF-8 blob
+    of region descriptions.
+    """
+    width = max((x for x, _ in regions), default=-1) + 1
+    height = max((y for _, y in regions), default=-1) + 1
+    biomes = sorted({region.biome for region in regions.values()})
+    if len(biomes) >= NO_REGION:
+        raise ValueError(f"Too many biomes for a world snapshot: {len(biomes)}")
+    codes = {biome: i for i, biome in enumerate(biomes)}
+    names = b"\0".join(biome.encode() for biome in biomes)
+
+    tiles = bytearray([NO_REGION, 0]) * (width * height)
+    descriptions = [b""] * (width * height)
+    for (x, y), region in regions.items():
+        index = y * width + x
+        tiles[2 * index] = codes[region.biome]
+        tiles[2 * index + 1] = region_flags(region)
+        if region.description:
+            descriptions[index] = region.description.encode()
+
+    offsets = [0]
+    for description in descriptions:
+        offsets.append(offsets[-1] + len(description))
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(biomes), width, height, len(names))
+    tiles_start = _align(HEADER.size + len(names))
+    offsets_start = _align(tiles_start + len(tiles))
+
+    # Per-process temp name, since several shard processes may export at once
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header + names)
+        f.write(bytes(tiles_start - f.tell()))
+        f.write(tiles)
+        f.write(bytes(offsets_start - f.tell()))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(b"".join(descriptions))
+    # Readers that already mapped the old file keep a consistent view of it
+    os.replace(temp_path, path)
+    logger.info(f"Wrote {width}x{height} world snapshot to {path}")
+
+class WorldSnapshot(Mapping):
+    """Read-only, memory-mapped view of a world snapshot, keyed by region coordinates.
+
+    Regions are decoded on access, so opening a snapshot costs the same for any
+    world size, and processes mapping the same file share its page cache.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, biome_count, self.width, self.height, names_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} world snapshot")
+
+        names = self._mmap[HEADER.size:HEADER.size + names_size]
+        self.biomes: List[str] = [name.decode() for name in names.split(b"\0")] if biome_count else []
+        self._tiles = _align(HEADER.size + names_size)
+        self._offsets = _align(self._tiles + 2 * self.width * self.height)
+        self._blob = self._offsets + 4 * (self.width * self.height + 1)
+        self._length: Optional[int] = None
+
+    def _index(self, key: Tuple[int, int]) -> int:
+        x, y = key
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError(key)
+        index = y * self.width + x
+        if self._mmap[self._tiles + 2 * index] == NO_REGION:
+            raise KeyError(key)
+        return index
+
+    def __getitem__(self, key: Tuple[int, int]) -> Region:
+        index = self._index(key)
+        code = self._mmap[self._tiles + 2 * index]
+        flags = self._mmap[self._tiles + 2 * index + 1]
+        start, end = struct.unpack_from("<II", self._mmap, self._offsets + 4 * index)
+        return Region(
+            biome=self.biomes[code],
+            locations={},
+            has_water=bool(flags & WATER),
+            has_resources=bool(flags & RESOURCES),
+            has_structure=bool(flags & STRUCTURE),
+            description=self._mmap[self._blob + start:self._blob + end].decode() if end > start else None
+        )
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self._index(key)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for y in range(self.height):
+            for x in range(self.width):
+                if self._mmap[self._tiles + 2 * (y * self.width + x)] != NO_REGION:
+                    yield (x, y)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            tiles = self._mmap[self._tiles:self._tiles + 2 * self.width * self.height]
+            self._length = self.width * self.height - tiles[::2].count(NO_REGION)
+        return self._length
+
+    def close(self) -> None:
+        self._mmap.close()
+
+def open_snapshot(path: str) -> Optional[WorldSnapshot]:
+    """Open a snapshot if the file exists and is valid, otherwise return None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return WorldSnapshot(path)
+    except (ValueError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable world snapshot {path}: {e}")
+        return None
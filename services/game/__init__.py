@@ -2,10 +2,31 @@ from .character_service import CharacterService
 from .combat_service import CombatService
 from .world_service import WorldService
 from .quest_service import QuestService
+from .chunk_manager import ChunkManager
+from .prefetcher import DescriptionPrefetcher
+from .pathfinding import CostGrid, Pathfinder
+from .presence import PresenceIndex
+from .map_renderer import MapRenderer
+from .events import EventBus, GameEvent
+from .quest_tracker import QuestTracker
+from .leaderboard import Leaderboard, Leaderboards
+from .quest_board import QuestBoard
 
 __all__ = [
     'CharacterService',
     'CombatService',
     'WorldService',
-    'QuestService'
+    'QuestService',
+    'ChunkManager',
+    'DescriptionPrefetcher',
+    'CostGrid',
+    'Pathfinder',
+    'PresenceIndex',
+    'MapRenderer',
+    'EventBus',
+    'GameEvent',
+    'QuestTracker',
+    'Leaderboard',
+    'Leaderboards',
+    'QuestBoard'
 ]
\ No newline at end of file
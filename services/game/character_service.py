@@ -1,13 +1,20 @@
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 import logging
 from data.models.character import Character
 from data.database.repositories.character_repository import CharacterRepository
+from .events import EventBus, GameEvent, ITEM_GAINED
+from .leaderboard import Leaderboards
 
 logger = logging.getLogger("character_service")
 
 class CharacterService:
-    def __init__(self, character_repository: CharacterRepository):
+    def __init__(self,
+                 character_repository: CharacterRepository,
+                 events: Optional[EventBus] = None,
+                 leaderboards: Optional[Leaderboards] = None):
         self.repository = character_repository
+        self.events = events
+        self.leaderboards = leaderboards
 
     def create_character(self, discord_id: str, name: str) -> Character:
         """Create a new character."""
@@ -15,7 +22,7 @@ class CharacterService:
             raise ValueError("Character already exists for this user")
         
         character = Character(name=name)
-        self.repository.save(discord_id, character)
+        self.update_character(discord_id, character)
         return character
 
     def get_character(self, discord_id: str) -> Optional[Character]:
@@ -25,6 +32,23 @@ class CharacterService:
     def update_character(self, discord_id: str, character: Character) -> None:
         """Update an existing character."""
         self.repository.save(discord_id, character)
+        if self.leaderboards is not None:
+            self.leaderboards.record_character(discord_id, character.level, character.xp)
+
+    def update_characters(self, characters: List[Character]) -> None:
+        """Save several characters at once, e.g. everyone in a combat that just ended."""
+        self.repository.save_many([(character.discord_id, character) for character in characters])
+        if self.leaderboards is not None:
+            for character in characters:
+                self.leaderboards.record_character(character.discord_id, character.level, character.xp)
+
+    def add_item(self, discord_id: str, character: Character, item: str, quantity: int = 1) -> None:
+        """Give a character items, stacking them with any already held."""
+        character.inventory.add(item, quantity)
+        character.touch()
+        self.update_character(discord_id, character)
+        if self.events is not None:
+            self.events.publish(GameEvent(ITEM_GAINED, discord_id, item, quantity))
 
     def allocate_stats(self, discord_id: str, hp: int = 0, attack: int = 0, 
                       defense: int = 0, magic: int = 0) -> Optional[Character]:
@@ -35,4 +59,16 @@ class CharacterService:
 
         character.allocate_stat_points(hp, attack, defense, magic)
         self.update_character(discord_id, character)
-        return character
\ No newline at end of file
+        return character
+
+    def record_discovery(self, discord_id: str, character: Character,
+                         tiles: Iterable[Tuple[int, int]]) -> int:
+        """Mark tiles explored by a character; return how many were discovered for the first time.
+
+        Only the explored tiles are written, and only when something new was found.
+        """
+        discovered = character.explored.mark_all(tiles)
+        if discovered:
+            character.touch()
+            self.repository.save_explored(discord_id, character.explored)
+        return discovered
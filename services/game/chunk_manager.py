@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+import logging
+from data.models.world import Region
+from data.database.repositories.world_repository import WorldRepository
+
+logger = logging.getLogger(__name__)
+
+class Chunk:
+    """A square block of regions that is loaded and evicted as a unit."""
+
+    __slots__ = ("key", "regions", "players")
+
+    def __init__(self, key: Tuple[int, int], regions: Dict[Tuple[int, int], Region]):
+        self.key = key
+        self.regions = regions
+        # Players currently inside the chunk; a chunk with players is pinned
+        self.players = 0
+
+class ChunkManager(Mapping):
+    """Keeps the chunks of regions around active players resident, keyed by region coordinates.
+
+    Chunks load from the database on first access. Chunks that were never
+    generated are generated from the world seed and saved. Chunks holding
+    players are pinned. Once more than max_chunks are resident, the least
+    recently used unpinned chunks are evicted, and eviction listeners are
+    told which regions went so caches built from them can drop them too.
+    """
+
+    def __init__(self,
+                 repository: WorldRepository,
+                 seed: int = 0,
+                 chunk_size: int = 16,
+                 max_chunks: int = 256,
+                 view_radius: int = 1):
+        self.repository = repository
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.view_radius = view_radius
+        self._chunks: "OrderedDict[Tuple[int, int], Chunk]" = OrderedDict()
+        self._player_chunks: Dict[str, Tuple[int, int]] = {}
+        self._evict_listeners: List[Callable[[Iterable[Tuple[int, int]]], None]] = []
+        self.loads = 0
+        self.generated = 0
+        self.evictions = 0
+
+    def chunk_key(self, x: int, y: int) -> Tuple[int, int]:
+        """Return the key of the chunk containing a region."""
+        return (x // self.chunk_size, y // self.chunk_size)
+
+    def _chunk(self, key: Tuple[int, int]) -> Chunk:
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        chunk = Chunk(key, self._load(key))
+        self._chunks[key] = chunk
+        self._evict(keep=key)
+        return chunk
+
+    def _load(self, key: Tuple[int, int]) -> Dict[Tuple[int, int], Region]:
+        """Load a chunk's regions, generating and saving any that do not exist yet."""
+        x0, y0 = key[0] * self.chunk_size, key[1] * self.chunk_size
+        regions = self.repository.load_regions(x0, y0, x0 + self.chunk_size, y0 + self.chunk_size)
+        self.loads += 1
+
+        missing = {
+            (x, y): self.repository.build_region(x, y, self.seed)
+            for y in range(y0, y0 + self.chunk_size)
+            for x in range(x0, x0 + self.chunk_size)
+            if (x, y) not in regions
+        }
+        if missing:
+            self.repository.save_regions(missing)
+            regions.update(missing)
+            self.generated += 1
+            logger.debug(f"Generated {len(missing)} regions for chunk {key}")
+        return regions
+
+    def _evict(self, keep: Tuple[int, int]) -> None:
+        """Evict least recently used unpinned chunks, other than keep, until within budget."""
+        if len(self._chunks) <= self.max_chunks:
+            return
+        for key in [key for key, chunk in self._chunks.items() if not chunk.players and key != keep]:
+            chunk = self._chunks.pop(key)
+            self.evictions += 1
+            for listener in self._evict_listeners:
+                try:
+                    listener(chunk.regions.keys())
+                except Exception as e:
+                    logger.error(f"Chunk evict listener failed for {key}: {e}", exc_info=True)
+            if len(self._chunks) <= self.max_chunks:
+                return
+        logger.warning(f"All {len(self._chunks)} resident chunks are pinned; over the budget of {self.max_chunks}")
+
+    def on_evict(self, listener: Callable[[Iterable[Tuple[int, int]]], None]) -> None:
+        """Call listener(regions) with the coordinates of each chunk's regions as it is evicted."""
+        self._evict_listeners.append(listener)
+
+    def move_player(self, player_id: str, region: Tuple[int, int]) -> None:
+        """Record a player's region, pinning its chunk and loading the chunks around it."""
+        key = self.chunk_key(*region)
+        previous = self._player_chunks.get(player_id)
+        if previous != key:
+            if previous is not None and previous in self._chunks:
+                self._chunks[previous].players -= 1
+            self._chunk(key).players += 1
+            self._player_chunks[player_id] = key
+
+        for dy in range(-self.view_radius, self.view_radius + 1):
+            for dx in range(-self.view_radius, self.view_radius + 1):
+                if dx or dy:
+                    self._chunk((key[0] + dx, key[1] + dy))
+        # Keep the player's own chunk hottest
+        self._chunks.move_to_end(key)
+
+    def remove_player(self, player_id: str) -> None:
+        """Forget a player, unpinning their chunk."""
+        key = self._player_chunks.pop(player_id, None)
+        if key is not None and key in self._chunks:
+            self._chunks[key].players -= 1
+
+    def __getitem__(self, region: Tuple[int, int]) -> Region:
+        return self._chunk(self.chunk_key(*region)).regions[region]
+
+    def __contains__(self, region: object) -> bool:
+        # Every coordinate exists, generated on demand
+        return isinstance(region, tuple) and len(region) == 2
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the resident regions only; the world itself is unbounded."""
+        for chunk in list(self._chunks.values()):
+            yield from chunk.regions
+
+    def __len__(self) -> int:
+        return sum(len(chunk.regions) for chunk in self._chunks.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Return residency counters."""
+        return {
+            "resident_chunks": len(self._chunks),
+            "pinned_chunks": sum(1 for chunk in self._chunks.values() if chunk.players),
+            "loads": self.loads,
+            "generated": self.generated,
+            "evictions": self.evictions
+        }
@@ -1,7 +1,9 @@
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from data.models.combat import CombatState, CombatAction, Enemy
 from data.models.character import Character
 from services.ai.narrative_service import NarrativeService
+from services.engine.command_bus import CommandBus
+from .events import EventBus, GameEvent, KILLED
 import random
 import logging
 
@@ -10,8 +12,13 @@ logger = logging.getLogger(__name__)
 class CombatService:
     """Manages combat encounters and resolution."""
     
-    def __init__(self, narrative_service: NarrativeService):
+    def __init__(self,
+                 narrative_service: NarrativeService,
+                 command_bus: Optional[CommandBus] = None,
+                 events: Optional[EventBus] = None):
         self.narrative_service = narrative_service
+        self.command_bus = command_bus
+        self.events = events
         self.current_combat: Optional[CombatState] = None
 
     def generate_enemies(self, player_levels: List[int], count: int = 2) -> List[Enemy]:
@@ -36,7 +43,8 @@ class CombatService:
                 hp=50 + (level * 10),
                 max_hp=50 + (level * 10),
                 attack=5 + (level * 2),
-                defense=3 + (level * 1)
+                defense=3 + (level * 1),
+                kind=enemy_type
             )
             enemies.append(enemy)
             
@@ -59,8 +67,7 @@ class CombatService:
 
     def add_action(self, player: Character, action_text: str) -> None:
         """Record a player's action for the current combat round."""
-        if not self.current_combat or not self.current_combat.is_active:
-            raise ValueError("No active combat session")
+        self._check_active_combat()
 
         action_type = "standard"
         target = None
@@ -84,11 +91,54 @@ class CombatService:
         self.current_combat.actions.append(action)
         logger.info(f"Action added: {action_type} by {player.name} targeting {target}")
 
-    async def resolve_round(self) -> str:
-        """Resolve the current combat round and generate narrative."""
+    def _check_active_combat(self) -> None:
+        """Raise if there is no combat session to act on."""
         if not self.current_combat or not self.current_combat.is_active:
             raise ValueError("No active combat session")
 
+    async def _resolve_mechanics(self) -> List[str]:
+        """Apply the round's mechanics, on the engine command bus if one is configured."""
+        alive = [enemy.is_alive for enemy in self.current_combat.enemies]
+        if self.command_bus is None:
+            results = self.apply_round_mechanics()
+        else:
+            results, state = await self.command_bus.dispatch("combat.resolve", self.current_combat)
+            self.apply_round_state(state)
+        self._publish_kills(alive)
+        return results
+
+    def round_state(self) -> Dict[str, list]:
+        """Capture what a round of mechanics can change: player HP and enemy HP."""
+        return {
+            "players": [player.stats["HP"] for player in self.current_combat.players],
+            "enemies": [enemy.hp for enemy in self.current_combat.enemies],
+        }
+
+    def apply_round_state(self, state: Dict[str, list]) -> None:
+        """Apply a round_state() computed elsewhere to the live combatants."""
+        combat = self.current_combat
+        for player, hp in zip(combat.players, state["players"]):
+            if player.stats["HP"] != hp:
+                player.stats["HP"] = hp
+                player.touch()
+        for enemy, hp in zip(combat.enemies, state["enemies"]):
+            if enemy.hp != hp:
+                enemy.hp = hp
+                enemy.is_alive = hp > 0
+        combat.touch()
+
+    def _publish_kills(self, alive_before: List[bool]) -> None:
+        """Credit every player in the fight with each enemy killed this round."""
+        if self.events is None:
+            return
+        for was_alive, enemy in zip(alive_before, self.current_combat.enemies):
+            if was_alive and not enemy.is_alive:
+                for player in self.current_combat.players:
+                    if player.discord_id is not None:
+                        self.events.publish(GameEvent(KILLED, player.discord_id, enemy.kind or enemy.name))
+
+    def apply_round_mechanics(self) -> List[str]:
+        """Apply all player and enemy actions for the round and return their outcomes."""
         # Process player actions
         results = []
         for action in self.current_combat.actions:
@@ -99,12 +149,12 @@ class CombatService:
         enemy_results = self._process_enemy_actions()
         results.extend(enemy_results)
 
-        # Generate narrative
-        narrative = await self.narrative_service.generate_combat_narrative(
-            self.current_combat.actions,
-            results
-        )
+        # Combatants changed underneath the combat; let its version reflect that
+        self.current_combat.touch()
+        return results
 
+    def _finish_round(self) -> str:
+        """Advance the round counter and return any end-of-combat message."""
         # Clean up round
         self.current_combat.round += 1
         self.current_combat.actions = []
@@ -112,10 +162,40 @@ class CombatService:
         # Check if combat is over
         if self.current_combat.is_combat_over():
             self.current_combat.is_active = False
-            narrative += "\nCombat has ended!"
             logger.info("Combat session ended.")
+            return "\nCombat has ended!"
+        return ""
+
+    async def resolve_round(self) -> str:
+        """Resolve the current combat round and generate narrative."""
+        self._check_active_combat()
+        results = await self._resolve_mechanics()
+
+        # Generate narrative
+        narrative = await self.narrative_service.generate_combat_narrative(
+            self.current_combat.actions,
+            results
+        )
+
+        return narrative + self._finish_round()
+
+    def stream_round(self) -> AsyncIterator[str]:
+        """Resolve the current combat round, streaming the narrative as it is generated."""
+        # Validate eagerly so callers can report errors before posting a message
+        self._check_active_combat()
+        return self._stream_round()
+
+    async def _stream_round(self) -> AsyncIterator[str]:
+        results = await self._resolve_mechanics()
+        async for chunk in self.narrative_service.stream_combat_narrative(
+            self.current_combat.actions,
+            results
+        ):
+            yield chunk
 
-        return narrative
+        ending = self._finish_round()
+        if ending:
+            yield ending
 
     def _process_action(self, action: CombatAction) -> str:
         """Process a single combat action."""
@@ -177,6 +257,7 @@ class CombatService:
             target = random.choice(self.current_combat.players)
             damage = max(1, enemy.attack - target.stats["Defense"])
             target.stats["HP"] -= damage
+            target.touch()
             results.append(f"{enemy.name} attacks {target.name} for {damage} damage!")
 
         return results
\ No newline at end of file
@@ -0,0 +1,42 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, DefaultDict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Event kinds
+MOVED = "moved"                      # target: the tile reached
+KILLED = "killed"                    # target: the kind of enemy, e.g. "Goblin"
+ITEM_GAINED = "item_gained"          # target: the item name
+QUEST_COMPLETED = "quest_completed"  # target: the quest id
+
+@dataclass(frozen=True, slots=True)
+class GameEvent:
+    """Something a player did that other systems may react to."""
+    kind: str
+    player_id: str
+    target: Any = None
+    amount: int = 1
+
+class EventBus:
+    """Synchronous publish/subscribe of game events by kind.
+
+    Handlers run inline and must be cheap. A failing handler is logged and
+    does not stop the others.
+    """
+
+    def __init__(self):
+        self._handlers: DefaultDict[str, List[Callable[[GameEvent], None]]] = defaultdict(list)
+        self.published = 0
+
+    def subscribe(self, kind: str, handler: Callable[[GameEvent], None]) -> None:
+        self._handlers[kind].append(handler)
+
+    def publish(self, event: GameEvent) -> None:
+        self.published += 1
+        for handler in self._handlers.get(event.kind, ()):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Handler for {event.kind} event failed: {e}", exc_info=True)
@@ -0,0 +1,195 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import random
+import logging
+from .events import EventBus, QUEST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Any, level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # width[i]: how many positions next[i] is ahead of this node
+        self.width = [1] * level
+
+class SkipList:
+    """Sorted collection of unique keys with O(log n) insert, remove and rank.
+
+    An indexable skip list: every link records how many positions it skips.
+    Finding a key's rank therefore costs the same as finding the key, and
+    iterating from any rank is O(log n) to start and O(1) per item.
+    """
+
+    MAX_LEVEL = 24
+
+    def __init__(self, seed: Optional[int] = None):
+        self._head = _Node(None, self.MAX_LEVEL)
+        self._random = random.Random(seed)
+        self._size = 0
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, key: Any) -> Tuple[List[_Node], List[int]]:
+        """Return the last node before key on each level, and each one's position."""
+        update = [self._head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        node, position = self._head, 0
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def insert(self, key: Any) -> None:
+        update, positions = self._predecessors(key)
+        position = positions[0] + 1
+        node = _Node(key, self._random_level())
+        for level in range(self.MAX_LEVEL):
+            previous = update[level]
+            if level < len(node.next):
+                skipped = position - positions[level]
+                node.next[level] = previous.next[level]
+                node.width[level] = previous.width[level] - skipped + 1
+                previous.next[level] = node
+                previous.width[level] = skipped
+            else:
+                previous.width[level] += 1
+        self._size += 1
+
+    def remove(self, key: Any) -> None:
+        update, _ = self._predecessors(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for level in range(self.MAX_LEVEL):
+            previous = update[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key: Any) -> int:
+        """Return the 0-based position of a key."""
+        update, positions = self._predecessors(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return positions[0]
+
+    def iter_from(self, rank: int) -> Iterator[Any]:
+        """Iterate over keys starting at a 0-based position."""
+        node, position = self._head, -1
+        for level in reversed(range(self.MAX_LEVEL)):
+            while node.next[level] is not None and position + node.width[level] <= rank:
+                position += node.width[level]
+                node = node.next[level]
+        if position != rank:
+            return
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_from(0)
+
+    def __len__(self) -> int:
+        return self._size
+
+class Leaderboard:
+    """Players ranked by one score, highest first; ties broken by player id."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._scores: Dict[str, int] = {}
+        self._ranking = SkipList()
+
+    def set(self, player_id: str, score: int) -> None:
+        """Set a player's score in O(log n)."""
+        previous = self._scores.get(player_id)
+        if previous == score:
+            return
+        if previous is not None:
+            self._ranking.remove((-previous, player_id))
+        self._scores[player_id] = score
+        self._ranking.insert((-score, player_id))
+
+    def add(self, player_id: str, amount: int = 1) -> int:
+        """Add to a player's score and return the new score."""
+        score = self._scores.get(player_id, 0) + amount
+        self.set(player_id, score)
+        return score
+
+    def remove(self, player_id: str) -> None:
+        score = self._scores.pop(player_id, None)
+        if score is not None:
+            self._ranking.remove((-score, player_id))
+
+    def score(self, player_id: str) -> Optional[int]:
+        return self._scores.get(player_id)
+
+    def rank(self, player_id: str) -> Optional[int]:
+        """Return a player's 1-based rank, or None if they are not on the board."""
+        score = self._scores.get(player_id)
+        if score is None:
+            return None
+        return self._ranking.rank((-score, player_id)) + 1
+
+    def top(self, k: int = 10, start: int = 0) -> List[Tuple[str, int]]:
+        """Return up to k (player id, score) entries from 0-based position start."""
+        entries = []
+        for negated, player_id in self._ranking.iter_from(start):
+            if len(entries) >= k:
+                break
+            entries.append((player_id, -negated))
+        return entries
+
+    def load(self, scores: Iterable[Tuple[str, int]]) -> None:
+        """Replace the board's contents."""
+        self._scores.clear()
+        self._ranking = SkipList()
+        for player_id, score in scores:
+            self.set(player_id, score)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+class Leaderboards:
+    """The game's leaderboards by quests completed, level and XP, kept current as players progress."""
+
+    BOARDS = ("quests", "level", "xp")
+
+    def __init__(self):
+        self.boards = {name: Leaderboard(name) for name in self.BOARDS}
+
+    def __getitem__(self, name: str) -> Leaderboard:
+        return self.boards[name]
+
+    def subscribe(self, events: EventBus) -> None:
+        """Count quest completions as they are published."""
+        events.subscribe(QUEST_COMPLETED, lambda event: self.record_quest_completion(event.player_id))
+
+    def record_character(self, discord_id: str, level: int, xp: int) -> None:
+        self.boards["level"].set(discord_id, level)
+        self.boards["xp"].set(discord_id, xp)
+
+    def record_quest_completion(self, discord_id: str) -> None:
+        self.boards["quests"].add(discord_id)
+
+    def load(self, quest_totals: Iterable[Tuple[str, int]],
+             characters: Iterable[Tuple[str, int, int]]) -> None:
+        """Rebuild the boards from (player, quests) totals and (player, level, xp) rows."""
+        characters = list(characters)
+        self.boards["quests"].load(quest_totals)
+        self.boards["level"].load((discord_id, level) for discord_id, level, _ in characters)
+        self.boards["xp"].load((discord_id, xp) for discord_id, _, xp in characters)
+        logger.info(f"Loaded leaderboards for {len(characters)} characters")
@@ -0,0 +1,238 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import struct
+import zlib
+import logging
+from data.models.explored import ExploredTiles
+from data.models.world import Region
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+BIOME_GLYPHS: Dict[str, str] = {
+    "Plains": ".",
+    "Forest": "T",
+    "Desert": ":",
+    "Tundra": "*",
+    "Swamp": "%",
+    "Mountains": "^",
+}
+UNKNOWN_BIOME = "?"
+VOID = "#"
+FOG = " "
+PLAYER = "@"
+OTHER_PLAYER = "&"
+
+GLYPH_COLOURS: Dict[str, Tuple[int, int, int]] = {
+    ".": (150, 200, 90),
+    "T": (40, 110, 50),
+    ":": (220, 200, 130),
+    "*": (225, 235, 240),
+    "%": (90, 100, 70),
+    "^": (130, 120, 110),
+    UNKNOWN_BIOME: (200, 0, 200),
+    VOID: (20, 20, 20),
+    FOG: (0, 0, 0),
+    PLAYER: (230, 40, 40),
+    OTHER_PLAYER: (240, 170, 40),
+}
+
+class MapRenderer:
+    """Renders map viewports from cached biome glyphs.
+
+    There are three levels of cache: one glyph per region, square blocks of
+    rendered tiles, and whole viewports keyed by their centre. Players in
+    the same area share blocks and viewports. Fog and player markers are
+    drawn over a copy for each request. Every level is an LRU cache.
+    Invalidating regions drops only the blocks and viewports that overlap them.
+    """
+
+    def __init__(self,
+                 region_at: Callable[[Tile], Optional[Region]],
+                 region_size: int,
+                 radius: int = 7,
+                 block_size: int = 16,
+                 max_blocks: int = 256,
+                 max_viewports: int = 256,
+                 max_glyphs: int = 4096):
+        self.region_at = region_at
+        self.region_size = region_size
+        self.radius = radius
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.max_viewports = max_viewports
+        self.max_glyphs = max_glyphs
+        self._glyphs: "OrderedDict[Tile, str]" = OrderedDict()
+        self._blocks: "OrderedDict[Tile, List[str]]" = OrderedDict()
+        self._viewports: "OrderedDict[Tile, List[str]]" = OrderedDict()
+        self.block_renders = 0
+        self.viewport_renders = 0
+        self.viewport_hits = 0
+
+    def glyph(self, tile: Tile) -> str:
+        """Return the glyph of the region containing a tile."""
+        key = (tile[0] // self.region_size, tile[1] // self.region_size)
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self._glyphs.move_to_end(key)
+            return glyph
+
+        region = self.region_at(tile)
+        glyph = VOID if region is None else BIOME_GLYPHS.get(region.biome, UNKNOWN_BIOME)
+        self._glyphs[key] = glyph
+        while len(self._glyphs) > self.max_glyphs:
+            self._glyphs.popitem(last=False)
+        return glyph
+
+    def _block(self, key: Tile) -> List[str]:
+        rows = self._blocks.get(key)
+        if rows is not None:
+            self._blocks.move_to_end(key)
+            return rows
+
+        x0, y0 = key[0] * self.block_size, key[1] * self.block_size
+        rows = [
+            "".join(self.glyph((x, y)) for x in range(x0, x0 + self.block_size))
+            for y in range(y0, y0 + self.block_size)
+        ]
+        self._blocks[key] = rows
+        self.block_renders += 1
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return rows
+
+    def viewport(self, center: Tile) -> List[str]:
+        """Return the rows of glyphs within radius tiles of a centre, without fog or players."""
+        rows = self._viewports.get(center)
+        if rows is not None:
+            self._viewports.move_to_end(center)
+            self.viewport_hits += 1
+            return rows
+
+        x0, x1 = center[0] - self.radius, center[0] + self.radius
+        rows = []
+        for y in range(center[1] - self.radius, center[1] + self.radius + 1):
+            by, row = divmod(y, self.block_size)
+            pieces = []
+            x = x0
+            while x <= x1:
+                bx, offset = divmod(x, self.block_size)
+                take = min(self.block_size - offset, x1 - x + 1)
+                pieces.append(self._block((bx, by))[row][offset:offset + take])
+                x += take
+            rows.append("".join(pieces))
+
+        self._viewports[center] = rows
+        self.viewport_renders += 1
+        while len(self._viewports) > self.max_viewports:
+            self._viewports.popitem(last=False)
+        return rows
+
+    def render(self,
+               center: Tile,
+               explored: Optional[ExploredTiles] = None,
+               others: Iterable[Tile] = ()) -> List[str]:
+        """Return a player's view: the shared viewport with fog and player markers drawn on.
+
+        Tiles the player has not explored are fogged. Tiles beyond the
+        explored bitset's bounds are not tracked, so they are left visible.
+        """
+        grid = [list(row) for row in self.viewport(center)]
+        x0, y0 = center[0] - self.radius, center[1] - self.radius
+        if explored is not None:
+            for dy, row in enumerate(grid):
+                y = y0 + dy
+                if not 0 <= y < explored.height:
+                    continue
+                for dx in range(len(row)):
+                    x = x0 + dx
+                    if 0 <= x < explored.width and not explored.is_explored(x, y):
+                        row[dx] = FOG
+        for x, y in others:
+            if abs(x - center[0]) <= self.radius and abs(y - center[1]) <= self.radius:
+                grid[y - y0][x - x0] = OTHER_PLAYER
+        grid[self.radius][self.radius] = PLAYER
+        return ["".join(row) for row in grid]
+
+    def render_ascii(self,
+                     center: Tile,
+                     explored: Optional[ExploredTiles] = None,
+                     others: Iterable[Tile] = ()) -> str:
+        """Render a player's view as text with a legend."""
+        rows = self.render(center, explored, others)
+        legend = "  ".join(f"{glyph} {biome}" for biome, glyph in BIOME_GLYPHS.items())
+        return "\n".join(rows) + f"\n\n{PLAYER} you  {OTHER_PLAYER} others  {VOID} edge\n{legend}"
+
+    def render_png(self,
+                   center: Tile,
+                   explored: Optional[ExploredTiles] = None,
+                   others: Iterable[Tile] = (),
+                   scale: int = 8) -> bytes:
+        """Render a player's view as a PNG image with scale x scale pixels per tile."""
+        rows = self.render(center, explored, others)
+        scanlines = []
+        for row in rows:
+            line = b"\x00" + b"".join(bytes(GLYPH_COLOURS.get(glyph, (200, 0, 200))) * scale for glyph in row)
+            scanlines.extend([line] * scale)
+        return _encode_png(len(rows[0]) * scale, len(rows) * scale, b"".join(scanlines))
+
+    def invalidate_region(self, region: Tile) -> None:
+        """Forget everything rendered from a region, e.g. after it changed."""
+        self.invalidate_regions([region])
+
+    def invalidate_regions(self, regions: Iterable[Tile]) -> None:
+        """Forget everything rendered from a block of regions, e.g. an evicted chunk.
+
+        Blocks and viewports overlapping the regions' bounding box are dropped,
+        so the regions should be contiguous.
+        """
+        regions = list(regions)
+        if not regions:
+            return
+        for region in regions:
+            self._glyphs.pop(region, None)
+        x0 = min(x for x, _ in regions) * self.region_size
+        y0 = min(y for _, y in regions) * self.region_size
+        x1 = (max(x for x, _ in regions) + 1) * self.region_size - 1
+        y1 = (max(y for _, y in regions) + 1) * self.region_size - 1
+
+        for bx in range(x0 // self.block_size, x1 // self.block_size + 1):
+            for by in range(y0 // self.block_size, y1 // self.block_size + 1):
+                self._blocks.pop((bx, by), None)
+        for center in [
+            center for center in self._viewports
+            if center[0] - self.radius <= x1 and center[0] + self.radius >= x0
+            and center[1] - self.radius <= y1 and center[1] + self.radius >= y0
+        ]:
+            del self._viewports[center]
+
+    def clear(self) -> None:
+        """Forget everything rendered, e.g. after the world was regenerated."""
+        self._glyphs.clear()
+        self._blocks.clear()
+        self._viewports.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        return {
+            "regions": len(self._glyphs),
+            "blocks": len(self._blocks),
+            "viewports": len(self._viewports),
+            "block_renders": self.block_renders,
+            "viewport_renders": self.viewport_renders,
+            "viewport_hits": self.viewport_hits
+        }
+
+def _encode_png(width: int, height: int, scanlines: bytes) -> bytes:
+    """Encode filtered 8-bit RGB scanlines as a PNG file."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(scanlines, 6))
+        + chunk(b"IEND", b"")
+    )
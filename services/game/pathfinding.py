@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import heapq
+import logging
+from data.models.world import Region
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+# Turns needed to cross one tile of each biome
+BIOME_COSTS: Dict[str, float] = {
+    "Plains": 1.0,
+    "Forest": 2.0,
+    "Desert": 3.0,
+    "Tundra": 3.0,
+    "Swamp": 4.0,
+    "Mountains": 5.0,
+}
+DEFAULT_COST = 2.0
+
+class CostGrid:
+    """Movement cost of each tile, taken from its region's biome and cached per region in an LRU.
+
+    Missing regions are not cached, since they may only not be loaded yet.
+    """
+
+    def __init__(self,
+                 region_at: Callable[[Tile], Optional[Region]],
+                 region_size: int,
+                 biome_costs: Optional[Dict[str, float]] = None,
+                 max_regions: int = 4096):
+        self.region_at = region_at
+        self.region_size = region_size
+        self.biome_costs = biome_costs or BIOME_COSTS
+        self.min_cost = min(self.biome_costs.values())
+        self.max_regions = max_regions
+        self._costs: "OrderedDict[Tuple[int, int], float]" = OrderedDict()
+
+    def cost(self, tile: Tile) -> Optional[float]:
+        """Return the cost of entering a tile, or None if it cannot be entered."""
+        key = (tile[0] // self.region_size, tile[1] // self.region_size)
+        cost = self._costs.get(key)
+        if cost is not None:
+            self._costs.move_to_end(key)
+            return cost
+
+        region = self.region_at(tile)
+        if region is None:
+            return None
+        cost = self.biome_costs.get(region.biome, DEFAULT_COST)
+        self._costs[key] = cost
+        while len(self._costs) > self.max_regions:
+            self._costs.popitem(last=False)
+        return cost
+
+    def invalidate_regions(self, regions: Iterable[Tuple[int, int]]) -> None:
+        """Forget the costs of regions, e.g. those of an evicted chunk."""
+        for region in regions:
+            self._costs.pop(region, None)
+
+    def clear(self) -> None:
+        self._costs.clear()
+
+class Pathfinder:
+    """A* search over a cost grid, with an LRU cache of found paths."""
+
+    def __init__(self,
+                 grid: CostGrid,
+                 neighbours: Callable[[Tile], Iterable[Tile]],
+                 max_expansions: int = 20000,
+                 cache_size: int = 1024):
+        self.grid = grid
+        self.neighbours = neighbours
+        self.max_expansions = max_expansions
+        self.cache_size = cache_size
+        self._paths: "OrderedDict[Tuple[Tile, Tile], Optional[List[Tile]]]" = OrderedDict()
+
+    def find_path(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        """Return the cheapest path from start to goal, excluding start, or None if there is none."""
+        key = (start, goal)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            path = self._paths[key]
+            return list(path) if path is not None else None
+
+        path = self._search(start, goal)
+        self._paths[key] = path
+        while len(self._paths) > self.cache_size:
+            self._paths.popitem(last=False)
+        return list(path) if path is not None else None
+
+    def _heuristic(self, tile: Tile, goal: Tile) -> float:
+        # Manhattan distance at the cheapest cost never overestimates, keeping A* optimal
+        return (abs(tile[0] - goal[0]) + abs(tile[1] - goal[1])) * self.grid.min_cost
+
+    def _search(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
+        if start == goal:
+            return []
+        if self.grid.cost(goal) is None:
+            return None
+
+        came_from: Dict[Tile, Tile] = {}
+        best: Dict[Tile, float] = {start: 0.0}
+        # (estimated total, cost so far, tie-breaker, tile)
+        frontier = [(self._heuristic(start, goal), 0.0, 0, start)]
+        counter = 0
+        expansions = 0
+
+        while frontier:
+            _, cost, _, tile = heapq.heappop(frontier)
+            if tile == goal:
+                path = [tile]
+                while path[-1] in came_from and came_from[path[-1]] != start:
+                    path.append(came_from[path[-1]])
+                path.reverse()
+                return path
+            if cost > best.get(tile, float("inf")):
+                continue
+
+            expansions += 1
+            if expansions > self.max_expansions:
+                logger.warning(f"Gave up finding a path from {start} to {goal} after {expansions} expansions")
+                return None
+
+            for neighbour in self.neighbours(tile):
+                step = self.grid.cost(neighbour)
+                if step is None:
+                    continue
+                new_cost = cost + step
+                if new_cost < best.get(neighbour, float("inf")):
+                    best[neighbour] = new_cost
+                    came_from[neighbour] = tile
+                    counter += 1
+                    heapq.heappush(frontier, (new_cost + self._heuristic(neighbour, goal), new_cost, counter, neighbour))
+        return None
+
+    def path_cost(self, path: List[Tile]) -> float:
+        """Return the total cost of walking a path."""
+        return sum(self.grid.cost(tile) or 0.0 for tile in path)
+
+    def clear(self) -> None:
+        """Forget cached paths, e.g. after the world changes."""
+        self._paths.clear()
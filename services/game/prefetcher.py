@@ -0,0 +1,120 @@
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
+import asyncio
+import time
+import logging
+from services.ai.usage_tracker import attribute_usage
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+class DescriptionPrefetcher:
+    """Per-tile cache of location descriptions, warmed speculatively around moving players.
+
+    Prefetches run in the background under a concurrency cap and a budget of
+    prefetches per period, so speculation never competes with more than a
+    few foreground AI calls.
+    """
+
+    def __init__(self,
+                 max_tiles: int = 4096,
+                 concurrency: int = 2,
+                 budget: int = 60,
+                 budget_period: float = 60.0):
+        self.max_tiles = max_tiles
+        self.budget = budget
+        self.budget_period = budget_period
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # tile -> (description, prefetched and not yet used)
+        self._tiles: "OrderedDict[Tile, Tuple[str, bool]]" = OrderedDict()
+        self._in_flight: Dict[Tile, asyncio.Task] = {}
+        self._spent: Deque[float] = deque()
+        self.lookups = 0
+        self.hits = 0
+        self.prefetched = 0
+        self.prefetch_hits = 0
+        self.wasted = 0
+        self.over_budget = 0
+
+    def get(self, tile: Tile) -> Optional[str]:
+        """Return a tile's cached description, counting whether a prefetch paid off."""
+        self.lookups += 1
+        entry = self._tiles.get(tile)
+        if entry is None:
+            return None
+        self._tiles.move_to_end(tile)
+        self.hits += 1
+        description, unused_prefetch = entry
+        if unused_prefetch:
+            self.prefetch_hits += 1
+            self._tiles[tile] = (description, False)
+        return description
+
+    def pending(self, tile: Tile) -> Optional[asyncio.Task]:
+        """Return the in-flight prefetch for a tile, if there is one."""
+        return self._in_flight.get(tile)
+
+    def put(self, tile: Tile, description: str, prefetched: bool = False) -> None:
+        """Cache a tile's description."""
+        self._tiles[tile] = (description, prefetched)
+        self._tiles.move_to_end(tile)
+        while len(self._tiles) > self.max_tiles:
+            _, (_, unused_prefetch) = self._tiles.popitem(last=False)
+            if unused_prefetch:
+                self.wasted += 1
+
+    def _take_budget(self) -> bool:
+        now = time.monotonic()
+        while self._spent and now - self._spent[0] > self.budget_period:
+            self._spent.popleft()
+        if len(self._spent) >= self.budget:
+            return False
+        self._spent.append(now)
+        return True
+
+    def schedule(self, tiles: Iterable[Tile], describe: Callable[[Tile], Awaitable[str]]) -> None:
+        """Start background prefetches for uncached tiles, most likely first, while budget remains."""
+        for tile in tiles:
+            if tile in self._tiles or tile in self._in_flight:
+                continue
+            if not self._take_budget():
+                self.over_budget += 1
+                return
+            self._in_flight[tile] = asyncio.create_task(self._prefetch(tile, describe))
+
+    async def _prefetch(self, tile: Tile, describe: Callable[[Tile], Awaitable[str]]) -> None:
+        try:
+            async with self._semaphore:
+                with attribute_usage("prefetch"):
+                    description = await describe(tile)
+            self.put(tile, description, prefetched=True)
+            self.prefetched += 1
+        except Exception as e:
+            # Speculative work: a failure only means the tile is generated on arrival
+            logger.warning(f"Prefetch of {tile} failed: {e}")
+        finally:
+            # clear() may already have replaced the entry
+            if self._in_flight.get(tile) is asyncio.current_task():
+                del self._in_flight[tile]
+
+    def clear(self) -> None:
+        """Forget every cached description and cancel prefetches, e.g. after the world is regenerated."""
+        for task in self._in_flight.values():
+            task.cancel()
+        self._in_flight.clear()
+        self._tiles.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Return prefetch counters; hit_rate is the share of lookups served by a prefetch."""
+        return {
+            "tiles": len(self._tiles),
+            "in_flight": len(self._in_flight),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "prefetched": self.prefetched,
+            "prefetch_hits": self.prefetch_hits,
+            "wasted": self.wasted,
+            "over_budget": self.over_budget,
+            "hit_rate": self.prefetch_hits / self.lookups if self.lookups else 0.0
+        }
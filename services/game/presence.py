@@ -0,0 +1,113 @@
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+class PresenceIndex:
+    """Uniform-grid spatial index of where online players are.
+
+    Players are bucketed by tile and by square grid cell, so queries touch
+    only the cells that overlap the area asked about. Query cost scales with
+    the number of players found, not with the number online. Players not
+    seen for idle_timeout seconds are dropped.
+    """
+
+    def __init__(self, cell_size: int = 8, idle_timeout: float = 1800.0, sweep_interval: int = 1024):
+        self.cell_size = cell_size
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._positions: Dict[str, Tile] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._tiles: Dict[Tile, Set[str]] = {}
+        self._cells: Dict[Tile, Set[str]] = {}
+        self._updates = 0
+        self._leave_listeners: List[Callable[[str], None]] = []
+
+    def _cell(self, tile: Tile) -> Tile:
+        return (tile[0] // self.cell_size, tile[1] // self.cell_size)
+
+    def update(self, player_id: str, tile: Tile) -> Set[str]:
+        """Record a player's position and return the other players already on that tile."""
+        previous = self._positions.get(player_id)
+        if previous != tile:
+            if previous is not None:
+                self._unlink(player_id, previous)
+            self._positions[player_id] = tile
+            self._tiles.setdefault(tile, set()).add(player_id)
+            self._cells.setdefault(self._cell(tile), set()).add(player_id)
+        self._last_seen[player_id] = time.monotonic()
+
+        self._updates += 1
+        if self._updates % self.sweep_interval == 0:
+            self.prune_idle()
+        return self._tiles[tile] - {player_id}
+
+    def _unlink(self, player_id: str, tile: Tile) -> None:
+        for index, key in ((self._tiles, tile), (self._cells, self._cell(tile))):
+            players = index[key]
+            players.discard(player_id)
+            if not players:
+                del index[key]
+
+    def on_leave(self, listener: Callable[[str], None]) -> None:
+        """Call listener(player_id) whenever a player is removed, including by idle pruning."""
+        self._leave_listeners.append(listener)
+
+    def remove(self, player_id: str) -> None:
+        """Take a player out of the index."""
+        tile = self._positions.pop(player_id, None)
+        self._last_seen.pop(player_id, None)
+        if tile is None:
+            return
+        self._unlink(player_id, tile)
+        for listener in self._leave_listeners:
+            try:
+                listener(player_id)
+            except Exception as e:
+                logger.error(f"Presence leave listener failed for {player_id}: {e}", exc_info=True)
+
+    def prune_idle(self) -> int:
+        """Remove players not seen within the idle timeout; return how many were removed."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [player_id for player_id, seen in self._last_seen.items() if seen < cutoff]
+        for player_id in idle:
+            self.remove(player_id)
+        return len(idle)
+
+    def position(self, player_id: str) -> Optional[Tile]:
+        return self._positions.get(player_id)
+
+    def at(self, tile: Tile) -> Set[str]:
+        """Return the players on a tile."""
+        return set(self._tiles.get(tile, ()))
+
+    def _in_box(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[Tuple[str, Tile]]:
+        """Yield players inside the inclusive box [x0, x1] x [y0, y1]."""
+        cx0, cy0 = self._cell((x0, y0))
+        cx1, cy1 = self._cell((x1, y1))
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                for player_id in self._cells.get((cx, cy), ()):
+                    x, y = self._positions[player_id]
+                    if x0 <= x <= x1 and y0 <= y <= y1:
+                        yield player_id, (x, y)
+
+    def within(self, tile: Tile, radius: int) -> List[str]:
+        """Return the players within radius tiles (Manhattan distance) of a tile."""
+        x, y = tile
+        return [
+            player_id
+            for player_id, (px, py) in self._in_box(x - radius, y - radius, x + radius, y + radius)
+            if abs(px - x) + abs(py - y) <= radius
+        ]
+
+    def in_region(self, region: Tile, region_size: int) -> List[str]:
+        """Return the players inside a region of region_size x region_size tiles."""
+        x0, y0 = region[0] * region_size, region[1] * region_size
+        return [player_id for player_id, _ in self._in_box(x0, y0, x0 + region_size - 1, y0 + region_size - 1)]
+
+    def __len__(self) -> int:
+        return len(self._positions)
@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import heapq
+import time
+import logging
+from data.models.quest import Quest
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+class QuestBoard:
+    """In-memory index of available quests by tile and by region.
+
+    The board is loaded from the database once. It is then kept current by
+    the quest service as quests are saved and completed. Expiring quests
+    sit in a heap of deadlines, so each lookup only pops the quests that
+    have just expired.
+    """
+
+    def __init__(self, region_size: int = 5):
+        self.region_size = region_size
+        self.loaded = False
+        self._quests: Dict[int, Quest] = {}
+        self._by_tile: Dict[Tile, Dict[int, Quest]] = {}
+        self._by_region: Dict[Tile, Set[int]] = {}
+        # (deadline as a timestamp, quest id); entries for removed quests are skipped when popped
+        self._deadlines: List[Tuple[float, int]] = []
+
+    def _region(self, tile: Tile) -> Tile:
+        return (tile[0] // self.region_size, tile[1] // self.region_size)
+
+    def load(self, quests: Iterable[Quest]) -> None:
+        """Replace the board with the given quests."""
+        self._quests.clear()
+        self._by_tile.clear()
+        self._by_region.clear()
+        self._deadlines.clear()
+        for quest in quests:
+            self.add(quest)
+        self.loaded = True
+        logger.info(f"Loaded {len(self._quests)} quests onto the quest board")
+
+    def add(self, quest: Quest) -> None:
+        """Put a saved quest on the board if it is available, replacing any earlier copy."""
+        self.remove(quest.quest_id)
+        if quest.quest_id is None or not quest.is_available():
+            return
+        location = tuple(quest.location)
+        self._quests[quest.quest_id] = quest
+        self._by_tile.setdefault(location, {})[quest.quest_id] = quest
+        self._by_region.setdefault(self._region(location), set()).add(quest.quest_id)
+        if quest.expires_at is not None:
+            heapq.heappush(self._deadlines, (quest.expires_at.timestamp(), quest.quest_id))
+
+    def remove(self, quest_id: Optional[int]) -> Optional[Quest]:
+        """Take a quest off the board."""
+        quest = self._quests.pop(quest_id, None)
+        if quest is None:
+            return None
+        location = tuple(quest.location)
+        quests = self._by_tile[location]
+        del quests[quest_id]
+        if not quests:
+            del self._by_tile[location]
+        region = self._region(location)
+        ids = self._by_region[region]
+        ids.discard(quest_id)
+        if not ids:
+            del self._by_region[region]
+        return quest
+
+    def expire(self, now: Optional[float] = None) -> List[int]:
+        """Remove quests whose deadline has passed; return their ids."""
+        now = time.time() if now is None else now
+        expired = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, quest_id = heapq.heappop(self._deadlines)
+            quest = self._quests.get(quest_id)
+            # Skip stale entries for quests removed or re-added with a new deadline
+            if quest is not None and quest.expires_at is not None and quest.expires_at.timestamp() == deadline:
+                self.remove(quest_id)
+                expired.append(quest_id)
+        return expired
+
+    def at(self, tile: Tile) -> List[Quest]:
+        """Return the available quests on a tile."""
+        self.expire()
+        return list(self._by_tile.get(tuple(tile), {}).values())
+
+    def in_region(self, tile: Tile) -> List[Quest]:
+        """Return the available quests in the region containing a tile."""
+        self.expire()
+        return [self._quests[quest_id] for quest_id in self._by_region.get(self._region(tile), ())]
+
+    def get(self, quest_id: int) -> Optional[Quest]:
+        return self._quests.get(quest_id)
+
+    def __len__(self) -> int:
+        return len(self._quests)
@@ -1,7 +1,11 @@
-from typing import List, Dict, Optional
-from data.models.quest import Quest
+from typing import List, Dict, Optional, Tuple
+import time
+from data.models.quest import Quest, Objective
 from data.database.repositories.quest_repository import QuestRepository
 from ..ai.narrative_service import NarrativeService
+from .events import EventBus, GameEvent, ITEM_GAINED, KILLED, MOVED, QUEST_COMPLETED
+from .quest_tracker import QuestTracker
+from .quest_board import QuestBoard
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,9 +15,34 @@ class QuestService:
     
     def __init__(self, 
                  quest_repository: QuestRepository,
-                 narrative_service: NarrativeService):
+                 narrative_service: NarrativeService,
+                 events: Optional[EventBus] = None,
+                 tracker: Optional[QuestTracker] = None,
+                 board: Optional[QuestBoard] = None,
+                 board_refresh_interval: float = 30.0):
         self.repository = quest_repository
         self.narrative_service = narrative_service
+        self.events = events
+        self.tracker = tracker if tracker is not None else QuestTracker(quest_repository)
+        self.board = board if board is not None else QuestBoard()
+        # Other processes sharing the database add and complete quests too, so
+        # the board is reloaded when the stored open quests change
+        self.board_refresh_interval = board_refresh_interval
+        self._board_signature: Optional[Tuple[int, int]] = None
+        self._board_checked_at = 0.0
+        if events is not None:
+            for kind in (MOVED, KILLED, ITEM_GAINED):
+                events.subscribe(kind, self._on_event)
+
+    @staticmethod
+    def default_objectives(theme: str, location: tuple, difficulty: int) -> List[Objective]:
+        """Return the objectives a generated quest of a theme gets."""
+        if theme == "combat":
+            return [Objective(KILLED, None, difficulty + 2)]
+        if theme == "collection":
+            return [Objective(ITEM_GAINED, None, difficulty + 1)]
+        # Exploration, rescue and mystery quests send the player somewhere nearby
+        return [Objective(MOVED, (location[0] + difficulty, location[1]))]
 
     async def generate_quests(self, 
                             location: tuple,
@@ -33,18 +62,64 @@ class QuestService:
             )
             
             quest = Quest(
+                title=f"{theme.title()} quest at {location}",
                 location=location,
                 description=description,
                 difficulty=difficulty,
-                theme=theme
+                theme=theme,
+                objectives=self.default_objectives(theme, location, difficulty)
             )
             quests.append(quest)
             
         return quests
 
+    def load_board(self) -> None:
+        """Load the available quests onto the quest board."""
+        # Read the signature first so changes made during the load are caught next time
+        self._board_signature = self.repository.get_board_signature()
+        self._board_checked_at = time.monotonic()
+        self.board.load(self.repository.get_available_quests())
+
+    def _refresh_board(self) -> None:
+        """Load the board if needed, and reload it if the stored quests changed since."""
+        if not self.board.loaded:
+            self.load_board()
+            return
+        if time.monotonic() - self._board_checked_at < self.board_refresh_interval:
+            return
+        self._board_checked_at = time.monotonic()
+        if self.repository.get_board_signature() != self._board_signature:
+            self.load_board()
+
+    def save_quest(self, quest: Quest) -> int:
+        """Save a new quest and post it on the quest board."""
+        quest.quest_id = self.repository.save(quest)
+        if self.board.loaded:
+            self.board.add(quest)
+        return quest.quest_id
+
     def get_available_quests(self, location: tuple) -> List[Quest]:
         """Get all available quests at a location."""
-        return self.repository.get_quests_at_location(location)
+        self._refresh_board()
+        return self.board.at(location)
+
+    def get_quests_in_region(self, location: tuple) -> List[Quest]:
+        """Get all available quests in the region containing a location."""
+        self._refresh_board()
+        return self.board.in_region(location)
+
+    def accept_quest(self, quest_id: int, character_id: str) -> Optional[Quest]:
+        """Start tracking a player's progress on a quest's objectives."""
+        quest = self.board.get(quest_id)
+        if quest is None:
+            # Possibly posted by another process since the board was loaded
+            quest = self.repository.get_quest(quest_id)
+            if quest and quest.is_available() and self.board.loaded:
+                self.board.add(quest)
+        if not quest or not quest.is_available():
+            return None
+        self.tracker.track(character_id, quest)
+        return quest
 
     def complete_quest(self, quest_id: int, character_id: str) -> bool:
         """Mark a quest as completed and grant rewards."""
@@ -54,5 +129,19 @@ class QuestService:
             
         # Add completion logic here
         quest.complete(character_id)
-        self.repository.update_quest(quest)
-        return True
\ No newline at end of file
+        if not self.repository.complete_quest(quest_id, character_id, quest.completed_at):
+            # Someone else completed it first
+            self.tracker.untrack(character_id, quest_id)
+            return False
+        # Quests complete once, so nobody else can finish it any more
+        self.tracker.drop_quest(quest_id)
+        self.board.remove(quest_id)
+        if self.events is not None:
+            self.events.publish(GameEvent(QUEST_COMPLETED, character_id, quest_id))
+        return True
+
+    def _on_event(self, event: GameEvent) -> None:
+        """Advance the objectives waiting for an event, completing quests they finish."""
+        for quest_id in self.tracker.handle(event):
+            logger.info(f"Player {event.player_id} finished the objectives of quest {quest_id}")
+            self.complete_quest(quest_id, event.player_id)
\ No newline at end of file
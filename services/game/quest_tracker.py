@@ -0,0 +1,163 @@
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+import asyncio
+import logging
+from data.models.quest import Quest
+from data.database.repositories.quest_repository import QuestRepository
+from .events import GameEvent
+
+logger = logging.getLogger(__name__)
+
+# (event kind, target); a target of None matches any target
+IndexKey = Tuple[str, Hashable]
+# (quest id, player id)
+ProgressKey = Tuple[int, str]
+
+class QuestTracker:
+    """Tracks players' progress on quest objectives, indexed by the events that advance them.
+
+    Each unfinished objective is registered under its (kind, target) key,
+    and then under the player. An event therefore touches only the
+    objectives waiting for it, however many quests are active. Progress is
+    kept in memory and flushed to SQLite in batches.
+    """
+
+    def __init__(self, repository: Optional[QuestRepository] = None, flush_interval: float = 30.0):
+        self.repository = repository
+        self.flush_interval = flush_interval
+        # (kind, target) -> player -> [(quest id, objective index)]
+        self._index: Dict[IndexKey, Dict[str, List[Tuple[int, int]]]] = {}
+        self._quests: Dict[int, Quest] = {}
+        # quest id -> players tracking it
+        self._players: Dict[int, Set[str]] = {}
+        self._progress: Dict[ProgressKey, List[int]] = {}
+        self._dirty: Set[ProgressKey] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def track(self, player_id: str, quest: Quest, progress: Optional[List[int]] = None) -> None:
+        """Start tracking a player's progress on a quest's objectives."""
+        key = (quest.quest_id, player_id)
+        if key in self._progress:
+            return
+        self._quests[quest.quest_id] = quest
+        self._players.setdefault(quest.quest_id, set()).add(player_id)
+        counts = list(progress) if progress else [0] * len(quest.objectives)
+        self._progress[key] = counts
+        for index, objective in enumerate(quest.objectives):
+            if counts[index] < objective.required:
+                entries = self._index.setdefault((objective.kind, objective.target), {})
+                entries.setdefault(player_id, []).append((quest.quest_id, index))
+        if progress is None:
+            self._dirty.add(key)
+
+    def untrack(self, player_id: str, quest_id: int) -> None:
+        """Stop tracking a player's progress on a quest."""
+        if self._progress.pop((quest_id, player_id), None) is None:
+            return
+        self._dirty.discard((quest_id, player_id))
+        quest = self._quests[quest_id]
+        for objective in quest.objectives:
+            self._unindex(objective.kind, objective.target, player_id, quest_id)
+        players = self._players[quest_id]
+        players.discard(player_id)
+        if not players:
+            del self._players[quest_id]
+            del self._quests[quest_id]
+
+    def drop_quest(self, quest_id: int) -> int:
+        """Stop tracking a quest for every player; return how many were tracking it."""
+        players = list(self._players.get(quest_id, ()))
+        for player_id in players:
+            self.untrack(player_id, quest_id)
+        return len(players)
+
+    def _unindex(self, kind: str, target: Any, player_id: str, quest_id: int,
+                 index: Optional[int] = None) -> None:
+        entries = self._index.get((kind, target))
+        if entries is None or player_id not in entries:
+            return
+        remaining = [
+            entry for entry in entries[player_id]
+            if entry[0] != quest_id or (index is not None and entry[1] != index)
+        ]
+        if remaining:
+            entries[player_id] = remaining
+        else:
+            del entries[player_id]
+            if not entries:
+                del self._index[(kind, target)]
+
+    def handle(self, event: GameEvent) -> List[int]:
+        """Apply an event; return the ids of quests the player has now finished every objective of."""
+        waiting = []
+        keys = [(event.kind, event.target)]
+        if event.target is not None:
+            # Objectives with no target match every event of their kind
+            keys.append((event.kind, None))
+        for key in keys:
+            entries = self._index.get(key)
+            if entries and event.player_id in entries:
+                waiting.extend(entries[event.player_id])
+
+        finished = []
+        for quest_id, index in waiting:
+            progress_key = (quest_id, event.player_id)
+            counts = self._progress[progress_key]
+            objective = self._quests[quest_id].objectives[index]
+            counts[index] = min(objective.required, counts[index] + event.amount)
+            self._dirty.add(progress_key)
+            if counts[index] >= objective.required:
+                self._unindex(objective.kind, objective.target, event.player_id, quest_id, index)
+                if all(count >= goal.required for count, goal in zip(counts, self._quests[quest_id].objectives)):
+                    finished.append(quest_id)
+        return finished
+
+    def progress(self, player_id: str, quest_id: int) -> Optional[List[int]]:
+        """Return a player's count towards each of a quest's objectives, if tracked."""
+        counts = self._progress.get((quest_id, player_id))
+        return list(counts) if counts is not None else None
+
+    def load(self) -> int:
+        """Resume tracking the saved progress on unfinished quests; return how many were loaded."""
+        if self.repository is None:
+            return 0
+        loaded = 0
+        for quest, player_id, progress in self.repository.load_quest_progress():
+            self.track(player_id, quest, progress)
+            loaded += 1
+        return loaded
+
+    def flush(self) -> int:
+        """Write changed progress to the database and return the number of rows written."""
+        if not self._dirty or self.repository is None:
+            return 0
+        dirty, self._dirty = self._dirty, set()
+        rows = [(quest_id, player_id, self._progress[(quest_id, player_id)])
+                for quest_id, player_id in dirty if (quest_id, player_id) in self._progress]
+        try:
+            self.repository.save_quest_progress(rows)
+        except Exception as e:
+            logger.error(f"Failed to flush quest progress, will retry: {e}")
+            self._dirty |= dirty
+            return 0
+        logger.debug(f"Flushed progress on {len(rows)} quests")
+        return len(rows)
+
+    def start(self) -> None:
+        """Start the periodic flush loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write any remaining progress."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._progress)
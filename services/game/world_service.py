@@ -1,65 +1,243 @@
-from typing import Dict, List, Tuple, Optional
+from typing import AsyncIterator, Dict, List, Mapping, Set, Tuple, Optional
 from data.models.world import Region, Location
+from data.models.explored import ExploredTiles
 from data.database.repositories.world_repository import WorldRepository
 from ..ai.narrative_service import NarrativeService
+from ..engine.command_bus import CommandBus
+from ..engine.codec import decode_regions
+from ..engine.snapshot import WorldSnapshot, open_snapshot, write_snapshot
+from .chunk_manager import ChunkManager
+from .prefetcher import DescriptionPrefetcher
+from .pathfinding import CostGrid, Pathfinder
+from .presence import PresenceIndex
+from .map_renderer import MapRenderer
+from .events import EventBus, GameEvent, MOVED
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 class WorldService:
     """Manages world generation, state, and interactions."""
+
+    DIRECTIONS = {"north": (0, -1), "east": (1, 0), "south": (0, 1), "west": (-1, 0)}
     
     def __init__(self, 
                  world_repository: WorldRepository,
                  narrative_service: NarrativeService,
                  world_width: int = 20,
                  world_height: int = 20,
-                 region_size: int = 5):
+                 region_size: int = 5,
+                 command_bus: Optional[CommandBus] = None,
+                 snapshot_path: Optional[str] = None,
+                 chunk_manager: Optional[ChunkManager] = None,
+                 prefetcher: Optional[DescriptionPrefetcher] = None,
+                 presence: Optional[PresenceIndex] = None,
+                 map_radius: int = 7,
+                 events: Optional[EventBus] = None):
         self.repository = world_repository
         self.narrative_service = narrative_service
+        self.command_bus = command_bus
+        self.snapshot_path = snapshot_path
+        self.chunk_manager = chunk_manager
+        self.prefetcher = prefetcher
+        self.presence = presence if presence is not None else PresenceIndex()
+        if chunk_manager is not None:
+            # Players who go idle stop pinning their chunk
+            self.presence.on_leave(chunk_manager.remove_player)
+        self.events = events
         self.width = world_width
         self.height = world_height
         self.region_size = region_size
-        self.current_world = None
+        self.current_world: Optional[Mapping[Tuple[int, int], Region]] = None
+        self.cost_grid = CostGrid(self.get_region_at_location, region_size)
+        self.pathfinder = Pathfinder(self.cost_grid, self._neighbours)
+        self.map_renderer = MapRenderer(self.get_region_at_location, region_size, radius=map_radius)
+        if chunk_manager is not None:
+            # Drop cached costs and map tiles along with the chunks they came from
+            chunk_manager.on_evict(self.cost_grid.invalidate_regions)
+            chunk_manager.on_evict(self.map_renderer.invalidate_regions)
 
     async def generate_world(self, seed: Optional[int] = None) -> None:
         """Generate a new world with regions."""
-        self.current_world = await self.repository.generate_world(
-            self.width, 
-            self.height, 
-            self.region_size, 
-            seed
-        )
-        logger.info("World generated successfully.")
+        if self.command_bus is not None:
+            encoded = await self.command_bus.dispatch(
+                "world.generate",
+                self.repository.db_manager.db_path,
+                self.width,
+                self.height,
+                seed
+            )
+            self.current_world = decode_regions(encoded, self.repository.BIOMES)
+        else:
+            self.current_world = await self.repository.generate_world(
+                self.width, 
+                self.height, 
+                self.region_size, 
+                seed
+            )
+        if self.snapshot_path:
+            write_snapshot(self.current_world, self.snapshot_path)
+        self.cost_grid.clear()
+        self.pathfinder.clear()
+        self.map_renderer.clear()
+        if self.prefetcher is not None:
+            self.prefetcher.clear()
 
-    async def get_location_description(self, location: Tuple[int, int]) -> str:
-        """Get or generate a description for a location."""
+    def load_world(self) -> None:
+        """Load the world, memory-mapping its snapshot when one is configured.
+
+        A missing snapshot is exported from the database first, so only the
+        first start pays for decoding every row. With a chunk manager, regions
+        are instead loaded in chunks as they are first needed.
+        """
+        if self.chunk_manager is not None:
+            self.current_world = self.chunk_manager
+            return
+
+        if not self.snapshot_path:
+            self.current_world = self.repository.load_world()
+            return
+
+        snapshot = open_snapshot(self.snapshot_path)
+        if snapshot is None:
+            write_snapshot(self.repository.load_world(), self.snapshot_path)
+            snapshot = WorldSnapshot(self.snapshot_path)
+        self.current_world = snapshot
+        logger.info(f"World snapshot mapped from {self.snapshot_path} ({len(snapshot)} regions).")
+
+    def _location_context(self, location: Tuple[int, int]) -> Tuple[str, List[str]]:
+        """Return the biome and features used to describe a location."""
         region = self.get_region_at_location(location)
         if not region:
             raise ValueError("Invalid location")
+        return region.biome, self.get_location_features(location)
 
-        features = self.get_location_features(location)
-        description = await self.narrative_service.generate_location_description(
-            region.biome,
-            features
-        )
+    async def get_location_description(self, location: Tuple[int, int]) -> str:
+        """Get or generate a description for a location."""
+        if self.prefetcher is not None:
+            await self._await_prefetch(location)
+            description = self.prefetcher.get(location)
+            if description is not None:
+                return description
+
+        description = await self._generate_description(location)
+        if self.prefetcher is not None:
+            self.prefetcher.put(location, description)
         logger.info(f"Location description retrieved for {location}: {description}")
         return description
 
+    async def _generate_description(self, location: Tuple[int, int]) -> str:
+        biome, features = self._location_context(location)
+        return await self.narrative_service.generate_location_description(
+            biome,
+            features
+        )
+
+    def stream_location_description(self, location: Tuple[int, int]) -> AsyncIterator[str]:
+        """Stream a description for a location as it is generated."""
+        biome, features = self._location_context(location)
+        if self.prefetcher is None:
+            return self.narrative_service.stream_location_description(biome, features)
+        return self._stream_cached_description(location, biome, features)
+
+    async def _stream_cached_description(self,
+                                         location: Tuple[int, int],
+                                         biome: str,
+                                         features: List[str]) -> AsyncIterator[str]:
+        await self._await_prefetch(location)
+        description = self.prefetcher.get(location)
+        if description is not None:
+            yield description
+            return
+
+        parts = []
+        async for chunk in self.narrative_service.stream_location_description(biome, features):
+            parts.append(chunk)
+            yield chunk
+        self.prefetcher.put(location, "".join(parts))
+
+    async def _await_prefetch(self, location: Tuple[int, int]) -> None:
+        """Wait for a prefetch already generating this tile rather than generating it twice."""
+        pending = self.prefetcher.pending(location)
+        if pending is not None:
+            # Shielded so a cancelled command does not cancel the shared prefetch
+            await asyncio.shield(pending)
+
+    def prefetch_neighbours(self, location: Tuple[int, int], heading: Optional[str] = None) -> None:
+        """Warm descriptions of the tiles around a location in the background.
+
+        Tiles are queued most likely first: straight ahead, then either side,
+        then back the way the player came.
+        """
+        if self.prefetcher is None:
+            return
+
+        order = list(self.DIRECTIONS)
+        if heading in self.DIRECTIONS:
+            dx, dy = self.DIRECTIONS[heading]
+            order.sort(key=lambda d: -(self.DIRECTIONS[d][0] * dx + self.DIRECTIONS[d][1] * dy))
+
+        tiles = []
+        for direction in order:
+            try:
+                tiles.append(self.resolve_move(location, direction))
+            except ValueError:
+                continue
+        self.prefetcher.schedule(tiles, self._generate_description)
+
     def get_region_at_location(self, location: Tuple[int, int]) -> Optional[Region]:
         """Get the region data for a specific location."""
-        x, y = location
-        if not self.current_world:
-            self.current_world = self.repository.load_world()
-        
-        region_x = x // self.region_size
-        region_y = y // self.region_size
+        if self.current_world is None:
+            self.load_world()
         
         try:
-            return self.current_world[(region_x, region_y)]
+            return self.current_world[self._region_key(location)]
         except KeyError:
             return None
 
+    def _region_key(self, location: Tuple[int, int]) -> Tuple[int, int]:
+        x, y = location
+        return (x // self.region_size, y // self.region_size)
+
+    def track_player(self, player_id: str, location: Tuple[int, int]) -> Set[str]:
+        """Record a player's location and return the other players already there.
+
+        Also keeps the world around the player resident when it is chunked.
+        """
+        if self.chunk_manager is not None:
+            self.chunk_manager.move_player(player_id, self._region_key(location))
+        if self.events is not None and self.presence.position(player_id) != location:
+            self.events.publish(GameEvent(MOVED, player_id, location))
+        return self.presence.update(player_id, location)
+
+    def players_nearby(self, location: Tuple[int, int], radius: int = 0) -> List[str]:
+        """Return the players within radius tiles of a location."""
+        if radius == 0:
+            return list(self.presence.at(location))
+        return self.presence.within(location, radius)
+
+    def players_in_region(self, location: Tuple[int, int]) -> List[str]:
+        """Return the players in the same region as a location."""
+        return self.presence.in_region(self._region_key(location), self.region_size)
+
+    def _others_in_view(self, location: Tuple[int, int], player_id: Optional[str]) -> List[Tuple[int, int]]:
+        return [
+            self.presence.position(other)
+            for other in self.presence.within(location, self.map_renderer.radius * 2)
+            if other != player_id
+        ]
+
+    def render_map(self, location: Tuple[int, int], explored: Optional[ExploredTiles] = None,
+                   player_id: Optional[str] = None) -> str:
+        """Render the map around a location as text, fogging unexplored tiles."""
+        return self.map_renderer.render_ascii(location, explored, self._others_in_view(location, player_id))
+
+    def render_map_png(self, location: Tuple[int, int], explored: Optional[ExploredTiles] = None,
+                       player_id: Optional[str] = None) -> bytes:
+        """Render the map around a location as a PNG image."""
+        return self.map_renderer.render_png(location, explored, self._others_in_view(location, player_id))
+
     def get_location_features(self, location: Tuple[int, int]) -> List[str]:
         """Get special features at a location."""
         region = self.get_region_at_location(location)
@@ -75,29 +253,101 @@ class WorldService:
             features.append("mysterious structure")
         return features
 
-    async def move_character(self, 
-                             current_location: Tuple[int, int], 
-                             direction: str) -> Tuple[Tuple[int, int], str]:
-        """Move character in a direction and get new location description."""
-        x, y = current_location
-        
-        if direction == "north":
-            y -= 1
-        elif direction == "south":
-            y += 1
-        elif direction == "east":
-            x += 1
-        elif direction == "west":
-            x -= 1
-        else:
+    def resolve_move(self,
+                     current_location: Tuple[int, int],
+                     direction: str) -> Tuple[int, int]:
+        """Return the location reached by moving one tile in a direction."""
+        if direction not in self.DIRECTIONS:
             raise ValueError("Invalid direction")
+        dx, dy = self.DIRECTIONS[direction]
+        x, y = current_location[0] + dx, current_location[1] + dy
         
-        if not (0 <= x < self.width and 0 <= y < self.height):
+        # Chunked worlds are generated on demand, so they have no edge
+        if self.chunk_manager is None and not (0 <= x < self.width and 0 <= y < self.height):
             raise ValueError("Cannot move beyond world boundaries")
         
-        new_location = (x, y)
+        return (x, y)
+
+    def _neighbours(self, location: Tuple[int, int]) -> List[Tuple[int, int]]:
+        neighbours = []
+        for direction in self.DIRECTIONS:
+            try:
+                neighbours.append(self.resolve_move(location, direction))
+            except ValueError:
+                continue
+        return neighbours
+
+    def plan_travel(self, start: Tuple[int, int], destination: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Return the cheapest route to a destination, excluding the start."""
+        x, y = destination
+        if self.chunk_manager is None and not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError("Cannot travel beyond world boundaries")
+        if self.get_region_at_location(destination) is None:
+            raise ValueError("Invalid destination")
+        path = self.pathfinder.find_path(start, destination)
+        if path is None:
+            raise ValueError(f"No route to {destination}")
+        return path
+
+    def notable_waypoints(self, path: List[Tuple[int, int]], limit: int = 5) -> List[Tuple[str, List[str]]]:
+        """Pick the stops worth narrating: where the biome changes or a region has features."""
+        waypoints = []
+        last_key = None
+        last_biome = None
+        for location in path[:-1]:
+            key = self._region_key(location)
+            if key == last_key:
+                continue
+            region = self.get_region_at_location(location)
+            if region is None:
+                continue
+            features = self.get_location_features(location)
+            if region.biome != last_biome or features:
+                stop = (region.biome, features)
+                if not waypoints or waypoints[-1] != stop:
+                    waypoints.append(stop)
+            last_key, last_biome = key, region.biome
+
+        if len(waypoints) > limit:
+            # Keep an even spread of stops along the route
+            step = len(waypoints) / limit
+            waypoints = [waypoints[int(i * step)] for i in range(limit)]
+        return waypoints
+
+    def stream_travel_narrative(self, path: List[Tuple[int, int]]) -> AsyncIterator[str]:
+        """Stream a single narrative for a whole journey, ending at the path's last tile."""
+        biome, features = self._location_context(path[-1])
+        return self.narrative_service.stream_journey_narrative(self.notable_waypoints(path), biome, features)
+
+    async def travel_character(self,
+                               current_location: Tuple[int, int],
+                               destination: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], str]:
+        """Travel to a destination along the cheapest route and narrate the journey once."""
+        path = self.plan_travel(current_location, destination)
+        if not path:
+            return path, await self.get_location_description(destination)
+
+        biome, features = self._location_context(destination)
+        narrative = await self.narrative_service.generate_journey_narrative(
+            self.notable_waypoints(path),
+            biome,
+            features
+        )
+        self.prefetch_neighbours(destination)
+        logger.info(f"Character travelled from {current_location} to {destination} over {len(path)} tiles")
+        return path, narrative
+
+    async def move_character(self, 
+                             current_location: Tuple[int, int], 
+                             direction: str,
+                             player_id: Optional[str] = None) -> Tuple[Tuple[int, int], str]:
+        """Move character in a direction and get new location description."""
+        new_location = self.resolve_move(current_location, direction)
+        if player_id is not None:
+            self.track_player(player_id, new_location)
         
         description = await self.get_location_description(new_location)
+        self.prefetch_neighbours(new_location, direction)
         
         logger.info(f"Character moved from {current_location} to {new_location} in direction {direction}")
-        return new_location, description
\ No newline at end of file
+        return new_location, description
@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+from core.exceptions import CommandBusyError
+from services.discord.admission import CommandAdmission
+
+@pytest.mark.asyncio
+async def test_user_commands_are_serialised():
+    admission = CommandAdmission()
+    running = []
+    overlap = []
+
+    async def command(i):
+        async with admission.admit("u1", "g1"):
+            overlap.append(len(running))
+            running.append(i)
+            await asyncio.sleep(0.01)
+            running.remove(i)
+
+    await asyncio.gather(*(command(i) for i in range(3)))
+    assert overlap == [0, 0, 0]
+    assert admission.stats()["admitted"] == 3
+    assert admission.stats()["active_users"] == 0
+
+@pytest.mark.asyncio
+async def test_full_user_queue_is_shed():
+    admission = CommandAdmission(user_queue_limit=1)
+    release = asyncio.Event()
+
+    async def command():
+        async with admission.admit("u1", None):
+            await release.wait()
+
+    tasks = [asyncio.create_task(command()) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(CommandBusyError):
+        async with admission.admit("u1", None):
+            pass
+    release.set()
+    await asyncio.gather(*tasks)
+    assert admission.stats()["shed"] == 1
+
+@pytest.mark.asyncio
+async def test_guild_concurrency_is_capped():
+    admission = CommandAdmission(guild_concurrency=2, guild_queue_limit=1)
+    active = 0
+    peak = 0
+
+    async def command(user):
+        nonlocal active, peak
+        async with admission.admit(user, "g1"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    results = await asyncio.gather(*(command(f"u{i}") for i in range(4)), return_exceptions=True)
+    assert peak == 2
+    assert sum(isinstance(r, CommandBusyError) for r in results) == 1
+    assert admission.wait_time.count == 3
@@ -0,0 +1,98 @@
+from contextlib import contextmanager
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.character_repository import CharacterRepository
+from data.models.character import Character
+
+class TracingDatabaseManager(DatabaseManager):
+    """Records every character-row write issued through its connections."""
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self.writes = []
+
+    @contextmanager
+    def get_connection(self):
+        with super().get_connection() as conn:
+            conn.set_trace_callback(
+                lambda sql: self.writes.append(sql) if "INTO characters" in sql else None
+            )
+            yield conn
+
+def make_repository(tmp_path):
+    db_manager = TracingDatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    return db_manager, CharacterRepository(db_manager)
+
+def test_only_changed_columns_are_written(tmp_path):
+    db_manager, repository = make_repository(tmp_path)
+    character = Character(name="Aria", xp=40)
+    repository.save("1", character)
+
+    db_manager.writes.clear()
+    repository.save("1", character)
+    assert db_manager.writes == []
+
+    character.stats["HP"] -= 30
+    character.xp += 5
+    repository.save("1", character)
+    assert len(db_manager.writes) == 1
+    assert "hp = excluded.hp" in db_manager.writes[0]
+    assert "xp = excluded.xp" in db_manager.writes[0]
+    assert "name = excluded.name" not in db_manager.writes[0]
+
+    reloaded = CharacterRepository(db_manager).load("1")
+    assert reloaded.xp == 45 and reloaded.stats["HP"] == 70
+    assert reloaded.dirty_fields() == {}
+
+def test_save_many_writes_every_character_in_one_statement(tmp_path):
+    db_manager, repository = make_repository(tmp_path)
+    party = [Character(name=f"Hero {i}") for i in range(3)]
+    assert repository.save_many([(str(i), hero) for i, hero in enumerate(party)]) == 3
+
+    db_manager.writes.clear()
+    party[0].stats["HP"] = 1
+    party[2].level = 4
+    assert repository.save_many([(str(i), hero) for i, hero in enumerate(party)]) == 2
+    assert len(db_manager.writes) == 1
+
+    fresh = CharacterRepository(db_manager)
+    assert fresh.load("0").stats["HP"] == 1
+    assert fresh.load("2").level == 4
+    assert fresh.load("1").stats["HP"] == 100
+
+def test_identity_map_is_bounded_and_drops_idle_characters(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    repository = CharacterRepository(db_manager, max_cached=2)
+    heroes = [Character(name=f"Hero {i}") for i in range(3)]
+    for i, hero in enumerate(heroes):
+        repository.save(str(i), hero)
+
+    assert list(repository._loaded) == ["1", "2"]
+    assert repository.load("0") is not heroes[0]
+    assert repository.load("0").name == "Hero 0"
+
+    repository.idle_timeout = 0.0
+    repository.save("3", Character(name="Hero 3"))
+    assert list(repository._loaded) == ["3"]
+
+def test_changes_saved_elsewhere_replace_the_cached_copy(tmp_path):
+    path = str(tmp_path / "game.db")
+    here = CharacterRepository(DatabaseManager(path))
+    there = CharacterRepository(DatabaseManager(path))
+    here.save("1", Character(name="Aria"))
+    cached = here.load("1")
+
+    other = there.load("1")
+    other.stats["HP"] = 12
+    other.inventory.add("Torch")
+    there.save("1", other)
+    assert here.load("1") is not cached
+
+    fresh = here.load("1")
+    assert fresh.stats["HP"] == 12 and fresh.inventory == {"Torch": 1}
+    assert here.load("1") is fresh
+
+    there.save("1", other)  # nothing changed, so the revision stays put
+    other.inventory.add("Rope")
+    there.save("1", other)
+    assert here.load("1").inventory == {"Torch": 1, "Rope": 1}
@@ -0,0 +1,76 @@
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.world_repository import WorldRepository
+from services.game.chunk_manager import ChunkManager
+
+def make_manager(tmp_path, **kwargs) -> ChunkManager:
+    repository = WorldRepository(DatabaseManager(str(tmp_path / "game.db")))
+    return ChunkManager(repository, seed=42, chunk_size=4, **kwargs)
+
+def test_chunks_are_generated_deterministically_and_persisted(tmp_path):
+    manager = make_manager(tmp_path)
+    region = manager[(-100, 1000)]
+    assert manager.stats()["generated"] == 1
+
+    # A fresh manager over the same database loads rather than regenerates
+    reloaded = make_manager(tmp_path)[(-100, 1000)]
+    assert reloaded == region
+    assert region == manager.repository.build_region(-100, 1000, 42)
+
+def test_cold_chunks_are_evicted_but_pinned_chunks_stay(tmp_path):
+    manager = make_manager(tmp_path, max_chunks=3, view_radius=0)
+    manager.move_player("p1", (0, 0))
+    for x in range(4, 40, 4):
+        manager[(x, 0)]
+
+    stats = manager.stats()
+    assert stats["resident_chunks"] == 3
+    assert stats["pinned_chunks"] == 1
+    assert (0, 0) in manager._chunks
+
+    # Leaving unpins the old chunk, making it the eviction candidate
+    manager.move_player("p1", (100, 100))
+    assert (0, 0) not in manager._chunks
+    assert manager._chunks[(25, 25)].players == 1
+
+def test_view_radius_loads_neighbouring_chunks(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.move_player("p1", (10, 10))
+    assert manager.stats()["resident_chunks"] == 9
+
+def test_idle_players_stop_pinning_chunks(tmp_path):
+    from services.game.presence import PresenceIndex
+    from services.game.world_service import WorldService
+
+    manager = make_manager(tmp_path, max_chunks=2, view_radius=0)
+    presence = PresenceIndex(idle_timeout=3600.0)
+    world = WorldService(manager.repository, None, region_size=1, chunk_manager=manager, presence=presence)
+    world.track_player("p1", (0, 0))
+    world.track_player("p2", (40, 0))
+    assert manager.stats()["pinned_chunks"] == 2
+
+    presence.idle_timeout = 0.0
+    assert presence.prune_idle() == 2
+    assert manager.stats()["pinned_chunks"] == 0
+
+    # The unpinned chunks are evicted once new ones are needed
+    world.track_player("p3", (80, 0))
+    manager[(120, 0)]
+    assert manager.stats()["resident_chunks"] == 2
+    assert (0, 0) not in manager._chunks and (10, 0) not in manager._chunks
+
+def test_evicted_chunks_are_dropped_from_the_world_caches(tmp_path):
+    from services.game.world_service import WorldService
+
+    manager = make_manager(tmp_path, max_chunks=16, view_radius=0)
+    world = WorldService(manager.repository, None, region_size=1, chunk_manager=manager, map_radius=1)
+    world.cost_grid.cost((1, 1))
+    # Rendering the viewport fills a 16x16 block, loading 16 chunks
+    world.map_renderer.viewport((1, 1))
+    assert world.map_renderer.stats()["regions"] == 256
+
+    manager[(40, 40)]
+    assert (0, 0) not in manager._chunks
+    stats = world.map_renderer.stats()
+    assert stats["regions"] == 240
+    assert stats["blocks"] == 0 and stats["viewports"] == 0
+    assert (1, 1) not in world.cost_grid._costs
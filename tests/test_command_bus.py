@@ -0,0 +1,63 @@
+import pytest
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.world_repository import WorldRepository
+from services.engine.codec import decode_regions, encode_regions
+from services.engine.command_bus import InProcessCommandBus, ProcessPoolCommandBus
+
+def test_region_codec_round_trip(tmp_path):
+    repository = WorldRepository(DatabaseManager(str(tmp_path / "world.db")))
+    regions = repository.build_regions(7, 4, seed=3)
+
+    encoded = encode_regions(regions, WorldRepository.BIOMES)
+    decoded = decode_regions(encoded, WorldRepository.BIOMES)
+
+    assert len(encoded) == 8 + 2 * 7 * 4
+    assert decoded == regions
+
+@pytest.mark.asyncio
+async def test_unknown_operation_is_rejected():
+    bus = InProcessCommandBus()
+    with pytest.raises(ValueError):
+        await bus.dispatch("engine.missing")
+
+@pytest.mark.asyncio
+async def test_pool_generates_same_world_as_in_process(tmp_path):
+    local = InProcessCommandBus()
+    pool = ProcessPoolCommandBus(1)
+    try:
+        expected = await local.dispatch("world.generate", str(tmp_path / "a.db"), 5, 5, 11)
+        actual = await pool.dispatch("world.generate", str(tmp_path / "b.db"), 5, 5, 11)
+    finally:
+        pool.close()
+
+    assert actual == expected
+    assert pool.bytes_received > 0
+    assert pool.latency.get("world.generate").summary()["count"] == 1
+
+@pytest.mark.asyncio
+async def test_pool_combat_updates_live_characters(tmp_path):
+    from data.database.repositories.character_repository import CharacterRepository
+    from data.models.character import Character
+    from services.game.combat_service import CombatService
+
+    repository = CharacterRepository(DatabaseManager(str(tmp_path / "game.db")))
+    repository.save("1", Character(name="Aria"))
+    hero = repository.load("1")
+
+    pool = ProcessPoolCommandBus(1)
+    try:
+        service = CombatService(narrative_service=None, command_bus=pool)
+        _, combat = service.start_combat([hero])
+        enemies = list(combat.enemies)
+        enemy_hp = [enemy.hp for enemy in enemies]
+        service.add_action(hero, "attack")
+        await service._resolve_mechanics()
+    finally:
+        pool.close()
+
+    # The worker's copies are discarded; the live objects carry the round's damage
+    assert service.current_combat is combat and combat.enemies == enemies
+    assert repository.load("1") is hero
+    assert hero.stats["HP"] < 100
+    assert [enemy.hp for enemy in combat.enemies] != enemy_hp
+    assert hero.dirty_fields() == {"HP": hero.stats["HP"]}
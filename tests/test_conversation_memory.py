@@ -0,0 +1,46 @@
+import pytest
+from services.ai.conversation_memory import ConversationMemory
+
+@pytest.mark.asyncio
+async def test_overflow_is_summarised():
+    """Turns beyond the ring buffer are folded into the rolling summary."""
+    seen = []
+
+    async def summariser(summary, turns):
+        seen.extend(turns)
+        return f"{summary}|{len(turns)}"
+
+    memory = ConversationMemory(max_turns=2, summariser=summariser)
+    for i in range(5):
+        memory.record("p1", "Smith", f"hello {i}", f"reply {i}")
+    await memory.drain()
+
+    conversation = memory.get("p1", "Smith")
+    assert [t[0] for t in conversation.turns] == ["hello 3", "hello 4"]
+    assert [t[0] for t in seen] == ["hello 0", "hello 1", "hello 2"]
+
+    context = memory.build_context("p1", "Smith")
+    assert "Earlier conversation" in context
+    assert "Player: hello 4" in context
+    assert "hello 0" not in context
+
+@pytest.mark.asyncio
+async def test_token_budget_bounds_recent_turns():
+    memory = ConversationMemory(token_budget=50, max_turns=100)
+    for i in range(20):
+        memory.record("p1", "Smith", "x" * 40, "y" * 40)
+    await memory.drain()
+
+    assert memory.get("p1", "Smith").tokens <= 50
+
+@pytest.mark.asyncio
+async def test_least_recently_used_conversation_is_evicted():
+    memory = ConversationMemory(max_conversations=2)
+    memory.record("p1", "Smith", "a", "b")
+    memory.record("p2", "Smith", "a", "b")
+    memory.get("p1", "Smith")
+    memory.record("p3", "Smith", "a", "b")
+
+    assert len(memory) == 2
+    assert memory.get("p2", "Smith") is None
+    assert memory.build_context("p1", "Smith") is not None
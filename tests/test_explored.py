@@ -0,0 +1,52 @@
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.character_repository import CharacterRepository
+from data.models.explored import ExploredTiles
+from services.game.character_service import CharacterService
+
+def test_mark_reports_first_discovery_and_counts():
+    explored = ExploredTiles(10, 10)
+    assert explored.mark(3, 4)
+    assert not explored.mark(3, 4)
+    assert not explored.mark(10, 0)
+    assert (3, 4) in explored
+    assert (4, 3) not in explored
+    assert explored.mark_all([(0, 0), (3, 4), (9, 9)]) == 2
+    assert len(explored) == 3
+    assert list(explored) == [(0, 0), (3, 4), (9, 9)]
+
+def test_round_trip_picks_compact_encodings():
+    sparse = ExploredTiles(1000, 1000)
+    sparse.mark_all([(1, 1), (500, 500), (999, 999)])
+    data = sparse.to_bytes()
+    assert data[0] == ExploredTiles.SPARSE
+    assert list(ExploredTiles.from_bytes(data, 1000, 1000)) == list(sparse)
+
+    dense = ExploredTiles(1000, 1000)
+    dense.mark_all((x, y) for y in range(400) for x in range(1000))
+    data = dense.to_bytes()
+    assert data[0] == ExploredTiles.DEFLATED
+    assert len(data) < 1000
+    restored = ExploredTiles.from_bytes(data, 1000, 1000)
+    assert len(restored) == 400_000
+    assert (999, 399) in restored and (0, 400) not in restored
+
+def test_from_bytes_remaps_into_a_resized_world():
+    explored = ExploredTiles(10, 10)
+    explored.mark_all([(1, 2), (8, 8)])
+    resized = ExploredTiles.from_bytes(explored.to_bytes(), 5, 20)
+    assert list(resized) == [(1, 2)]
+
+def test_discoveries_persist_without_being_overwritten_by_saves(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    service = CharacterService(CharacterRepository(db_manager, world_size=(20, 20)))
+    character = service.create_character("1", "Aria")
+
+    assert service.record_discovery("1", character, [(0, 0), (0, 1)]) == 2
+    assert service.record_discovery("1", character, [(0, 1)]) == 0
+    character.level = 2
+    service.update_character("1", character)
+
+    reloaded = CharacterRepository(db_manager, world_size=(20, 20)).load("1")
+    assert reloaded.level == 2
+    assert list(reloaded.explored) == [(0, 0), (0, 1)]
@@ -0,0 +1,53 @@
+import pytest
+from core.exceptions import AIServiceError
+from services.ai.backends import Completion, CompletionBackend
+from services.ai.fake_backend import FakeBackend, RecordingBackend, request_key
+
+MESSAGES = [{"role": "user", "content": "Describe the forest"}]
+
+async def collect(backend, messages=MESSAGES, usage=None):
+    return "".join([chunk async for chunk in backend.stream(messages, "gpt", 0.7, 150, usage)])
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CompletionBackend()
+
+@pytest.mark.asyncio
+async def test_generated_text_is_deterministic():
+    first = await FakeBackend(seed=1).complete(MESSAGES, "gpt", 0.7, 150)
+    second = await FakeBackend(seed=2).complete(MESSAGES, "gpt", 0.7, 150)
+    other = await FakeBackend(seed=1).complete([{"role": "user", "content": "Describe the cave"}], "gpt", 0.7, 150)
+
+    assert first.text == second.text != other.text
+    assert first.completion_tokens == len(first.text.split())
+
+    usage = Completion(text="")
+    assert await collect(FakeBackend(), usage=usage) == first.text
+    assert usage.completion_tokens == first.completion_tokens
+
+@pytest.mark.asyncio
+async def test_seeded_error_injection_repeats():
+    async def outcomes(seed):
+        backend = FakeBackend(error_rate=0.5, seed=seed)
+        results = []
+        for _ in range(20):
+            try:
+                await backend.complete(MESSAGES, "gpt", 0.7, 150)
+                results.append(True)
+            except AIServiceError:
+                results.append(False)
+        return results
+
+    runs = await outcomes(7)
+    assert runs == await outcomes(7)
+    assert True in runs and False in runs
+
+@pytest.mark.asyncio
+async def test_recordings_replay(tmp_path):
+    recorder = RecordingBackend(FakeBackend(recordings={request_key(MESSAGES, "gpt"): "A recorded answer."}))
+    assert await collect(recorder) == "A recorded answer."
+
+    path = str(tmp_path / "recordings.json")
+    recorder.save(path)
+    replay = FakeBackend.from_recording_file(path)
+    assert (await replay.complete(MESSAGES, "gpt", 0.7, 150)).text == "A recorded answer."
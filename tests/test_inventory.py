@@ -0,0 +1,51 @@
+import sqlite3
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.character_repository import CharacterRepository
+from data.models.character import Character
+from data.models.inventory import Inventory
+
+def test_inventory_stacks_and_tracks_changes():
+    inventory = Inventory(["Potion", "Potion", "Rope"])
+    assert inventory == {"Potion": 2, "Rope": 1}
+    inventory.mark_saved()
+
+    assert inventory.add("Potion", 3) == 5
+    assert not inventory.remove("Rope", 2)
+    assert inventory.remove("Rope")
+    assert "Rope" not in inventory
+    assert inventory.changes() == {"Potion": 5, "Rope": 0}
+    inventory.mark_saved()
+    assert inventory.changes() == {}
+
+def test_only_changed_stacks_are_written(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    repository = CharacterRepository(db_manager)
+    character = Character(name="Aria", inventory=["Sword, +1", "Potion", "Potion"])
+    repository.save("1", character)
+
+    character.inventory.add("Torch")
+    character.inventory.remove("Sword, +1")
+    assert character.inventory.changes() == {"Torch": 1, "Sword, +1": 0}
+    repository.save("1", character)
+    assert character.inventory.changes() == {}
+
+    reloaded = CharacterRepository(db_manager).load("1")
+    assert reloaded.inventory == {"Potion": 2, "Torch": 1}
+    assert reloaded.inventory.changes() == {}
+
+def test_text_inventories_are_moved_into_the_tables(tmp_path):
+    path = str(tmp_path / "game.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute('''
+            CREATE TABLE characters (
+                discord_id TEXT PRIMARY KEY, name TEXT UNIQUE, class TEXT, level INTEGER,
+                hp INTEGER, attack INTEGER, defense INTEGER, magic INTEGER,
+                inventory TEXT, location TEXT
+            )
+        ''')
+        conn.execute("INSERT INTO characters VALUES ('1', 'Aria', 'Adventurer', 1, 100, 10, 5, 10, 'Rope,Rope,Lamp', '[0, 0]')")
+
+    db_manager = DatabaseManager(path)
+    db_manager.initialize_database()
+    assert CharacterRepository(db_manager).load("1").inventory == {"Rope": 2, "Lamp": 1}
@@ -0,0 +1,59 @@
+import random
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.quest_repository import QuestRepository
+from data.models.quest import Quest
+from services.game.events import EventBus
+from services.game.leaderboard import Leaderboard, Leaderboards, SkipList
+from services.game.quest_service import QuestService
+
+def test_skip_list_keeps_order_and_ranks():
+    skip_list = SkipList(seed=7)
+    expected = []
+    rng = random.Random(3)
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if key in expected:
+            skip_list.remove(key)
+            expected.remove(key)
+        else:
+            skip_list.insert(key)
+            expected.append(key)
+            expected.sort()
+
+    assert list(skip_list) == expected
+    assert [skip_list.rank(key) for key in expected] == list(range(len(expected)))
+    assert list(skip_list.iter_from(5)) == expected[5:]
+    assert list(skip_list.iter_from(len(expected))) == []
+
+def test_leaderboard_ranks_highest_first_and_moves_players():
+    board = Leaderboard("level")
+    board.load([("a", 3), ("b", 7), ("c", 5)])
+    assert board.top(2) == [("b", 7), ("c", 5)]
+    board.set("a", 9)
+    assert board.rank("a") == 1 and board.rank("b") == 2
+    assert board.top(5, start=1) == [("b", 7), ("c", 5)]
+    board.remove("b")
+    assert board.rank("b") is None and len(board) == 2
+
+def test_completions_are_counted_once_and_rebuilt(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    repository = QuestRepository(db_manager)
+    events = EventBus()
+    leaderboards = Leaderboards()
+    leaderboards.subscribe(events)
+    quests = QuestService(repository, narrative_service=None, events=events)
+
+    ids = [repository.save(Quest("Q", "D", 1, theme, (0, 0))) for theme in ("combat", "combat", "mystery")]
+    for quest_id in ids:
+        assert quests.complete_quest(quest_id, "1")
+    assert not quests.complete_quest(ids[0], "2")
+
+    assert repository.get_completed_quests_count("1") == {"combat": 2, "mystery": 1}
+    assert leaderboards["quests"].top(5) == [("1", 3)]
+
+    rebuilt = Leaderboards()
+    rebuilt.load(repository.get_completion_totals(), [("1", 4, 90), ("2", 6, 10)])
+    assert rebuilt["quests"].score("1") == 3
+    assert rebuilt["level"].rank("2") == 1
+    assert rebuilt["xp"].rank("1") == 1
@@ -0,0 +1,73 @@
+from data.models.explored import ExploredTiles
+from data.models.world import Region
+from services.game.map_renderer import FOG, MapRenderer, OTHER_PLAYER, PLAYER, VOID
+
+def make_renderer(regions, lookups, **kwargs):
+    def region_at(tile):
+        lookups.append(tile)
+        return regions.get((tile[0] // 2, tile[1] // 2))
+    return MapRenderer(region_at, region_size=2, **kwargs)
+
+def test_viewport_is_shared_and_drawn_from_region_glyphs():
+    regions = {(x, y): Region("Plains", {}) for x in range(4) for y in range(4)}
+    regions[(1, 1)] = Region("Mountains", {})
+    lookups = []
+    renderer = make_renderer(regions, lookups, radius=2, block_size=4)
+
+    rows = renderer.render((3, 3), others=[(2, 2)])
+    assert rows == [
+        ".....",
+        ".&^..",
+        ".^@..",
+        ".....",
+        ".....",
+    ]
+    assert len(lookups) == len(set((x // 2, y // 2) for x, y in lookups))
+
+    renderer.render((3, 3))
+    assert renderer.stats()["viewport_hits"] == 1
+    assert renderer.render((0, 0))[0] == VOID * 5
+
+def test_fog_hides_unexplored_tiles_inside_the_tracked_area():
+    regions = {(x, y): Region("Forest", {}) for x in range(4) for y in range(4)}
+    renderer = make_renderer(regions, [], radius=1)
+    explored = ExploredTiles(8, 8)
+    explored.mark_all([(1, 1), (2, 1)])
+
+    assert renderer.render((1, 1), explored) == [
+        FOG * 3,
+        FOG + PLAYER + "T",
+        FOG * 3,
+    ]
+
+def test_invalidating_a_region_rerenders_only_what_overlaps_it():
+    regions = {(x, y): Region("Plains", {}) for x in range(20) for y in range(20)}
+    renderer = make_renderer(regions, [], radius=1, block_size=4)
+    renderer.viewport((1, 1))
+    renderer.viewport((30, 30))
+
+    regions[(0, 0)] = Region("Swamp", {})
+    renderer.invalidate_region((0, 0))
+    assert renderer.stats()["viewports"] == 1
+    assert renderer.viewport((1, 1))[1][1] == "%"
+    assert renderer.viewport((30, 30))
+    assert renderer.stats()["viewport_hits"] == 1
+
+def test_glyph_cache_is_bounded():
+    regions = {(x, y): Region("Plains", {}) for x in range(10) for y in range(10)}
+    lookups = []
+    renderer = make_renderer(regions, lookups, max_glyphs=3)
+    for x in range(0, 10, 2):
+        renderer.glyph((x, 0))
+    assert renderer.stats()["regions"] == 3
+
+    renderer.glyph((8, 0))
+    renderer.glyph((0, 0))
+    assert len(lookups) == 6
+
+def test_png_has_a_valid_header_and_size():
+    renderer = make_renderer({(0, 0): Region("Desert", {})}, [], radius=1)
+    png = renderer.render_png((0, 0), others=[], scale=4)
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    assert int.from_bytes(png[16:20], "big") == 12
+    assert int.from_bytes(png[20:24], "big") == 12
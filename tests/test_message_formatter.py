@@ -0,0 +1,56 @@
+from data.models.character import Character
+from data.models.combat import CombatState, Enemy
+from services.discord.message_formatter import MessageFormatter
+
+def make_enemy(i: int) -> Enemy:
+    return Enemy(name=f"Goblin {i}", level=1, hp=60, max_hp=60, attack=7, defense=4)
+
+def test_unchanged_character_reuses_embed():
+    formatter = MessageFormatter()
+    character = Character(name="Aria")
+
+    first = formatter.character_info(character)
+    assert formatter.character_info(character) is first
+
+    character.allocate_stat_points(hp=5)
+    updated = formatter.character_info(character)
+    assert updated is not first
+    assert "HP: 105" in updated.fields[1].value
+    assert formatter.stats()["hits"] == 1
+
+def test_equal_characters_do_not_share_embeds():
+    formatter = MessageFormatter()
+    first = formatter.character_info(Character(name="Aria"))
+    second = formatter.character_info(Character(name="Bram"))
+    assert second is not first
+    assert second.title == "Bram's Character Sheet"
+
+def test_combat_board_is_paginated_and_versioned():
+    formatter = MessageFormatter()
+    combat = CombatState(players=[Character(name="Aria")], enemies=[make_enemy(i) for i in range(25)])
+
+    assert formatter.combat_pages(combat) == 3
+    last = formatter.combat_status(combat, page=2)
+    assert last.footer.text == "Page 3/3"
+    assert last.fields[0].value == "No players"
+    assert last.fields[1].value.count("\n") == 4
+    assert formatter.combat_status(combat, page=99) is last
+
+    combat.enemies[20].take_damage(10)
+    combat.touch()
+    assert "Goblin 20: 50 HP (83%)" in formatter.combat_status(combat, page=2).fields[1].value
+
+
+def test_combat_board_rerenders_when_a_combatant_changes():
+    formatter = MessageFormatter()
+    hero = Character(name="Aria")
+    combat = CombatState(players=[hero], enemies=[make_enemy(0)])
+    first = formatter.combat_status(combat)
+    assert formatter.combat_status(combat) is first
+
+    hero.stats["HP"] = 40
+    hero.touch()
+    assert "Aria: 40 HP (40%)" in formatter.combat_status(combat).fields[0].value
+
+    combat.enemies[0].take_damage(30)
+    assert "Goblin 0: 30 HP (50%)" in formatter.combat_status(combat).fields[1].value
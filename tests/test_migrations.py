@@ -0,0 +1,65 @@
+import sqlite3
+import pytest
+from data.database import migrations
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.character_repository import CharacterRepository
+from data.database.repositories.quest_repository import QuestRepository
+
+def traced(path):
+    statements = []
+    conn = sqlite3.connect(path)
+    conn.set_trace_callback(statements.append)
+    return conn, statements
+
+def test_fresh_database_reaches_latest_version(tmp_path):
+    path = str(tmp_path / "game.db")
+    DatabaseManager(path).initialize_database()
+    with sqlite3.connect(path) as conn:
+        assert migrations.schema_version(conn) == migrations.SCHEMA_VERSION
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"characters", "quests", "quest_completions", "character_items", "shard_health"} <= tables
+
+def test_current_database_only_reads_its_version(tmp_path):
+    path = str(tmp_path / "game.db")
+    DatabaseManager(path).initialize_database()
+
+    conn, statements = traced(path)
+    assert migrations.migrate(conn) == migrations.SCHEMA_VERSION
+    conn.close()
+    assert statements == ["PRAGMA user_version"]
+
+    db_manager = DatabaseManager(path)
+    db_manager.ensure_schema()
+    db_manager.get_connection = None  # already checked, so no connection is needed
+    db_manager.ensure_schema()
+
+def test_legacy_database_is_upgraded_with_backfill(tmp_path):
+    path = str(tmp_path / "game.db")
+    with sqlite3.connect(path) as conn:
+        migrations._initial_schema(conn.cursor())
+        conn.execute("INSERT INTO characters VALUES ('1', 'Aria', 'Adventurer', 2, 90, 10, 5, 10, 'Rope,Lamp,Rope', '[0, 0]')")
+        conn.executemany(
+            "INSERT INTO quests (title, description, difficulty, theme, location, completed_by, created_at) "
+            "VALUES ('Q', 'D', 1, ?, '[0, 0]', ?, '2026-01-01')",
+            [("combat", "1"), ("combat", "1"), ("mystery", None)]
+        )
+
+    db_manager = DatabaseManager(path)
+    db_manager.initialize_database()
+    character = CharacterRepository(db_manager).load("1")
+    assert character.inventory == {"Rope": 2, "Lamp": 1}
+    assert character.level == 2 and character.xp == 0
+    assert QuestRepository(db_manager).get_completed_quests_count("1") == {"combat": 2}
+
+def test_failed_migration_is_rolled_back(tmp_path):
+    def broken(cursor):
+        cursor.execute("CREATE TABLE half_done (x INTEGER)")
+        raise RuntimeError("boom")
+
+    conn = sqlite3.connect(str(tmp_path / "game.db"))
+    steps = migrations.MIGRATIONS[:2] + [migrations.Migration(3, "broken", broken)]
+    with pytest.raises(RuntimeError):
+        migrations.migrate(conn, steps)
+    assert migrations.schema_version(conn) == 2
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+    conn.close()
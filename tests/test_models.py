@@ -0,0 +1,27 @@
+import pickle
+import pytest
+from data.models.character import Character, Stats
+from data.models.combat import Enemy
+from data.models.world import Location, Region
+
+def test_models_have_no_instance_dict():
+    for model in (Character(name="Aria"), Enemy("Goblin", 1, 60, 60, 7, 4), Location(0, 0), Region("Forest", None)):
+        assert not hasattr(model, "__dict__")
+
+def test_stats_behave_like_a_fixed_dict():
+    character = Character(name="Aria", stats={"HP": 90, "Attack": 12, "Defense": 5, "Magic": 3})
+    assert isinstance(character.stats, Stats)
+    character.stats["HP"] -= 10
+    assert character.stats == {"HP": 80, "Attack": 12, "Defense": 5, "Magic": 3}
+    assert list(character.stats.items())[0] == ("HP", 80)
+    with pytest.raises(KeyError):
+        character.stats["Luck"] = 1
+    with pytest.raises(TypeError):
+        del character.stats["HP"]
+
+def test_pickling_keeps_version():
+    character = Character(name="Aria")
+    character.allocate_stat_points(attack=2)
+    copy = pickle.loads(pickle.dumps(character))
+    assert copy == character
+    assert copy.version == character.version
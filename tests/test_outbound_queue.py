@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from services.discord.outbound_queue import OutboundQueue
+
+class FakeChannel:
+    def __init__(self, channel_id=1):
+        self.id = channel_id
+        self.sent = []
+
+    async def send(self, content):
+        self.sent.append(content)
+        return SimpleNamespace(content=content)
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_into_one_send():
+    queue = OutboundQueue(coalesce_window=0.01)
+    channel = FakeChannel()
+    futures = [queue.enqueue(channel, f"action {i}") for i in range(6)]
+    await asyncio.gather(*futures)
+
+    assert channel.sent == ["\n".join(f"action {i}" for i in range(6))]
+    assert queue.stats()["sends"] == 1
+    assert queue.stats()["latency_ms"]["count"] == 6
+
+@pytest.mark.asyncio
+async def test_batches_respect_message_length():
+    queue = OutboundQueue(coalesce_window=0.01)
+    channel = FakeChannel()
+    await asyncio.gather(*(queue.enqueue(channel, "x" * 900) for _ in range(3)))
+
+    assert [len(content) for content in channel.sent] == [1801, 900]
+
+@pytest.mark.asyncio
+async def test_rate_limit_bucket_delays_sends():
+    queue = OutboundQueue(coalesce_window=0.0, rate_limit=2, rate_period=0.2)
+    channel = FakeChannel()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for i in range(3):
+        await queue.enqueue(channel, str(i))
+
+    assert channel.sent == ["0", "1", "2"]
+    assert loop.time() - started >= 0.2
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_pending_messages():
+    queue = OutboundQueue(coalesce_window=0.05)
+    channel = FakeChannel()
+    queue.enqueue(channel, "first")
+    await queue.flush(channel)
+    assert channel.sent == ["first"]
+
+class BrokenChannel(FakeChannel):
+    async def send(self, content):
+        if content == "bad":
+            raise TypeError("unexpected payload")
+        return await super().send(content)
+
+@pytest.mark.asyncio
+async def test_unexpected_send_error_fails_only_its_batch():
+    queue = OutboundQueue(coalesce_window=0.0)
+    channel = BrokenChannel()
+    with pytest.raises(TypeError):
+        await queue.enqueue(channel, "bad")
+    await queue.enqueue(channel, "good")
+    assert channel.sent == ["good"]
+
+@pytest.mark.asyncio
+async def test_cancelled_worker_releases_flush():
+    queue = OutboundQueue(coalesce_window=10.0)
+    channel = FakeChannel()
+    future = queue.enqueue(channel, "never sent")
+    await asyncio.sleep(0)
+    queue._channels[channel.id].worker.cancel()
+
+    await asyncio.wait_for(queue.flush(channel), timeout=1.0)
+    assert future.cancelled()
+    assert channel.sent == []
+
+@pytest.mark.asyncio
+async def test_idle_channels_are_dropped():
+    queue = OutboundQueue(coalesce_window=0.0, rate_period=0.05)
+    channels = [FakeChannel(i) for i in range(3)]
+    await asyncio.gather(*(queue.enqueue(channel, "hi") for channel in channels))
+    assert len(queue._channels) == 3
+    await asyncio.sleep(0.1)
+    assert queue._channels == {}
@@ -0,0 +1,58 @@
+from data.models.world import Region
+from services.game.pathfinding import CostGrid, Pathfinder
+
+# Plains everywhere except a wall of mountains at x == 2 with a gap at y == 4
+WORLD = {
+    (x, y): Region("Mountains" if x == 2 and y != 4 else "Plains", {})
+    for x in range(5) for y in range(5)
+}
+
+def neighbours(tile):
+    x, y = tile
+    return [(nx, ny) for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)) if (nx, ny) in WORLD]
+
+def make_pathfinder() -> Pathfinder:
+    lookups = []
+
+    def region_at(tile):
+        lookups.append(tile)
+        return WORLD.get(tile)
+
+    grid = CostGrid(region_at, region_size=1, biome_costs={"Plains": 1.0, "Mountains": 20.0})
+    pathfinder = Pathfinder(grid, neighbours)
+    pathfinder.lookups = lookups
+    return pathfinder
+
+def test_path_detours_around_expensive_biomes():
+    pathfinder = make_pathfinder()
+    path = pathfinder.find_path((0, 0), (4, 0))
+
+    assert path[-1] == (4, 0)
+    assert (2, 4) in path
+    assert pathfinder.path_cost(path) == len(path) == 12
+
+def test_paths_and_costs_are_cached():
+    pathfinder = make_pathfinder()
+    first = pathfinder.find_path((0, 0), (4, 4))
+    lookups = len(pathfinder.lookups)
+    assert len(set(pathfinder.lookups)) == lookups
+
+    assert pathfinder.find_path((0, 0), (4, 4)) == first
+    assert len(pathfinder.lookups) == lookups
+
+def test_unreachable_and_trivial_paths():
+    pathfinder = make_pathfinder()
+    assert pathfinder.find_path((0, 0), (9, 9)) is None
+    assert pathfinder.find_path((1, 1), (1, 1)) == []
+
+def test_cost_cache_is_bounded_and_skips_missing_regions():
+    world = {(0, 0): Region("Plains", {}), (1, 0): Region("Mountains", {})}
+    grid = CostGrid(world.get, region_size=1, biome_costs={"Plains": 1.0, "Mountains": 20.0}, max_regions=1)
+    assert grid.cost((0, 0)) == 1.0
+    assert grid.cost((1, 0)) == 20.0
+    assert list(grid._costs) == [(1, 0)]
+
+    # A region that was missing, e.g. not loaded yet, is looked up again
+    assert grid.cost((2, 0)) is None
+    world[(2, 0)] = Region("Plains", {})
+    assert grid.cost((2, 0)) == 1.0
@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from services.game.prefetcher import DescriptionPrefetcher
+
+@pytest.mark.asyncio
+async def test_prefetched_tiles_count_as_hits_once():
+    prefetcher = DescriptionPrefetcher()
+    calls = []
+
+    async def describe(tile):
+        calls.append(tile)
+        return f"tile {tile}"
+
+    prefetcher.schedule([(0, 1), (1, 0)], describe)
+    prefetcher.schedule([(0, 1)], describe)
+    await asyncio.gather(*(prefetcher.pending(tile) for tile in [(0, 1), (1, 0)]))
+
+    assert calls == [(0, 1), (1, 0)]
+    assert prefetcher.get((0, 1)) == "tile (0, 1)"
+    assert prefetcher.get((0, 1)) == "tile (0, 1)"
+    assert prefetcher.get((5, 5)) is None
+    stats = prefetcher.stats()
+    assert (stats["prefetch_hits"], stats["hits"], stats["lookups"]) == (1, 2, 3)
+
+@pytest.mark.asyncio
+async def test_budget_and_concurrency_caps():
+    prefetcher = DescriptionPrefetcher(concurrency=1, budget=2)
+    running = 0
+    peak = 0
+
+    async def describe(tile):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "text"
+
+    prefetcher.schedule([(0, 0), (0, 1), (0, 2)], describe)
+    await asyncio.gather(*list(prefetcher._in_flight.values()))
+
+    assert peak == 1
+    assert prefetcher.stats()["prefetched"] == 2
+    assert prefetcher.stats()["over_budget"] == 1
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_not_cached():
+    prefetcher = DescriptionPrefetcher()
+
+    async def describe(tile):
+        raise RuntimeError("backend down")
+
+    prefetcher.schedule([(0, 0)], describe)
+    await prefetcher.pending((0, 0))
+    assert prefetcher.get((0, 0)) is None
+    assert prefetcher.pending((0, 0)) is None
+
+@pytest.mark.asyncio
+async def test_regenerating_the_world_drops_cached_descriptions(tmp_path):
+    from data.database.db_manager import DatabaseManager
+    from data.database.repositories.world_repository import WorldRepository
+    from services.game.world_service import WorldService
+
+    prefetcher = DescriptionPrefetcher()
+    world = WorldService(WorldRepository(DatabaseManager(str(tmp_path / "world.db"))), None,
+                         world_width=2, world_height=2, prefetcher=prefetcher)
+    release = asyncio.Event()
+
+    async def describe(tile):
+        await release.wait()
+        return "old world"
+
+    prefetcher.put((0, 0), "old world")
+    prefetcher.schedule([(0, 1)], describe)
+    await world.generate_world(seed=1)
+    release.set()
+    await asyncio.sleep(0)
+
+    assert prefetcher.get((0, 0)) is None
+    assert prefetcher.get((0, 1)) is None
+    assert prefetcher.pending((0, 1)) is None
@@ -0,0 +1,51 @@
+import time
+from services.game.presence import PresenceIndex
+
+def test_update_reports_players_already_on_the_tile():
+    index = PresenceIndex(cell_size=4)
+    assert index.update("a", (3, 3)) == set()
+    assert index.update("b", (3, 3)) == {"a"}
+    assert index.update("b", (3, 4)) == set()
+    assert index.at((3, 3)) == {"a"}
+    assert len(index) == 2
+
+def test_radius_and_region_queries_span_cells():
+    index = PresenceIndex(cell_size=4)
+    index.update("a", (3, 3))
+    index.update("b", (4, 4))
+    index.update("c", (9, 9))
+    index.update("d", (3, 6))
+
+    assert sorted(index.within((3, 3), 2)) == ["a", "b"]
+    assert sorted(index.within((3, 3), 3)) == ["a", "b", "d"]
+    assert sorted(index.in_region((0, 0), 5)) == ["a", "b"]
+    assert index.in_region((1, 1), 5) == ["c"]
+
+def test_removed_and_idle_players_leave_no_buckets():
+    index = PresenceIndex(idle_timeout=60)
+    index.update("a", (0, 0))
+    index.update("b", (1, 0))
+    index.remove("a")
+    index._last_seen["b"] = time.monotonic() - 120
+
+    assert index.prune_idle() == 1
+    assert len(index) == 0
+    assert not index._tiles and not index._cells
+
+def test_arrival_channels_are_forgotten_with_presence():
+    from types import SimpleNamespace
+    from services.discord.exploration_commands import ExplorationCommands
+    from services.game.world_service import WorldService
+
+    presence = PresenceIndex(idle_timeout=3600.0)
+    commands = ExplorationCommands(None, WorldService(None, None, presence=presence), None)
+    for user_id in (1, 2):
+        ctx = SimpleNamespace(author=SimpleNamespace(id=user_id), channel=f"channel {user_id}")
+        commands._arrive(ctx, (user_id, 0))
+    assert set(commands._channels) == {"1", "2"}
+
+    presence.remove("1")
+    assert set(commands._channels) == {"2"}
+    presence.idle_timeout = 0.0
+    presence.prune_idle()
+    assert commands._channels == {}
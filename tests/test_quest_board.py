@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.quest_repository import QuestRepository
+from data.models.quest import Quest
+from services.game.quest_board import QuestBoard
+from services.game.quest_service import QuestService
+
+def make_quest(quest_id, location, expires_at=None):
+    return Quest("Q", "D", 1, "mystery", location, quest_id=quest_id, expires_at=expires_at)
+
+def test_quests_are_indexed_by_tile_and_region():
+    board = QuestBoard(region_size=5)
+    board.load([make_quest(1, (1, 1)), make_quest(2, (1, 1)), make_quest(3, (4, 0)), make_quest(4, (5, 0))])
+    assert sorted(quest.quest_id for quest in board.at((1, 1))) == [1, 2]
+    assert sorted(quest.quest_id for quest in board.in_region((0, 0))) == [1, 2, 3]
+    board.remove(1)
+    assert [quest.quest_id for quest in board.at((1, 1))] == [2]
+    assert board.at((9, 9)) == []
+
+def test_expired_quests_leave_the_board_in_deadline_order():
+    board = QuestBoard()
+    now = datetime.now()
+    soon = make_quest(1, (0, 0), now + timedelta(seconds=10))
+    later = make_quest(2, (0, 0), now + timedelta(seconds=60))
+    board.load([soon, later, make_quest(3, (0, 0))])
+
+    assert board.expire(now.timestamp()) == []
+    assert board.expire((now + timedelta(seconds=30)).timestamp()) == [1]
+    # Re-adding with a later deadline leaves a stale heap entry that is ignored
+    later.expires_at = now + timedelta(seconds=120)
+    board.add(later)
+    assert board.expire((now + timedelta(seconds=90)).timestamp()) == []
+    assert len(board) == 2
+
+def test_service_keeps_the_board_coherent_without_queries(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    repository = QuestRepository(db_manager)
+    repository.save(make_quest(None, (2, 2)))
+    service = QuestService(repository, narrative_service=None)
+    service.load_board()
+
+    quest_id = service.save_quest(make_quest(None, (2, 2), datetime.now() + timedelta(hours=1)))
+    assert len(service.get_available_quests((2, 2))) == 2
+
+    repository.get_available_quests = None  # lookups must not query the database
+    assert service.complete_quest(quest_id, "1")
+    assert len(service.get_available_quests((2, 2))) == 1
+    assert len(service.get_quests_in_region((0, 0))) == 1
+
+def test_board_picks_up_quests_changed_by_another_process(tmp_path):
+    path = str(tmp_path / "game.db")
+    here = QuestService(QuestRepository(DatabaseManager(path)), narrative_service=None,
+                        board=QuestBoard(), board_refresh_interval=0.0)
+    there = QuestService(QuestRepository(DatabaseManager(path)), narrative_service=None, board=QuestBoard())
+    first = here.save_quest(make_quest(None, (1, 1)))
+    assert [quest.quest_id for quest in here.get_available_quests((1, 1))] == [first]
+
+    second = there.save_quest(make_quest(None, (1, 1)))
+    assert sorted(quest.quest_id for quest in here.get_available_quests((1, 1))) == [first, second]
+    assert there.complete_quest(first, "1")
+    assert [quest.quest_id for quest in here.get_available_quests((1, 1))] == [second]
+
+    third = there.save_quest(make_quest(None, (2, 2)))
+    here.board_refresh_interval = 3600.0
+    assert here.accept_quest(third, "1").quest_id == third
+    assert [quest.quest_id for quest in here.board.at((2, 2))] == [third]
@@ -0,0 +1,136 @@
+from datetime import datetime
+import pytest
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.quest_repository import QuestRepository
+from data.models.character import Character
+from data.models.combat import CombatState, Enemy
+from data.models.quest import Objective, Quest
+from services.game.combat_service import CombatService
+from services.game.events import EventBus, GameEvent, ITEM_GAINED, KILLED, MOVED, QUEST_COMPLETED
+from services.game.quest_service import QuestService
+from services.game.quest_tracker import QuestTracker
+
+def make_repository(tmp_path):
+    db_manager = DatabaseManager(str(tmp_path / "game.db"))
+    db_manager.initialize_database()
+    return QuestRepository(db_manager)
+
+def save_quest(repository, *objectives):
+    quest = Quest("Hunt", "Thin the herd", 1, "combat", (0, 0), objectives=list(objectives))
+    quest.quest_id = repository.save(quest)
+    return quest
+
+def test_events_only_advance_matching_objectives(tmp_path):
+    repository = make_repository(tmp_path)
+    tracker = QuestTracker(repository)
+    orcs = save_quest(repository, Objective(KILLED, "Orc", 2), Objective(MOVED, (3, 4)))
+    anything = save_quest(repository, Objective(KILLED, None, 1))
+    tracker.track("1", orcs)
+    tracker.track("1", anything)
+    tracker.track("2", orcs)
+
+    assert tracker.handle(GameEvent(KILLED, "1", "Goblin")) == [anything.quest_id]
+    assert tracker.handle(GameEvent(KILLED, "1", "Orc", amount=5)) == []
+    assert tracker.progress("1", orcs.quest_id) == [2, 0]
+    assert tracker.progress("2", orcs.quest_id) == [0, 0]
+    assert tracker.handle(GameEvent(ITEM_GAINED, "1", "Orc")) == []
+    assert tracker.handle(GameEvent(MOVED, "1", (3, 4))) == [orcs.quest_id]
+
+def test_progress_is_flushed_in_batches_and_reloaded(tmp_path):
+    repository = make_repository(tmp_path)
+    quest = save_quest(repository, Objective(KILLED, "Orc", 3))
+    tracker = QuestTracker(repository)
+    tracker.track("1", quest)
+    tracker.handle(GameEvent(KILLED, "1", "Orc"))
+    tracker.handle(GameEvent(KILLED, "1", "Orc"))
+    assert tracker.flush() == 1
+    assert tracker.flush() == 0
+
+    reloaded = QuestTracker(repository)
+    assert reloaded.load() == 1
+    assert reloaded.progress("1", quest.quest_id) == [2]
+    assert reloaded.handle(GameEvent(KILLED, "1", "Orc")) == [quest.quest_id]
+
+@pytest.mark.asyncio
+async def test_combat_kills_complete_quests_through_the_event_bus(tmp_path):
+    repository = make_repository(tmp_path)
+    events = EventBus()
+    completed = []
+    events.subscribe(QUEST_COMPLETED, lambda event: completed.append((event.player_id, event.target)))
+    quests = QuestService(repository, narrative_service=None, events=events)
+    quest = save_quest(repository, Objective(KILLED, "Goblin", 1))
+    assert quests.accept_quest(quest.quest_id, "1") is not None
+
+    hero = Character(name="Aria", discord_id="1")
+    combat = CombatService(narrative_service=None, events=events)
+    combat.current_combat = CombatState(players=[hero], enemies=[Enemy("Goblin", 1, 1, 1, 0, 0, kind="Goblin")])
+    combat.add_action(hero, "attack goblin")
+    await combat._resolve_mechanics()
+
+    assert completed == [("1", quest.quest_id)]
+    assert repository.get_quest(quest.quest_id).completed_by == "1"
+    assert len(quests.tracker) == 0
+
+def test_completion_stops_tracking_the_quest_for_everyone(tmp_path):
+    repository = make_repository(tmp_path)
+    quests = QuestService(repository, narrative_service=None, events=EventBus())
+    quest = save_quest(repository, Objective(KILLED, "Orc", 2))
+    quests.accept_quest(quest.quest_id, "1")
+    quests.accept_quest(quest.quest_id, "2")
+    quests.events.publish(GameEvent(KILLED, "2", "Orc"))
+
+    quests.events.publish(GameEvent(KILLED, "1", "Orc", amount=2))
+
+    assert repository.get_quest(quest.quest_id).completed_by == "1"
+    assert quests.tracker.progress("2", quest.quest_id) is None
+    assert len(quests.tracker) == 0
+    assert quests.tracker.handle(GameEvent(KILLED, "2", "Orc")) == []
+
+def test_losing_a_completion_race_stops_tracking(tmp_path):
+    repository = make_repository(tmp_path)
+    quests = QuestService(repository, narrative_service=None, events=EventBus())
+    quest = save_quest(repository, Objective(KILLED, "Orc", 1))
+    quests.accept_quest(quest.quest_id, "1")
+    # Another process records the completion first
+    assert repository.complete_quest(quest.quest_id, "2", datetime(2026, 1, 1))
+
+    quests.events.publish(GameEvent(KILLED, "1", "Orc"))
+
+    assert repository.get_quest(quest.quest_id).completed_by == "2"
+    assert quests.tracker.progress("1", quest.quest_id) is None
+    assert len(quests.tracker) == 0
+
+def test_untargeted_event_counts_once():
+    tracker = QuestTracker()
+    quest = Quest("Hunt", "Anything will do", 1, "combat", (0, 0), quest_id=1,
+                  objectives=[Objective(KILLED, None, 3)])
+    tracker.track("1", quest)
+    tracker.handle(GameEvent(KILLED, "1"))
+    assert tracker.progress("1", 1) == [1]
+
+@pytest.mark.asyncio
+async def test_accept_command_starts_tracking(tmp_path):
+    from types import SimpleNamespace
+    from services.discord.quest_commands import QuestCommands
+    from services.game.quest_board import QuestBoard
+
+    repository = make_repository(tmp_path)
+    quests = QuestService(repository, narrative_service=None, events=EventBus(), board=QuestBoard())
+    quest_id = quests.save_quest(Quest("Hunt", "Thin the herd", 1, "combat", (0, 0),
+                                       objectives=[Objective(KILLED, "Orc", 2)]))
+    character_service = SimpleNamespace(get_character=lambda player_id: Character(name="Aria"))
+    commands = QuestCommands(None, quests, character_service)
+    sent = []
+    ctx = SimpleNamespace(author=SimpleNamespace(id=1), send=lambda content: _record(sent, content))
+
+    await commands.accept(ctx, quest_id)
+    quests.events.publish(GameEvent(KILLED, "1", "Orc"))
+    await commands.quests(ctx)
+
+    assert sent[0] == "Quest accepted: Hunt. Objectives: killed Orc (2)."
+    assert sent[1] == f"#{quest_id} Hunt at (0, 0) [accepted]: killed Orc (1/2)"
+    await commands.accept(ctx, 999)
+    assert sent[2] == "That quest is not available."
+
+async def _record(sent, content):
+    sent.append(content)
@@ -0,0 +1,86 @@
+import pytest
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.response_cache_repository import ResponseCacheRepository
+from services.ai.response_cache import ResponseCache, CachePolicy
+
+@pytest.fixture
+def repository(tmp_path):
+    return ResponseCacheRepository(DatabaseManager(str(tmp_path / "cache.db")))
+
+def test_key_is_canonical():
+    """Whitespace differences should not change the cache key."""
+    a = ResponseCache.make_key("Describe  a\nforest", None, "gpt", 0.7, 150)
+    b = ResponseCache.make_key("Describe a forest ", None, "gpt", 0.7, 150)
+    c = ResponseCache.make_key("Describe a forest", None, "gpt", 0.8, 150)
+    assert a == b
+    assert a != c
+
+def test_variants_fill_before_hitting():
+    """A key with K variants misses until K responses have been stored."""
+    cache = ResponseCache(policies={"location": CachePolicy(ttl=60, variants=2)})
+    key = cache.make_key("p", None, "gpt", 0.7, 150)
+
+    assert cache.get("location", key) is None
+    cache.put("location", key, "one")
+    assert cache.get("location", key) is None
+    cache.put("location", key, "two")
+    assert cache.get("location", key) in {"one", "two"}
+
+    stats = cache.stats()["location"]
+    assert stats["misses"] == 2
+    assert stats["memory_hits"] == 1
+
+def test_expired_entries_miss():
+    cache = ResponseCache(policies={"combat": CachePolicy(ttl=0, variants=1)})
+    cache.put("combat", "k", "narrative")
+    assert cache.get("combat", "k") is None
+
+def test_lru_eviction_and_disk_tier(repository):
+    """Entries evicted from memory are still served from SQLite."""
+    cache = ResponseCache(repository, max_entries=1)
+    cache.put("location", "a", "alpha")
+    cache.put("quest", "b", "beta")
+
+    assert cache.get("location", "a") is None  # location keeps 3 variants
+    assert cache.get("quest", "b") is None
+    cache.put("quest", "b", "beta 2")
+    cache.put("quest", "b", "beta 3")
+
+    fresh = ResponseCache(repository)
+    assert fresh.get("quest", "b") in {"beta", "beta 2", "beta 3"}
+    assert fresh.stats()["quest"]["disk_hits"] == 1
+
+def test_prune_caps_rows(repository):
+    for i in range(5):
+        repository.save_variant(f"k{i}", 0, "location", "text", float(i))
+    assert repository.prune(2) == 3
+    assert repository.get_variants("k4", 0) == [(0, 4.0, "text")]
+    assert repository.get_variants("k0", 0) == []
+
+def test_put_after_expiry_keeps_valid_rows(repository, monkeypatch):
+    """An expired variant's slot is reused instead of overwriting one still valid."""
+    clock = [1000.0]
+    monkeypatch.setattr("services.ai.response_cache.time.time", lambda: clock[0])
+    cache = ResponseCache(repository, policies={"location": CachePolicy(ttl=100, variants=2)}, prune_interval=1000)
+
+    cache.put("location", "k", "old")
+    clock[0] = 1050.0
+    cache.put("location", "k", "newer")
+    clock[0] = 1120.0  # "old" has expired, "newer" has not
+    assert cache.get("location", "k") is None
+    cache.put("location", "k", "newest")
+
+    rows = repository.get_variants("k", clock[0] - 100)
+    assert sorted(response for _, _, response in rows) == ["newer", "newest"]
+    assert ResponseCache(repository, policies=cache.policies).get("location", "k") in {"newer", "newest"}
+
+def test_prune_deletes_expired_rows(repository, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("services.ai.response_cache.time.time", lambda: clock[0])
+    cache = ResponseCache(repository, policies={"combat": CachePolicy(ttl=10, variants=1)}, prune_interval=2)
+
+    cache.put("combat", "a", "alpha")
+    clock[0] = 1020.0
+    cache.put("combat", "b", "beta")  # second write triggers the prune
+    assert repository.get_variants("a", 0) == []
+    assert repository.get_variants("b", 0) == [(0, 1020.0, "beta")]
@@ -0,0 +1,61 @@
+import math
+from types import SimpleNamespace
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.shard_health_repository import ShardHealthRepository
+from core.config import Config
+from launcher import MAX_RESTART_BACKOFF, RESTART_BACKOFF, restart_delay, shard_ranges
+from services.discord.shard_monitor import ShardMonitor
+
+def test_shard_ranges_are_contiguous_and_balanced():
+    assert shard_ranges(8, 3) == [[0, 1, 2], [3, 4, 5], [6, 7]]
+    assert shard_ranges(2, 4) == [[0], [1]]
+    assert shard_ranges(5, 0) == [[0, 1, 2, 3, 4]]
+
+def test_restart_delay_backs_off_to_a_cap():
+    assert restart_delay(1) == RESTART_BACKOFF
+    assert restart_delay(3) == RESTART_BACKOFF * 4
+    assert restart_delay(50) == MAX_RESTART_BACKOFF
+
+def test_shard_ids_are_read_from_the_environment(monkeypatch):
+    monkeypatch.setenv("SHARD_IDS", "3,4,5")
+    monkeypatch.delenv("WORLD_SNAPSHOT_PATH", raising=False)
+    config = Config.load_from_env()
+    assert config.shard_ids == [3, 4, 5]
+    assert config.world_snapshot_path == Config(discord_token="", openai_api_key="", database_path="").world_snapshot_path
+
+class FakeShard:
+    def __init__(self, closed):
+        self.closed = closed
+
+    def is_closed(self):
+        return self.closed
+
+class FakeBot:
+    shard_count = 4
+    shard_id = None
+    latency = 0.05
+
+    def __init__(self):
+        self.guilds = [SimpleNamespace(shard_id=2), SimpleNamespace(shard_id=2), SimpleNamespace(shard_id=3)]
+        self.latencies = [(2, 0.042), (3, math.inf)]
+        self.shards = {2: FakeShard(False), 3: FakeShard(True)}
+
+    def get_shard(self, shard_id):
+        return self.shards[shard_id]
+
+    def is_closed(self):
+        return False
+
+    def is_ready(self):
+        return True
+
+def test_shard_monitor_reports_each_owned_shard(tmp_path):
+    repository = ShardHealthRepository(DatabaseManager(str(tmp_path / "game.db")))
+    monitor = ShardMonitor(FakeBot(), repository)
+    monitor.report()
+
+    reports = {report["shard_id"]: report for report in repository.get_reports()}
+    assert set(reports) == {2, 3}
+    assert reports[2]["status"] == "ready" and round(reports[2]["latency_ms"]) == 42
+    assert reports[2]["guilds"] == 2
+    assert reports[3]["status"] == "closed" and reports[3]["latency_ms"] is None
@@ -0,0 +1,44 @@
+import pytest
+from types import SimpleNamespace
+from services.ai.usage_tracker import UsageContext, usage_context
+from services.discord.command_handler import GameCommandHandler
+from services.discord.slash_commands import SlashCommandHandler
+from services.game.world_service import WorldService
+
+class FakeInteraction:
+    def __init__(self):
+        self.user = SimpleNamespace(id=42)
+        self.guild = SimpleNamespace(id=7)
+        self.channel = SimpleNamespace(id=3)
+        self.command = SimpleNamespace(qualified_name="view")
+        self.deferred = False
+        self.followups = []
+        self.response = SimpleNamespace(defer=self._defer)
+        self.followup = SimpleNamespace(send=self._followup)
+
+    async def _defer(self, thinking=False):
+        self.deferred = thinking
+
+    async def _followup(self, content=None, wait=False, **kwargs):
+        self.followups.append(content)
+
+@pytest.mark.asyncio
+async def test_slash_interaction_is_deferred_attributed_and_timed():
+    game_handler = GameCommandHandler(None, None, None, WorldService(None, None))
+    slash = SlashCommandHandler(None, game_handler)
+    seen = []
+
+    async def handler(ctx, page):
+        seen.append((usage_context.get(), page))
+        await ctx.send("done")
+
+    interaction = FakeInteraction()
+    await slash._run(interaction, handler, 2)
+
+    assert interaction.deferred
+    assert interaction.followups == ["done"]
+    assert seen == [(UsageContext("view", "7", "42"), 2)]
+    # Attribution ends with the command
+    assert usage_context.get() == UsageContext()
+    assert game_handler.latency.get("slash", "view").summary()["count"] == 1
+    assert game_handler.latency.get("slash-ack", "view").summary()["count"] == 1
@@ -0,0 +1,76 @@
+import pytest
+from services.discord.base_handler import BaseCommandHandler
+from services.discord.streaming import StreamingMessage
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+        self.edits = []
+
+    async def edit(self, content):
+        self.content = content
+        self.edits.append(content)
+
+class FakeContext:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, content):
+        message = FakeMessage(content)
+        self.messages.append(message)
+        return message
+
+async def chunks(parts):
+    for part in parts:
+        yield part
+
+@pytest.mark.asyncio
+async def test_edits_are_throttled_and_final_flush_removes_cursor():
+    ctx = FakeContext()
+    streamer = StreamingMessage(ctx, header="> ", edit_interval=60.0)
+    text = await streamer.stream(chunks(["The ", "cave ", "is ", "dark."]))
+
+    assert text == "The cave is dark."
+    message = ctx.messages[0]
+    # The first chunk edits immediately, the rest wait for the final flush
+    assert message.edits == ["> The ▌", "> The cave is dark."]
+    assert len(ctx.messages) == 1
+
+@pytest.mark.asyncio
+async def test_every_chunk_is_shown_without_throttling():
+    ctx = FakeContext()
+    await StreamingMessage(ctx, edit_interval=0.0).stream(chunks(["a", "b", "c"]))
+    assert ctx.messages[0].edits == ["a▌", "ab▌", "abc▌", "abc"]
+
+@pytest.mark.asyncio
+async def test_long_text_keeps_tail_visible_and_splits_when_done():
+    ctx = FakeContext()
+    streamer = StreamingMessage(ctx, header="# ", edit_interval=0.0)
+    text = await streamer.stream(chunks(["x" * 1500, "y" * 1500, "z" * 1500]))
+
+    message = ctx.messages[0]
+    in_progress = message.edits[1]
+    assert len(in_progress) <= StreamingMessage.MAX_LENGTH
+    assert in_progress.startswith("# …") and in_progress.endswith("y▌")
+
+    pages = [message.content] + [page.content for page in ctx.messages[1:]]
+    assert [len(page) for page in pages] == [2000, 2000, 502]
+    assert "".join(pages) == "# " + text
+
+@pytest.mark.asyncio
+async def test_failed_stream_keeps_partial_text():
+    async def failing():
+        yield "partial"
+        raise RuntimeError("backend went away")
+
+    ctx = FakeContext()
+    with pytest.raises(RuntimeError):
+        await StreamingMessage(ctx, edit_interval=60.0).stream(failing())
+    assert ctx.messages[0].content == "partial"
+
+@pytest.mark.asyncio
+async def test_send_streamed_without_outbound_queue():
+    ctx = FakeContext()
+    handler = BaseCommandHandler(bot=None, stream_edit_interval=60.0)
+    assert await handler.send_streamed(ctx, chunks(["hi"])) == "hi"
+    assert ctx.messages[0].content == "hi"
@@ -0,0 +1,42 @@
+import pytest
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.usage_repository import UsageRepository
+from services.ai.usage_tracker import UsageTracker, attribute_usage
+
+@pytest.fixture
+def tracker(tmp_path):
+    return UsageTracker(UsageRepository(DatabaseManager(str(tmp_path / "usage.db"))))
+
+def test_usage_is_attributed_to_context(tracker):
+    with attribute_usage("explore", guild_id="g1", player_id="p1"):
+        tracker.record("gpt-3.5-turbo", prompt_tokens=100, completion_tokens=50, latency_ms=200)
+        tracker.record("gpt-3.5-turbo", cache_hit=True, latency_ms=2)
+    with attribute_usage("resolve", guild_id="g1", player_id="p2"):
+        tracker.record("gpt-3.5-turbo", prompt_tokens=300, completion_tokens=150, latency_ms=400)
+    tracker.record("gpt-3.5-turbo", prompt_tokens=10, completion_tokens=10)
+
+    by_command = tracker.summary("command")
+    assert [row["command"] for row in by_command] == ["resolve", "explore", "background"]
+    explore = by_command[1]
+    assert explore["calls"] == 2
+    assert explore["cache_hits"] == 1
+    assert explore["prompt_tokens"] == 100
+    assert explore["avg_latency_ms"] == pytest.approx(101)
+
+    by_guild = {row["guild_id"]: row for row in tracker.summary("guild_id")}
+    assert by_guild["g1"]["completion_tokens"] == 200
+
+def test_flushes_accumulate(tracker):
+    for _ in range(2):
+        with attribute_usage("move", player_id="p1"):
+            tracker.record("gpt-4o", prompt_tokens=1000, completion_tokens=1000)
+        assert tracker.flush() == 1
+    assert tracker.flush() == 0
+
+    row = tracker.summary("player_id")[0]
+    assert row["calls"] == 2
+    assert row["cost"] == pytest.approx(2 * (0.0025 + 0.01))
+
+def test_rejects_unknown_grouping(tracker):
+    with pytest.raises(ValueError):
+        tracker.summary("prompt; DROP TABLE ai_usage")
@@ -0,0 +1,36 @@
+from data.database.db_manager import DatabaseManager
+from data.database.repositories.world_repository import WorldRepository
+from data.models.world import Region
+from services.engine.snapshot import WorldSnapshot, open_snapshot, write_snapshot
+from services.game.world_service import WorldService
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "world.snapshot")
+    regions = {
+        (0, 0): Region("Forest", {}, has_water=True, description="Tall pines"),
+        (2, 1): Region("Desert", {}, has_structure=True),
+        (1, 1): Region("Tundra", {}, has_resources=True, description="Frozen ✶ wastes"),
+    }
+    write_snapshot(regions, path)
+
+    snapshot = WorldSnapshot(path)
+    assert (snapshot.width, snapshot.height) == (3, 2)
+    assert len(snapshot) == 3
+    assert dict(snapshot) == regions
+    assert (1, 0) not in snapshot
+    assert snapshot.get((5, 5)) is None
+    snapshot.close()
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "world.snapshot"
+    path.write_bytes(b"not a snapshot at all")
+    assert open_snapshot(str(path)) is None
+
+def test_world_service_exports_and_maps_snapshot(tmp_path):
+    repository = WorldRepository(DatabaseManager(str(tmp_path / "game.db")))
+    repository.save_regions(repository.build_regions(4, 4, seed=5))
+    path = str(tmp_path / "world.snapshot")
+
+    service = WorldService(repository, narrative_service=None, snapshot_path=path)
+    assert service.get_region_at_location((7, 3)) == repository.load_world()[(1, 0)]
+    assert isinstance(service.current_world, WorldSnapshot)
@@ -0,0 +1,64 @@
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Tuple
+import time
+
+class LatencyStats:
+    """Rolling window of latency samples with percentile summaries."""
+
+    def __init__(self, max_samples: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample, in seconds."""
+        self._samples.append(seconds * 1000)
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the wall time spent inside the block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - started)
+
+    @staticmethod
+    def _pick(ordered: List[float], pct: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+    def percentile(self, pct: float) -> float:
+        """Get a percentile of the recent samples, in milliseconds."""
+        return self._pick(sorted(self._samples), pct)
+
+    def summary(self) -> Dict[str, float]:
+        """Summarise the recent samples, in milliseconds."""
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "p50": self._pick(ordered, 50),
+            "p95": self._pick(ordered, 95),
+            "p99": self._pick(ordered, 99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+class LatencyRegistry:
+    """Named LatencyStats, keyed by a tuple of labels such as (path, command)."""
+
+    def __init__(self, max_samples: int = 1024):
+        self.max_samples = max_samples
+        self._stats: Dict[Tuple[str, ...], LatencyStats] = {}
+
+    def get(self, *labels: str) -> LatencyStats:
+        """Get (creating if needed) the stats for a set of labels."""
+        stats = self._stats.get(labels)
+        if stats is None:
+            stats = self._stats[labels] = LatencyStats(self.max_samples)
+        return stats
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarise every series, keyed by its labels joined with '/'."""
+        return {"/".join(labels): stats.summary() for labels, stats in sorted(self._stats.items())}